@@ -0,0 +1,107 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark community detection on synthetic planted-partition graphs.
+
+Usage:
+    python -m benchmarks.community_detection --sizes 10000 100000
+
+Leiden and Louvain are skipped when the `community` extra is not installed.
+"""
+
+import argparse
+import json
+import random
+from time import perf_counter
+
+from graphiti_core.utils.maintenance.community_operations import (
+    CommunityDetectionMethod,
+    Neighbor,
+    detect_communities,
+)
+
+
+def planted_partition_projection(
+    node_count: int,
+    community_size: int = 50,
+    intra_degree: int = 8,
+    inter_degree: int = 2,
+    seed: int = 42,
+) -> dict[str, list[Neighbor]]:
+    rng = random.Random(seed)
+    uuids = [f'node-{i}' for i in range(node_count)]
+    edge_counts: dict[tuple[int, int], int] = {}
+
+    def add_edge(source: int, target: int):
+        if source == target:
+            return
+        key = (min(source, target), max(source, target))
+        edge_counts[key] = edge_counts.get(key, 0) + 1
+
+    for i in range(node_count):
+        block_start = (i // community_size) * community_size
+        block_end = min(block_start + community_size, node_count)
+        for _ in range(intra_degree // 2):
+            add_edge(i, rng.randrange(block_start, block_end))
+        for _ in range(inter_degree // 2):
+            add_edge(i, rng.randrange(node_count))
+
+    projection: dict[str, list[Neighbor]] = {uuid: [] for uuid in uuids}
+    for (source, target), count in edge_counts.items():
+        projection[uuids[source]].append(Neighbor(node_uuid=uuids[target], edge_count=count))
+        projection[uuids[target]].append(Neighbor(node_uuid=uuids[source], edge_count=count))
+
+    return projection
+
+
+def run(sizes: list[int], repeats: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        projection = planted_partition_projection(size)
+        for method in CommunityDetectionMethod:
+            timings = []
+            clusters: list[list[str]] = []
+            try:
+                for _ in range(repeats):
+                    start = perf_counter()
+                    clusters = detect_communities(projection, method)
+                    timings.append(perf_counter() - start)
+            except ImportError as e:
+                print(f'Skipping {method.value}: {e}')
+                continue
+
+            results.append(
+                {
+                    'nodes': size,
+                    'method': method.value,
+                    'best_ms': min(timings) * 1000,
+                    'mean_ms': sum(timings) / len(timings) * 1000,
+                    'communities': len(clusters),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark community detection methods')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sizes, args.repeats), indent=2))
+
+
+if __name__ == '__main__':
+    main()
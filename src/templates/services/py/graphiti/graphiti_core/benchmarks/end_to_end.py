@@ -0,0 +1,299 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark ingestion and search end to end against an in-memory Kuzu database.
+
+Usage:
+    python -m benchmarks.end_to_end --sizes 20 100 --llm-latency-ms 5 --output results.json
+
+The LLM, embedder and cross-encoder are deterministic fakes from `benchmarks.fakes`, so the
+run is fully offline and two runs of the same commit do the same work. For each synthetic
+graph size the first half of the episodes goes through `add_episode` one at a time and the
+second half through one `add_episode_bulk` call, then every recipe in
+`search_config_recipes` is searched and `build_communities` runs. Each stage reports wall
+time, LLM calls by response model, embedder calls, cross-encoder calls, database round trips
+and peak traced memory.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import tracemalloc
+from collections.abc import Awaitable
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any
+
+from benchmarks.fakes import CountingKuzuDriver, FakeCrossEncoder, FakeEmbedder, FakeLLMClient
+from graphiti_core import Graphiti
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.graph_queries import get_fulltext_indices
+from graphiti_core.nodes import EntityNode, EpisodeType
+from graphiti_core.search import search_config_recipes
+from graphiti_core.search.search_config import SearchConfig
+from graphiti_core.utils.bulk_utils import RawEpisode
+
+# Graphiti reads this when it is constructed, so benchmark runs never send usage events
+os.environ['GRAPHITI_TELEMETRY_ENABLED'] = 'false'
+
+GROUP_ID = 'benchmark'
+SEARCH_QUERIES = 5
+
+
+def synthetic_episodes(count: int, seed: int = 42) -> list[RawEpisode]:
+    """Episodes mentioning people, cities and projects drawn from pools that grow with count."""
+    rng = random.Random(seed)
+    pool_size = max(8, count)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    episodes = []
+    for i in range(count):
+        person_a, person_b = rng.sample(range(pool_size), 2)
+        city = rng.randrange(pool_size // 4 + 1)
+        project = rng.randrange(pool_size // 2 + 1)
+        episodes.append(
+            RawEpisode(
+                name=f'episode-{i}',
+                content=f'Person{person_a} met Person{person_b} in City{city}. '
+                f'They discussed Project{project} and agreed to meet again.',
+                source=EpisodeType.text,
+                source_description='synthetic benchmark episode',
+                reference_time=start + timedelta(hours=i),
+            )
+        )
+    return episodes
+
+
+def search_recipes() -> dict[str, SearchConfig]:
+    return {
+        name: config
+        for name, config in vars(search_config_recipes).items()
+        if isinstance(config, SearchConfig)
+    }
+
+
+class StageRecorder:
+    def __init__(
+        self,
+        driver: CountingKuzuDriver,
+        llm_client: FakeLLMClient,
+        embedder: FakeEmbedder,
+        cross_encoder: FakeCrossEncoder,
+        trace_memory: bool,
+    ):
+        self.driver = driver
+        self.llm_client = llm_client
+        self.embedder = embedder
+        self.cross_encoder = cross_encoder
+        self.trace_memory = trace_memory
+        self.stages: list[dict[str, Any]] = []
+
+    async def measure(self, stage: str, work: Awaitable[Any]) -> Any:
+        llm_calls = self.llm_client.calls.copy()
+        embedder_calls = self.embedder.calls
+        embedder_inputs = self.embedder.inputs
+        rerank_calls = self.cross_encoder.calls
+        db_queries = self.driver.queries
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        start = perf_counter()
+        result = await work
+        wall_ms = (perf_counter() - start) * 1000
+
+        llm_calls_by_model = dict(sorted((self.llm_client.calls - llm_calls).items()))
+        self.stages.append(
+            {
+                'stage': stage,
+                'wall_ms': round(wall_ms, 3),
+                'llm_calls': sum(llm_calls_by_model.values()),
+                'llm_calls_by_model': llm_calls_by_model,
+                'embedder_calls': self.embedder.calls - embedder_calls,
+                'embedded_inputs': self.embedder.inputs - embedder_inputs,
+                'rerank_calls': self.cross_encoder.calls - rerank_calls,
+                'db_queries': self.driver.queries - db_queries,
+                'peak_memory_mb': (
+                    round(tracemalloc.get_traced_memory()[1] / 2**20, 3)
+                    if self.trace_memory
+                    else None
+                ),
+            }
+        )
+        return result
+
+
+async def run_size(
+    episode_count: int,
+    llm_latency: float,
+    embedder_latency: float,
+    reranker_latency: float,
+    trace_memory: bool,
+) -> dict[str, Any]:
+    driver = CountingKuzuDriver()
+    # The Kuzu driver creates its schema but not the full-text indexes search relies on
+    for query in get_fulltext_indices(GraphProvider.KUZU):
+        await driver.execute_query(query)
+
+    llm_client = FakeLLMClient(llm_latency)
+    embedder = FakeEmbedder(embedder_latency)
+    cross_encoder = FakeCrossEncoder(reranker_latency)
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=llm_client,
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+    )
+    recorder = StageRecorder(driver, llm_client, embedder, cross_encoder, trace_memory)
+
+    episodes = synthetic_episodes(episode_count)
+    sequential, bulk = episodes[: episode_count // 2], episodes[episode_count // 2 :]
+
+    async def add_episodes():
+        for episode in sequential:
+            await graphiti.add_episode(
+                name=episode.name,
+                episode_body=episode.content,
+                source_description=episode.source_description,
+                reference_time=episode.reference_time,
+                source=episode.source,
+                group_id=GROUP_ID,
+            )
+
+    await recorder.measure('add_episode', add_episodes())
+    if bulk:
+        await recorder.measure('add_episode_bulk', graphiti.add_episode_bulk(bulk, GROUP_ID))
+
+    entities = await EntityNode.get_by_group_ids(driver, [GROUP_ID])
+    center_node_uuid = entities[0].uuid if entities else None
+    queries = [episode.content.split('.')[0] for episode in episodes[:SEARCH_QUERIES]]
+
+    async def search(config: SearchConfig):
+        for query in queries:
+            await graphiti.search_(
+                query,
+                config=config,
+                group_ids=[GROUP_ID],
+                center_node_uuid=center_node_uuid,
+            )
+
+    for name, config in search_recipes().items():
+        await recorder.measure(f'search.{name}', search(config))
+
+    communities, _ = await recorder.measure(
+        'build_communities', graphiti.build_communities([GROUP_ID])
+    )
+
+    await graphiti.close()
+
+    return {
+        'episodes': episode_count,
+        'entities': len(entities),
+        'communities': len(communities),
+        'stages': recorder.stages,
+    }
+
+
+def current_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(
+    sizes: list[int],
+    llm_latency_ms: float,
+    embedder_latency_ms: float,
+    reranker_latency_ms: float,
+    trace_memory: bool,
+) -> dict[str, Any]:
+    if trace_memory:
+        tracemalloc.start()
+
+    results = []
+    try:
+        for size in sizes:
+            results.append(
+                await run_size(
+                    size,
+                    llm_latency_ms / 1000,
+                    embedder_latency_ms / 1000,
+                    reranker_latency_ms / 1000,
+                    trace_memory,
+                )
+            )
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {
+        'commit': current_commit(),
+        'python': platform.python_version(),
+        'config': {
+            'sizes': sizes,
+            'llm_latency_ms': llm_latency_ms,
+            'embedder_latency_ms': embedder_latency_ms,
+            'reranker_latency_ms': reranker_latency_ms,
+            'search_queries': SEARCH_QUERIES,
+            'trace_memory': trace_memory,
+        },
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ingestion and search offline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 100])
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0)
+    parser.add_argument('--embedder-latency-ms', type=float, default=0.0)
+    parser.add_argument('--reranker-latency-ms', type=float, default=0.0)
+    parser.add_argument(
+        '--no-trace-memory',
+        action='store_true',
+        help='Skip tracemalloc, which slows every stage down, and report no peak memory',
+    )
+    parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run(
+            args.sizes,
+            args.llm_latency_ms,
+            args.embedder_latency_ms,
+            args.reranker_latency_ms,
+            not args.no_trace_memory,
+        )
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
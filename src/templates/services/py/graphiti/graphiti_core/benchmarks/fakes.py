@@ -0,0 +1,261 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Deterministic offline stand-ins for the LLM, embedder, cross-encoder and driver used by the
+benchmarks. Every client sleeps for a configurable latency and counts its calls.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import re
+import typing
+from collections import Counter
+from typing import Any
+
+from pydantic import BaseModel
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.kuzu_driver import KuzuDriver
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig, ModelSize
+from graphiti_core.prompts.models import Message
+
+ENTITY_NAME_PATTERN = re.compile(r'\b(?:Person|City|Project)\d+\b')
+FAKE_EMBEDDING_DIM = 64
+
+
+def tagged_section(text: str, tag: str) -> str:
+    """Return the content of the last <tag>...</tag> block in text, or an empty string."""
+    start = text.rfind(f'<{tag}>')
+    if start == -1:
+        return ''
+    start += len(tag) + 2
+    end = text.find(f'</{tag}>', start)
+    return text[start:end] if end != -1 else text[start:]
+
+
+def tagged_json(text: str, tag: str) -> Any:
+    section = tagged_section(text, tag).strip()
+    if not section:
+        return []
+    try:
+        return json.loads(section)
+    except json.JSONDecodeError:
+        return []
+
+
+def default_response(response_model: type[BaseModel]) -> dict[str, Any]:
+    """Fill every required field of response_model with an empty value of its type."""
+    response: dict[str, Any] = {}
+    for name, field in response_model.model_fields.items():
+        if not field.is_required():
+            continue
+        response[name] = _default_value(field.annotation)
+    return response
+
+
+def _default_value(annotation: Any) -> Any:
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        return []
+    if origin is dict:
+        return {}
+    if origin is not None:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _default_value(args[0]) if args else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return default_response(annotation)
+    if annotation is str:
+        return 'Synthetic summary.'
+    if annotation is int:
+        return -1
+    if annotation is float:
+        return 0.0
+    if annotation is bool:
+        return False
+    return None
+
+
+class FakeLLMClient(LLMClient):
+    """
+    Answers every graphiti prompt from the prompt text alone.
+
+    Entities are the Person/City/Project names in the episode, facts link consecutive
+    entities, and entities or facts with identical names are reported as duplicates. Other
+    prompts get an empty response of the requested shape.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(LLMConfig(), cache=False)
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+
+    async def _generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = 0,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> dict[str, Any]:
+        name = response_model.__name__ if response_model is not None else 'text'
+        self.calls[name] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        text = messages[-1].content
+        if name == 'ExtractedEntities':
+            return self._extract_entities(text)
+        if name == 'ExtractedEdges':
+            return self._extract_edges(text)
+        if name == 'NodeResolutions':
+            return self._resolve_nodes(text)
+        if name == 'EdgeResolutions':
+            new_edges = tagged_json(text, 'NEW FACTS')
+            return {
+                'edge_resolutions': [
+                    {
+                        'id': edge['id'],
+                        'duplicate_facts': [],
+                        'contradicted_facts': [],
+                        'fact_type': 'DEFAULT',
+                    }
+                    for edge in new_edges
+                ]
+            }
+        if name == 'EdgeDuplicate':
+            return {'duplicate_facts': [], 'contradicted_facts': [], 'fact_type': 'DEFAULT'}
+        if response_model is None:
+            return {'content': ''}
+        return default_response(response_model)
+
+    def _extract_entities(self, text: str) -> dict[str, Any]:
+        content = (
+            tagged_section(text, 'TEXT')
+            or tagged_section(text, 'CURRENT MESSAGE')
+            or tagged_section(text, 'JSON')
+        )
+        names = list(dict.fromkeys(ENTITY_NAME_PATTERN.findall(content)))
+        return {'extracted_entities': [{'name': name, 'entity_type_id': 0} for name in names]}
+
+    def _extract_edges(self, text: str) -> dict[str, Any]:
+        nodes = tagged_json(text, 'ENTITIES')
+        return {
+            'edges': [
+                {
+                    'relation_type': 'ASSOCIATED_WITH',
+                    'source_entity_id': source['id'],
+                    'target_entity_id': target['id'],
+                    'fact': f'{source["name"]} is associated with {target["name"]}',
+                }
+                for source, target in zip(nodes, nodes[1:], strict=False)
+            ]
+        }
+
+    def _resolve_nodes(self, text: str) -> dict[str, Any]:
+        extracted = tagged_json(text, 'ENTITIES')
+        existing = tagged_json(text, 'EXISTING ENTITIES')
+        existing_idx = {node['name']: node['idx'] for node in existing}
+        return {
+            'entity_resolutions': [
+                {
+                    'id': node['id'],
+                    'name': node['name'],
+                    'duplicate_idx': existing_idx.get(node['name'], -1),
+                    'duplicates': [existing_idx[node['name']]]
+                    if node['name'] in existing_idx
+                    else [],
+                }
+                for node in extracted
+            ]
+        }
+
+
+class FakeEmbedder(EmbedderClient):
+    """Hashes tokens into a normalized bag-of-words vector, so similar texts embed nearby."""
+
+    def __init__(self, latency: float = 0.0, embedding_dim: int = FAKE_EMBEDDING_DIM):
+        self.latency = latency
+        self.embedding_dim = embedding_dim
+        self.calls = 0
+        self.inputs = 0
+
+    def embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.embedding_dim
+        for token in re.findall(r'\w+', text.lower()):
+            bucket = int(hashlib.md5(token.encode()).hexdigest(), 16) % self.embedding_dim
+            vector[bucket] += 1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    async def create(self, input_data: Any) -> list[float]:
+        self.calls += 1
+        self.inputs += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.embed(input_data if isinstance(input_data, str) else str(input_data))
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.inputs += len(input_data_list)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [self.embed(text) for text in input_data_list]
+
+
+class FakeCrossEncoder(CrossEncoderClient):
+    """Scores passages by the fraction of query tokens they contain."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.passages = 0
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        self.calls += 1
+        self.passages += len(passages)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        query_tokens = set(re.findall(r'\w+', query.lower()))
+        results = [
+            (
+                passage,
+                len(query_tokens & set(re.findall(r'\w+', passage.lower())))
+                / max(len(query_tokens), 1),
+            )
+            for passage in passages
+        ]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+
+class CountingKuzuDriver(KuzuDriver):
+    """KuzuDriver that counts round trips to the database."""
+
+    def __init__(
+        self,
+        db: str = ':memory:',
+        max_concurrent_queries: int = 1,
+        max_concurrent_reads: int | None = None,
+    ):
+        super().__init__(db, max_concurrent_queries, max_concurrent_reads)
+        self.queries = 0
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        self.queries += 1
+        return await super().execute_query(cypher_query_, **kwargs)
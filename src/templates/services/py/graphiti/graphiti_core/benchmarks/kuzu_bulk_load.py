@@ -0,0 +1,176 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark Kuzu bulk saves with COPY FROM against one MERGE per row.
+
+Usage:
+    python -m benchmarks.kuzu_bulk_load --sizes 10000 100000
+
+Each size is the total number of rows in one add_nodes_and_edges_bulk call, split between
+episodes, entities, entity edges and mentions. Every batch is saved twice into a fresh in-memory
+database: the first save inserts it and the second updates every row in place. Each run is
+repeated with the full-text indexes search needs, since Kuzu writes differently to indexed
+tables. The per-row path is skipped above --max-per-row-rows since it grows too slow to be
+worth waiting for.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.kuzu_driver import KuzuDriver
+from graphiti_core.edges import EntityEdge, EpisodicEdge
+from graphiti_core.graph_queries import get_fulltext_indices
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.utils import bulk_utils
+from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+
+GROUP_ID = 'benchmark'
+
+
+def synthetic_batch(
+    rows: int, embedding_dim: int, seed: int = 42
+) -> tuple[list[EpisodicNode], list[EpisodicEdge], list[EntityNode], list[EntityEdge]]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def embedding() -> list[float]:
+        return [rng.random() for _ in range(embedding_dim)]
+
+    episode_count = max(rows // 20, 1)
+    entity_count = max(rows * 3 // 10, 2)
+    edge_count = rows * 7 // 20
+    mention_count = max(rows - episode_count - entity_count - edge_count, 0)
+
+    episodes = [
+        EpisodicNode(
+            name=f'Episode {i}',
+            group_id=GROUP_ID,
+            source=EpisodeType.text,
+            source_description='benchmark',
+            content=f'Episode {i} says "hello", again,\nand again.',
+            created_at=start,
+            valid_at=start + timedelta(minutes=i),
+        )
+        for i in range(episode_count)
+    ]
+    nodes = [
+        EntityNode(
+            name=f'Entity {i}',
+            group_id=GROUP_ID,
+            labels=['Entity', 'Person'] if i % 2 else ['Entity'],
+            summary=f'Entity {i} is part of the benchmark.' if i % 3 else '',
+            created_at=start,
+            name_embedding=embedding(),
+            attributes={'index': i},
+        )
+        for i in range(entity_count)
+    ]
+    edges = [
+        EntityEdge(
+            source_node_uuid=nodes[rng.randrange(entity_count)].uuid,
+            target_node_uuid=nodes[rng.randrange(entity_count)].uuid,
+            name='KNOWS',
+            fact=f'Fact {i}, with a comma and a "quote".',
+            group_id=GROUP_ID,
+            episodes=[episodes[i % episode_count].uuid],
+            created_at=start,
+            valid_at=start if i % 2 else None,
+            fact_embedding=embedding(),
+        )
+        for i in range(edge_count)
+    ]
+    mentions = [
+        EpisodicEdge(
+            source_node_uuid=episodes[i % episode_count].uuid,
+            target_node_uuid=nodes[rng.randrange(entity_count)].uuid,
+            group_id=GROUP_ID,
+            created_at=start,
+        )
+        for i in range(mention_count)
+    ]
+    return episodes, mentions, nodes, edges
+
+
+async def count_rows(driver: KuzuDriver) -> dict[str, int]:
+    counts = {}
+    for label, query in (
+        ('episodes', 'MATCH (n:Episodic) RETURN count(n) AS count'),
+        ('entities', 'MATCH (n:Entity) RETURN count(n) AS count'),
+        ('entity_edges', 'MATCH (n:RelatesToNode_) RETURN count(n) AS count'),
+        ('mentions', 'MATCH ()-[e:MENTIONS]->() RETURN count(e) AS count'),
+    ):
+        records, _, _ = await driver.execute_query(query)
+        counts[label] = records[0]['count']
+    return counts
+
+
+async def run_size(rows: int, mode: str, fts: bool, embedding_dim: int) -> dict:
+    episodes, mentions, nodes, edges = synthetic_batch(rows, embedding_dim)
+    # Route the batch through the path under test regardless of its size
+    bulk_utils.KUZU_BULK_COPY_THRESHOLD = 0 if mode == 'copy' else rows + 1
+
+    driver = KuzuDriver()
+    if fts:
+        for query in get_fulltext_indices(GraphProvider.KUZU):
+            await driver.execute_query(query)
+    timings = {}
+    for stage in ('insert', 'update'):
+        start = perf_counter()
+        await add_nodes_and_edges_bulk(driver, episodes, mentions, nodes, edges, embedder=None)  # type: ignore[arg-type]
+        timings[f'{stage}_ms'] = (perf_counter() - start) * 1000
+
+    return {
+        'rows': rows,
+        'mode': mode,
+        'fts': fts,
+        **timings,
+        'rows_per_second': rows / timings['insert_ms'] * 1000,
+        'stored': await count_rows(driver),
+    }
+
+
+async def run(sizes: list[int], max_per_row_rows: int, embedding_dim: int) -> list[dict]:
+    results = []
+    for rows in sizes:
+        for mode in ('copy', 'per_row'):
+            if mode == 'per_row' and rows > max_per_row_rows:
+                print(f'Skipping per_row at {rows} rows')
+                continue
+            for fts in (False, True):
+                results.append(await run_size(rows, mode, fts, embedding_dim))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Kuzu bulk loading')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--max-per-row-rows', type=int, default=10_000)
+    parser.add_argument('--embedding-dim', type=int, default=256)
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            asyncio.run(run(args.sizes, args.max_per_row_rows, args.embedding_dim)), indent=2
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
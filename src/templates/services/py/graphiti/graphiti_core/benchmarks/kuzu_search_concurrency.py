@@ -0,0 +1,126 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark concurrent searches against KuzuDriver with different read pool sizes.
+
+Usage:
+    python -m benchmarks.kuzu_search_concurrency --rows 10000 --concurrency 1 8 32
+
+A synthetic graph from `benchmarks.kuzu_bulk_load` is loaded once per read pool size, then
+--searches hybrid searches run with at most --concurrency in flight at a time. Each search
+already fans out to edge, node, episode and community searches in parallel, so a read pool of
+one serializes work that a larger pool runs side by side. The embedder and cross-encoder are
+the offline fakes from `benchmarks.fakes`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from statistics import median, quantiles
+from time import perf_counter
+from typing import Any
+
+from benchmarks.fakes import FAKE_EMBEDDING_DIM, FakeCrossEncoder, FakeEmbedder, FakeLLMClient
+from benchmarks.kuzu_bulk_load import GROUP_ID, synthetic_batch
+from graphiti_core import Graphiti
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.kuzu_driver import KuzuDriver
+from graphiti_core.graph_queries import get_fulltext_indices
+from graphiti_core.search.search_config_recipes import COMBINED_HYBRID_SEARCH_RRF
+from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+
+# Graphiti reads this when it is constructed, so benchmark runs never send usage events
+os.environ['GRAPHITI_TELEMETRY_ENABLED'] = 'false'
+
+
+async def load_graph(rows: int, max_concurrent_reads: int) -> KuzuDriver:
+    driver = KuzuDriver(max_concurrent_reads=max_concurrent_reads)
+    for query in get_fulltext_indices(GraphProvider.KUZU):
+        await driver.execute_query(query)
+
+    episodes, mentions, nodes, edges = synthetic_batch(rows, FAKE_EMBEDDING_DIM)
+    await add_nodes_and_edges_bulk(driver, episodes, mentions, nodes, edges, embedder=None)  # type: ignore[arg-type]
+    return driver
+
+
+async def run_pool(
+    rows: int, max_concurrent_reads: int, concurrency: list[int], searches: int
+) -> list[dict[str, Any]]:
+    driver = await load_graph(rows, max_concurrent_reads)
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=FakeLLMClient(),
+        embedder=FakeEmbedder(),
+        cross_encoder=FakeCrossEncoder(),
+    )
+    queries = [f'Entity {i} fact' for i in range(searches)]
+
+    async def timed_search(query: str, semaphore: asyncio.Semaphore, latencies: list[float]):
+        async with semaphore:
+            start = perf_counter()
+            await graphiti.search_(query, config=COMBINED_HYBRID_SEARCH_RRF, group_ids=[GROUP_ID])
+            latencies.append((perf_counter() - start) * 1000)
+
+    results = []
+    for in_flight in concurrency:
+        semaphore = asyncio.Semaphore(in_flight)
+        latencies: list[float] = []
+
+        start = perf_counter()
+        await asyncio.gather(*(timed_search(query, semaphore, latencies) for query in queries))
+        elapsed = perf_counter() - start
+
+        results.append(
+            {
+                'rows': rows,
+                'read_connections': max_concurrent_reads,
+                'concurrency': in_flight,
+                'searches': searches,
+                'searches_per_second': round(searches / elapsed, 2),
+                'p50_ms': round(median(latencies), 3),
+                'p95_ms': round(quantiles(latencies, n=20)[-1], 3),
+            }
+        )
+    return results
+
+
+async def run(
+    rows: int, read_pools: list[int], concurrency: list[int], searches: int
+) -> list[dict[str, Any]]:
+    results = []
+    for max_concurrent_reads in read_pools:
+        results.extend(await run_pool(rows, max_concurrent_reads, concurrency, searches))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent Kuzu searches')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--read-pools', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--searches', type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            asyncio.run(run(args.rows, args.read_pools, args.concurrency, args.searches)),
+            indent=2,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
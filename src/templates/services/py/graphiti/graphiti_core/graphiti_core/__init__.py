@@ -1,3 +1,4 @@
 from .graphiti import Graphiti
+from .ingestion_scheduler import IngestionScheduler
 
-__all__ = ['Graphiti']
+__all__ = ['Graphiti', 'IngestionScheduler']
@@ -15,8 +15,15 @@ limitations under the License.
 """
 
 import asyncio
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
 from typing import TYPE_CHECKING
 
+from pydantic import BaseModel, ConfigDict
+
 if TYPE_CHECKING:
     from sentence_transformers import CrossEncoder
 else:
@@ -30,20 +37,90 @@ else:
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 
+logger = logging.getLogger(__name__)
+
+BGE_RERANK_MAX_BATCH_SIZE = int(os.getenv('BGE_RERANK_MAX_BATCH_SIZE', 64))
+BGE_RERANK_MAX_WAIT_MS = float(os.getenv('BGE_RERANK_MAX_WAIT_MS', 5))
+BGE_RERANK_WORKERS = int(os.getenv('BGE_RERANK_WORKERS', 1))
+
+
+class RerankBatchMetrics(BaseModel):
+    batches: int
+    requests: int
+    pairs: int
+    mean_batch_size: float
+    max_batch_size: int
+    mean_queue_wait_ms: float
+    max_queue_wait_ms: float
+    queue_depth: int
+
+
+class _RerankRequest(BaseModel):
+    pairs: list[list[str]]
+    future: asyncio.Future
+    enqueued_at: float
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
 
 class BGERerankerClient(CrossEncoderClient):
-    def __init__(self):
+    """
+    Cross-encoder reranker backed by a local BAAI/bge-reranker-v2-m3 model.
+
+    Concurrent rank calls are coalesced by a single inference worker: pending (query, passage)
+    pairs are predicted together once max_batch_size pairs are queued or the oldest request has
+    waited max_wait_ms. Batches run on a dedicated pool of max_workers threads, so reranking
+    never competes with other work on the default executor.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = BGE_RERANK_MAX_BATCH_SIZE,
+        max_wait_ms: float = BGE_RERANK_MAX_WAIT_MS,
+        max_workers: int = BGE_RERANK_WORKERS,
+    ):
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+
         self.model = CrossEncoder('BAAI/bge-reranker-v2-m3')
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_workers = max_workers
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='bge-reranker'
+        )
+        self._pending: deque[_RerankRequest] = deque()
+        self._pending_pairs = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task | None = None
+
+        self._batches = 0
+        self._requests = 0
+        self._pairs = 0
+        self._max_batch_size = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
 
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         if not passages:
             return []
 
-        input_pairs = [[query, passage] for passage in passages]
+        self._ensure_worker()
+        request = _RerankRequest(
+            pairs=[[query, passage] for passage in passages],
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=monotonic(),
+        )
+        self._pending.append(request)
+        self._pending_pairs += len(request.pairs)
+        if self._wakeup is not None:
+            self._wakeup.set()
 
-        # Run the synchronous predict method in an executor
-        loop = asyncio.get_running_loop()
-        scores = await loop.run_in_executor(None, self.model.predict, input_pairs)
+        scores = await request.future
 
         ranked_passages = sorted(
             [(passage, float(score)) for passage, score in zip(passages, scores, strict=False)],
@@ -52,3 +129,133 @@ class BGERerankerClient(CrossEncoderClient):
         )
 
         return ranked_passages
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+
+        # Requests queued on a previous event loop can never be answered there
+        for request in self._pending:
+            if not request.future.done():
+                request.future.cancel()
+        self._pending.clear()
+        self._pending_pairs = 0
+
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._worker = loop.create_task(self._run(self._wakeup))
+
+    async def _run(self, wakeup: asyncio.Event):
+        slots = asyncio.Semaphore(self.max_workers)
+        batches: dict[asyncio.Task, list[_RerankRequest]] = {}
+        try:
+            while True:
+                # Requests keep accumulating while every thread is busy, so batches grow with load
+                await slots.acquire()
+                while not self._pending:
+                    wakeup.clear()
+                    await wakeup.wait()
+
+                deadline = self._pending[0].enqueued_at + self.max_wait
+                while self._pending_pairs < self.max_batch_size:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    wakeup.clear()
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                batch = self._take_batch()
+                task = asyncio.create_task(self._predict(batch))
+                batches[task] = batch
+                task.add_done_callback(lambda done: batches.pop(done, None))
+                task.add_done_callback(lambda _: slots.release())
+        finally:
+            for task, batch in list(batches.items()):
+                task.cancel()
+                # A batch cancelled mid-prediction, or before it started, never answers its callers
+                for request in batch:
+                    if not request.future.done():
+                        request.future.cancel()
+
+    def _take_batch(self) -> list[_RerankRequest]:
+        now = monotonic()
+        batch: list[_RerankRequest] = []
+        batch_pairs = 0
+        while self._pending and (not batch or batch_pairs < self.max_batch_size):
+            request = self._pending.popleft()
+            self._pending_pairs -= len(request.pairs)
+            if request.future.done():
+                continue
+
+            batch.append(request)
+            batch_pairs += len(request.pairs)
+
+            queue_wait = now - request.enqueued_at
+            self._queue_wait_total += queue_wait
+            self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+
+        if not batch:
+            return batch
+
+        self._batches += 1
+        self._requests += len(batch)
+        self._pairs += batch_pairs
+        self._max_batch_size = max(self._max_batch_size, batch_pairs)
+
+        return batch
+
+    async def _predict(self, batch: list[_RerankRequest]):
+        if not batch:
+            return
+
+        pairs = [pair for request in batch for pair in request.pairs]
+        try:
+            loop = asyncio.get_running_loop()
+            scores = await loop.run_in_executor(self._executor, self.model.predict, pairs)
+        except Exception as e:
+            logger.error(f'Error in BGE reranker batch of {len(pairs)} pairs: {e}')
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            request_scores = scores[offset : offset + len(request.pairs)]
+            offset += len(request.pairs)
+            if not request.future.done():
+                request.future.set_result(request_scores)
+
+    def metrics(self) -> RerankBatchMetrics:
+        """Return batch sizes and queue waits since the client was created."""
+        return RerankBatchMetrics(
+            batches=self._batches,
+            requests=self._requests,
+            pairs=self._pairs,
+            mean_batch_size=self._pairs / self._batches if self._batches else 0.0,
+            max_batch_size=self._max_batch_size,
+            mean_queue_wait_ms=(
+                self._queue_wait_total / self._requests * 1000 if self._requests else 0.0
+            ),
+            max_queue_wait_ms=self._queue_wait_max * 1000,
+            queue_depth=self._pending_pairs,
+        )
+
+    async def close(self):
+        """Stop the inference worker and shut down its thread pool."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        for request in self._pending:
+            if not request.future.done():
+                request.future.cancel()
+        self._pending.clear()
+        self._pending_pairs = 0
+
+        self._executor.shutdown(wait=False)
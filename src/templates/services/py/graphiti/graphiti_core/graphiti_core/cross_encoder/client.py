@@ -14,7 +14,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+from ..helpers import LRUCache, semaphore_gather
+from ..prompts.prompt_helpers import to_prompt_json
+
+logger = logging.getLogger(__name__)
+
+RERANK_CACHE_SIZE = int(os.getenv('RERANK_CACHE_SIZE', 4096))
 
 
 class CrossEncoderClient(ABC):
@@ -38,3 +52,139 @@ class CrossEncoderClient(ABC):
                                      sorted in descending order of relevance.
         """
         pass
+
+
+class RerankScoreCache(LRUCache[tuple[str, str], float]):
+    """
+    In-memory LRU of relevance scores keyed by (query hash, passage hash).
+
+    Repeated queries over passages that have already been scored skip the model entirely.
+    """
+
+    def __init__(self, max_size: int = RERANK_CACHE_SIZE):
+        super().__init__(max_size)
+
+    @staticmethod
+    def key(query: str, passage: str) -> tuple[str, str]:
+        return (
+            hashlib.sha256(query.encode()).hexdigest(),
+            hashlib.sha256(passage.encode()).hexdigest(),
+        )
+
+
+async def rank_passages(
+    query: str,
+    passages: list[str],
+    score_passages: Callable[[str, list[str]], Awaitable[list[float]]],
+    cache: RerankScoreCache | None = None,
+    timeout: float | None = None,
+) -> list[tuple[str, float]]:
+    """
+    Rank passages with score_passages, scoring only the passages missing from cache.
+
+    If scoring takes longer than timeout seconds, the passages are returned in the order they
+    were given with reciprocal-rank scores, so callers that pass a preliminary ranking (such as
+    RRF) get that ranking back instead of waiting.
+    """
+    if not passages:
+        return []
+
+    scores: dict[str, float] = {}
+    if cache is not None:
+        for passage in passages:
+            score = cache.get(cache.key(query, passage))
+            if score is not None:
+                scores[passage] = score
+
+    unscored = list(dict.fromkeys(passage for passage in passages if passage not in scores))
+    if unscored:
+        try:
+            new_scores = await asyncio.wait_for(score_passages(query, unscored), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f'Reranking {len(unscored)} passages exceeded {timeout}s, keeping the input order'
+            )
+            return [(passage, 1 / (rank + 1)) for rank, passage in enumerate(passages)]
+
+        for passage, score in zip(unscored, new_scores, strict=True):
+            scores[passage] = score
+            if cache is not None:
+                cache.set(cache.key(query, passage), score)
+
+    results = [(passage, scores[passage]) for passage in passages]
+    results.sort(reverse=True, key=lambda x: x[1])
+    return results
+
+
+async def score_listwise(
+    query: str,
+    passages: list[str],
+    batch_size: int,
+    score_batch: Callable[[str, list[str]], Coroutine[Any, Any, list[float | None]]],
+    score_pointwise: Callable[[str, list[str]], Awaitable[list[float]]],
+) -> list[float]:
+    """
+    Score passages batch_size at a time with score_batch.
+
+    Passages a batch response leaves unscored are scored one by one with score_pointwise.
+    """
+    batch_scores: list[list[float | None]] = await semaphore_gather(
+        *[
+            score_batch(query, passages[i : i + batch_size])
+            for i in range(0, len(passages), batch_size)
+        ]
+    )
+    scores = [score for batch in batch_scores for score in batch]
+
+    unscored = [i for i, score in enumerate(scores) if score is None]
+    if unscored:
+        logger.warning(
+            f'Listwise rerank left {len(unscored)} passages unscored, scoring them one by one'
+        )
+        pointwise_scores = await score_pointwise(query, [passages[i] for i in unscored])
+        for i, score in zip(unscored, pointwise_scores, strict=True):
+            scores[i] = score
+
+    return [score if score is not None else 0.0 for score in scores]
+
+
+def listwise_rank_prompt(query: str, passages: list[str]) -> str:
+    """Build a prompt asking for a 0-100 relevance score for every passage in one response."""
+    return f"""Rate how relevant each passage in PASSAGES is to QUERY on a scale from 0 to 100.
+
+Respond with a JSON object of the form {{"scores": [{{"id": <passage id>, "score": <0-100>}}, ...]}}
+with exactly one entry for each of the {len(passages)} passages, ids 0 through {len(passages) - 1}.
+
+<QUERY>
+{query}
+</QUERY>
+
+<PASSAGES>
+{to_prompt_json([{'id': i, 'passage': passage} for i, passage in enumerate(passages)])}
+</PASSAGES>
+"""
+
+
+def parse_listwise_scores(text: str, passage_count: int) -> list[float | None]:
+    """
+    Parse a listwise_rank_prompt response into scores normalized to [0, 1].
+
+    Passages the response does not score, or scores that cannot be parsed, are None.
+    """
+    scores: list[float | None] = [None] * passage_count
+    try:
+        entries = json.loads(text).get('scores', [])
+    except (json.JSONDecodeError, AttributeError) as e:
+        logger.warning(f'Could not parse listwise rerank response: {e}')
+        return scores
+
+    for entry in entries:
+        try:
+            passage_id = int(entry['id'])
+            score = float(entry['score'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= passage_id < passage_count and scores[passage_id] is None:
+            scores[passage_id] = max(0.0, min(1.0, score / 100.0))
+
+    return scores
@@ -20,7 +20,15 @@ from typing import TYPE_CHECKING
 
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, RateLimitError
-from .client import CrossEncoderClient
+from .client import (
+    RERANK_CACHE_SIZE,
+    CrossEncoderClient,
+    RerankScoreCache,
+    listwise_rank_prompt,
+    parse_listwise_scores,
+    rank_passages,
+    score_listwise,
+)
 
 if TYPE_CHECKING:
     from google import genai
@@ -49,20 +57,29 @@ class GeminiRerankerClient(CrossEncoderClient):
         self,
         config: LLMConfig | None = None,
         client: 'genai.Client | None' = None,
+        listwise_batch_size: int | None = None,
+        cache_size: int = RERANK_CACHE_SIZE,
+        rank_timeout: float | None = None,
     ):
         """
         Initialize the GeminiRerankerClient with the provided configuration and client.
 
         The Gemini Developer API does not yet support logprobs. Unlike the OpenAI reranker,
         this reranker uses the Gemini API to perform direct relevance scoring of passages.
-        Each passage is scored individually on a 0-100 scale.
+        Each passage is scored individually on a 0-100 scale, or with listwise_batch_size set,
+        up to that many passages are scored in a single request.
 
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (genai.Client | None): An optional async client instance to use. If not provided, a new genai.Client is created.
+            listwise_batch_size (int | None): Number of passages scored per listwise request. None scores each passage with its own request.
+            cache_size (int): Number of (query, passage) scores kept in the LRU cache. 0 disables the cache.
+            rank_timeout (float | None): Seconds a rank call may take before falling back to the input order.
         """
         if config is None:
             config = LLMConfig()
+        if listwise_batch_size is not None and listwise_batch_size < 1:
+            raise ValueError('listwise_batch_size must be at least 1')
 
         self.config = config
         if client is None:
@@ -70,15 +87,69 @@ class GeminiRerankerClient(CrossEncoderClient):
         else:
             self.client = client
 
+        self.listwise_batch_size = listwise_batch_size
+        self.score_cache = RerankScoreCache(cache_size) if cache_size > 0 else None
+        self.rank_timeout = rank_timeout
+
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         """
         Rank passages based on their relevance to the query using direct scoring.
 
-        Each passage is scored individually on a 0-100 scale, then normalized to [0,1].
+        Each passage is scored on a 0-100 scale, then normalized to [0,1]. Scores are cached per
+        (query, passage), and if rank_timeout elapses the passages are returned in input order.
         """
         if len(passages) <= 1:
             return [(passage, 1.0) for passage in passages]
 
+        return await rank_passages(
+            query, passages, self._score_passages, self.score_cache, self.rank_timeout
+        )
+
+    async def _score_passages(self, query: str, passages: list[str]) -> list[float]:
+        try:
+            if self.listwise_batch_size is None:
+                return await self._score_pointwise(query, passages)
+
+            return await score_listwise(
+                query,
+                passages,
+                self.listwise_batch_size,
+                self._score_listwise,
+                self._score_pointwise,
+            )
+        except Exception as e:
+            # Check if it's a rate limit error based on Gemini API error codes
+            error_message = str(e).lower()
+            if (
+                'rate limit' in error_message
+                or 'quota' in error_message
+                or 'resource_exhausted' in error_message
+                or '429' in str(e)
+            ):
+                raise RateLimitError from e
+
+            logger.error(f'Error in generating LLM response: {e}')
+            raise
+
+    async def _score_listwise(self, query: str, passages: list[str]) -> list[float | None]:
+        response = await self.client.aio.models.generate_content(
+            model=self.config.model or DEFAULT_MODEL,
+            contents=[
+                types.Content(
+                    role='user',
+                    parts=[types.Part.from_text(text=listwise_rank_prompt(query, passages))],
+                ),
+            ],  # type: ignore
+            config=types.GenerateContentConfig(
+                system_instruction='You are an expert at rating passage relevance. Respond with only the requested JSON.',
+                temperature=0.0,
+                response_mime_type='application/json',
+            ),
+        )
+
+        return parse_listwise_scores(response.text or '', len(passages))
+
+    async def _score_pointwise(self, query: str, passages: list[str]) -> list[float]:
         # Generate scoring prompts for each passage
         scoring_prompts = []
         for passage in passages:
@@ -99,63 +170,45 @@ Provide only a number between 0 and 100 (no explanation, just the number):"""
                 ]
             )
 
-        try:
-            # Execute all scoring requests concurrently - O(n) API calls
-            responses = await semaphore_gather(
-                *[
-                    self.client.aio.models.generate_content(
-                        model=self.config.model or DEFAULT_MODEL,
-                        contents=prompt_messages,  # type: ignore
-                        config=types.GenerateContentConfig(
-                            system_instruction='You are an expert at rating passage relevance. Respond with only a number from 0-100.',
-                            temperature=0.0,
-                            max_output_tokens=3,
-                        ),
-                    )
-                    for prompt_messages in scoring_prompts
-                ]
-            )
-
-            # Extract scores and create results
-            results = []
-            for passage, response in zip(passages, responses, strict=True):
-                try:
-                    if hasattr(response, 'text') and response.text:
-                        # Extract numeric score from response
-                        score_text = response.text.strip()
-                        # Handle cases where model might return non-numeric text
-                        score_match = re.search(r'\b(\d{1,3})\b', score_text)
-                        if score_match:
-                            score = float(score_match.group(1))
-                            # Normalize to [0, 1] range and clamp to valid range
-                            normalized_score = max(0.0, min(1.0, score / 100.0))
-                            results.append((passage, normalized_score))
-                        else:
-                            logger.warning(
-                                f'Could not extract numeric score from response: {score_text}'
-                            )
-                            results.append((passage, 0.0))
+        # Execute all scoring requests concurrently - O(n) API calls
+        responses = await semaphore_gather(
+            *[
+                self.client.aio.models.generate_content(
+                    model=self.config.model or DEFAULT_MODEL,
+                    contents=prompt_messages,  # type: ignore
+                    config=types.GenerateContentConfig(
+                        system_instruction='You are an expert at rating passage relevance. Respond with only a number from 0-100.',
+                        temperature=0.0,
+                        max_output_tokens=3,
+                    ),
+                )
+                for prompt_messages in scoring_prompts
+            ]
+        )
+
+        # Extract scores
+        scores: list[float] = []
+        for response in responses:
+            try:
+                if hasattr(response, 'text') and response.text:
+                    # Extract numeric score from response
+                    score_text = response.text.strip()
+                    # Handle cases where model might return non-numeric text
+                    score_match = re.search(r'\b(\d{1,3})\b', score_text)
+                    if score_match:
+                        score = float(score_match.group(1))
+                        # Normalize to [0, 1] range and clamp to valid range
+                        scores.append(max(0.0, min(1.0, score / 100.0)))
                     else:
-                        logger.warning('Empty response from Gemini for passage scoring')
-                        results.append((passage, 0.0))
-                except (ValueError, AttributeError) as e:
-                    logger.warning(f'Error parsing score from Gemini response: {e}')
-                    results.append((passage, 0.0))
-
-            # Sort by score in descending order (highest relevance first)
-            results.sort(reverse=True, key=lambda x: x[1])
-            return results
-
-        except Exception as e:
-            # Check if it's a rate limit error based on Gemini API error codes
-            error_message = str(e).lower()
-            if (
-                'rate limit' in error_message
-                or 'quota' in error_message
-                or 'resource_exhausted' in error_message
-                or '429' in str(e)
-            ):
-                raise RateLimitError from e
-
-            logger.error(f'Error in generating LLM response: {e}')
-            raise
+                        logger.warning(
+                            f'Could not extract numeric score from response: {score_text}'
+                        )
+                        scores.append(0.0)
+                else:
+                    logger.warning('Empty response from Gemini for passage scoring')
+                    scores.append(0.0)
+            except (ValueError, AttributeError) as e:
+                logger.warning(f'Error parsing score from Gemini response: {e}')
+                scores.append(0.0)
+
+        return scores
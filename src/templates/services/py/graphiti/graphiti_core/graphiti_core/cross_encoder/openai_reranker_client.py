@@ -24,7 +24,15 @@ from openai import AsyncAzureOpenAI, AsyncOpenAI
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, OpenAIClient, RateLimitError
 from ..prompts import Message
-from .client import CrossEncoderClient
+from .client import (
+    RERANK_CACHE_SIZE,
+    CrossEncoderClient,
+    RerankScoreCache,
+    listwise_rank_prompt,
+    parse_listwise_scores,
+    rank_passages,
+    score_listwise,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,19 +44,29 @@ class OpenAIRerankerClient(CrossEncoderClient):
         self,
         config: LLMConfig | None = None,
         client: AsyncOpenAI | AsyncAzureOpenAI | OpenAIClient | None = None,
+        listwise_batch_size: int | None = None,
+        cache_size: int = RERANK_CACHE_SIZE,
+        rank_timeout: float | None = None,
     ):
         """
         Initialize the OpenAIRerankerClient with the provided configuration and client.
 
-        This reranker uses the OpenAI API to run a simple boolean classifier prompt concurrently
-        for each passage. Log-probabilities are used to rank the passages.
+        By default this reranker uses the OpenAI API to run a simple boolean classifier prompt
+        concurrently for each passage, and log-probabilities are used to rank the passages. With
+        listwise_batch_size set, up to that many passages are scored 0-100 in a single request
+        instead; passages a listwise response leaves out are scored individually.
 
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (AsyncOpenAI | AsyncAzureOpenAI | OpenAIClient | None): An optional async client instance to use. If not provided, a new AsyncOpenAI client is created.
+            listwise_batch_size (int | None): Number of passages scored per listwise request. None scores each passage with its own request.
+            cache_size (int): Number of (query, passage) scores kept in the LRU cache. 0 disables the cache.
+            rank_timeout (float | None): Seconds a rank call may take before falling back to the input order.
         """
         if config is None:
             config = LLMConfig()
+        if listwise_batch_size is not None and listwise_batch_size < 1:
+            raise ValueError('listwise_batch_size must be at least 1')
 
         self.config = config
         if client is None:
@@ -58,7 +76,50 @@ class OpenAIRerankerClient(CrossEncoderClient):
         else:
             self.client = client
 
+        self.listwise_batch_size = listwise_batch_size
+        self.score_cache = RerankScoreCache(cache_size) if cache_size > 0 else None
+        self.rank_timeout = rank_timeout
+
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        return await rank_passages(
+            query, passages, self._score_passages, self.score_cache, self.rank_timeout
+        )
+
+    async def _score_passages(self, query: str, passages: list[str]) -> list[float]:
+        try:
+            if self.listwise_batch_size is None:
+                return await self._score_pointwise(query, passages)
+
+            return await score_listwise(
+                query,
+                passages,
+                self.listwise_batch_size,
+                self._score_listwise,
+                self._score_pointwise,
+            )
+        except openai.RateLimitError as e:
+            raise RateLimitError from e
+        except Exception as e:
+            logger.error(f'Error in generating LLM response: {e}')
+            raise
+
+    async def _score_listwise(self, query: str, passages: list[str]) -> list[float | None]:
+        response = await self.client.chat.completions.create(
+            model=self.config.model or DEFAULT_MODEL,
+            messages=[
+                {
+                    'role': 'system',
+                    'content': 'You are an expert tasked with rating how relevant passages are to a query',
+                },
+                {'role': 'user', 'content': listwise_rank_prompt(query, passages)},
+            ],
+            temperature=0,
+            response_format={'type': 'json_object'},
+        )
+
+        return parse_listwise_scores(response.choices[0].message.content or '', len(passages))
+
+    async def _score_pointwise(self, query: str, passages: list[str]) -> list[float]:
         openai_messages_list: Any = [
             [
                 Message(
@@ -80,44 +141,37 @@ class OpenAIRerankerClient(CrossEncoderClient):
             ]
             for passage in passages
         ]
-        try:
-            responses = await semaphore_gather(
-                *[
-                    self.client.chat.completions.create(
-                        model=self.config.model or DEFAULT_MODEL,
-                        messages=openai_messages,
-                        temperature=0,
-                        max_tokens=1,
-                        logit_bias={'6432': 1, '7983': 1},
-                        logprobs=True,
-                        top_logprobs=2,
-                    )
-                    for openai_messages in openai_messages_list
-                ]
-            )
-
-            responses_top_logprobs = [
-                response.choices[0].logprobs.content[0].top_logprobs
-                if response.choices[0].logprobs is not None
-                and response.choices[0].logprobs.content is not None
-                else []
-                for response in responses
+        responses = await semaphore_gather(
+            *[
+                self.client.chat.completions.create(
+                    model=self.config.model or DEFAULT_MODEL,
+                    messages=openai_messages,
+                    temperature=0,
+                    max_tokens=1,
+                    logit_bias={'6432': 1, '7983': 1},
+                    logprobs=True,
+                    top_logprobs=2,
+                )
+                for openai_messages in openai_messages_list
             ]
-            scores: list[float] = []
-            for top_logprobs in responses_top_logprobs:
-                if len(top_logprobs) == 0:
-                    continue
-                norm_logprobs = np.exp(top_logprobs[0].logprob)
-                if top_logprobs[0].token.strip().split(' ')[0].lower() == 'true':
-                    scores.append(norm_logprobs)
-                else:
-                    scores.append(1 - norm_logprobs)
-
-            results = [(passage, score) for passage, score in zip(passages, scores, strict=True)]
-            results.sort(reverse=True, key=lambda x: x[1])
-            return results
-        except openai.RateLimitError as e:
-            raise RateLimitError from e
-        except Exception as e:
-            logger.error(f'Error in generating LLM response: {e}')
-            raise
+        )
+
+        responses_top_logprobs = [
+            response.choices[0].logprobs.content[0].top_logprobs
+            if response.choices[0].logprobs is not None
+            and response.choices[0].logprobs.content is not None
+            else []
+            for response in responses
+        ]
+        scores: list[float] = []
+        for top_logprobs in responses_top_logprobs:
+            if len(top_logprobs) == 0:
+                scores.append(0.0)
+                continue
+            norm_logprobs = np.exp(top_logprobs[0].logprob)
+            if top_logprobs[0].token.strip().split(' ')[0].lower() == 'true':
+                scores.append(norm_logprobs)
+            else:
+                scores.append(1 - norm_logprobs)
+
+        return scores
@@ -21,6 +21,7 @@ from typing import Any, TypeVar
 
 from graphiti_core.driver.driver import GraphProvider
 from graphiti_core.helpers import semaphore_gather
+from graphiti_core.search.scatter_gather import scatter_gather_search, shard_limit
 from graphiti_core.search.search_config import SearchResults
 
 F = TypeVar('F', bound=Callable[..., Awaitable[Any]])
@@ -30,6 +31,7 @@ def handle_multiple_group_ids(func: F) -> F:
     """
     Decorator for FalkorDB methods that need to handle multiple group_ids.
     Runs the function for each group_id separately and merges results.
+    A single group_id runs against that group's graph.
     """
 
     @functools.wraps(func)
@@ -44,13 +46,12 @@ def handle_multiple_group_ids(func: F) -> F:
         if group_ids is None and group_ids_pos is not None and len(args) > group_ids_pos:
             group_ids = args[group_ids_pos]
 
-        # Only handle FalkorDB with multiple group_ids
+        # Only handle FalkorDB with group_ids
         if (
             hasattr(self, 'clients')
             and hasattr(self.clients, 'driver')
             and self.clients.driver.provider == GraphProvider.FALKORDB
             and group_ids
-            and len(group_ids) > 1
         ):
             # Execute for each group_id concurrently
             driver = self.clients.driver
@@ -67,6 +68,9 @@ def handle_multiple_group_ids(func: F) -> F:
                     **{**kwargs, 'group_ids': [gid], 'driver': driver.clone(database=gid)},
                 )
 
+            if len(group_ids) == 1:
+                return await execute_for_group(group_ids[0])
+
             results = await semaphore_gather(
                 *[execute_for_group(gid) for gid in group_ids],
                 max_coroutines=getattr(self, 'max_coroutines', None),
@@ -98,6 +102,62 @@ def handle_multiple_group_ids(func: F) -> F:
     return wrapper  # type: ignore
 
 
+def scatter_gather_group_ids(func: F) -> F:
+    """
+    Decorator for FalkorDB search methods that take a SearchConfig and return SearchResults.
+
+    Searches the graph of each group_id concurrently with a per-shard limit, then merges the
+    shards into a global top config.limit by reranker score. A single group_id is searched on
+    its own graph without merging. See search.scatter_gather for the deadline, shard limit and
+    merge settings.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop('self')
+        group_ids = arguments.get('group_ids')
+
+        if not (
+            hasattr(self, 'clients')
+            and hasattr(self.clients, 'driver')
+            and self.clients.driver.provider == GraphProvider.FALKORDB
+            and group_ids
+        ):
+            return await func(self, *args, **kwargs)
+
+        driver = self.clients.driver
+        if len(group_ids) == 1:
+            return await func(self, **{**arguments, 'driver': driver.clone(database=group_ids[0])})
+
+        config = arguments['config']
+        shard_config = config.model_copy(
+            update={'limit': shard_limit(config.limit, len(group_ids))}
+        )
+
+        def search_group(gid: str):
+            return lambda: func(
+                self,
+                **{
+                    **arguments,
+                    'config': shard_config,
+                    'group_ids': [gid],
+                    'driver': driver.clone(database=gid),
+                },
+            )
+
+        return await scatter_gather_search(
+            {gid: search_group(gid) for gid in group_ids},
+            config.limit,
+            max_coroutines=getattr(self, 'max_coroutines', None),
+        )
+
+    return wrapper  # type: ignore
+
+
 def get_parameter_position(func: Callable, param_name: str) -> int | None:
     """
     Returns the positional index of a parameter in the function signature.
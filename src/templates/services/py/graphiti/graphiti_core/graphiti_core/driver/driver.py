@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import copy
 import logging
 import os
@@ -38,6 +39,13 @@ EPISODE_INDEX_NAME = os.environ.get('EPISODE_INDEX_NAME', 'episodes')
 COMMUNITY_INDEX_NAME = os.environ.get('COMMUNITY_INDEX_NAME', 'communities')
 ENTITY_EDGE_INDEX_NAME = os.environ.get('ENTITY_EDGE_INDEX_NAME', 'entity_edges')
 
+SCHEMA_MARKER_QUERY = 'MATCH (s:GraphitiSchema) RETURN s.version AS version'
+SCHEMA_MARKER_SAVE_QUERY = 'MERGE (s:GraphitiSchema) SET s.version = $version'
+
+# Schema versions confirmed in this process, keyed by provider, server and database
+_schema_versions: dict[tuple[str, str, str], str] = {}
+_schema_locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+
 
 class GraphProvider(Enum):
     NEO4J = 'neo4j'
@@ -76,6 +84,8 @@ class GraphDriver(ABC):
         ''  # Neo4j (default) syntax does not require a prefix for fulltext queries
     )
     _database: str
+    # Identifies the server, so schema markers of same-named databases on different servers differ
+    schema_location: str = ''
     default_group_id: str = ''
     search_interface: SearchInterface | None = None
     graph_operations_interface: GraphOperationsInterface | None = None
@@ -110,6 +120,40 @@ class GraphDriver(ABC):
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         raise NotImplementedError()
 
+    async def ensure_schema(self, force: bool = False) -> bool:
+        """
+        Build indices and constraints unless the database already carries the current schema.
+
+        The schema version is stored in a single GraphitiSchema node per database (per graph on
+        FalkorDB) and read at most once per process, so creating drivers and clones repeatedly
+        does not rerun index DDL. Returns True if the DDL ran.
+        """
+        from graphiti_core.graph_queries import get_schema_version
+
+        version = get_schema_version(self.provider)
+        key = (self.provider.value, self.schema_location, getattr(self, '_database', ''))
+        if not force and _schema_versions.get(key) == version:
+            return False
+
+        async with _schema_locks.setdefault(key, asyncio.Lock()):
+            if not force and _schema_versions.get(key) == version:
+                return False
+
+            stored = None
+            if not force:
+                result = await self.execute_query(SCHEMA_MARKER_QUERY, routing_='r')
+                records = result[0] if result else []
+                stored = records[0]['version'] if records else None
+
+            built = stored != version
+            if built:
+                logger.info(f'Building schema version {version} for {key[2] or key[0]}')
+                await self.build_indices_and_constraints()
+                await self.execute_query(SCHEMA_MARKER_SAVE_QUERY, version=version)
+
+            _schema_versions[key] = version
+            return built
+
     def clone(self, database: str) -> 'GraphDriver':
         """Clone the driver with a different database or graph name."""
         return self
@@ -15,10 +15,14 @@ limitations under the License.
 """
 
 import asyncio
+import copy
 import datetime
 import logging
+import os
 from typing import TYPE_CHECKING, Any
 
+from pydantic import BaseModel
+
 if TYPE_CHECKING:
     from falkordb import Graph as FalkorGraph
     from falkordb.asyncio import FalkorDB
@@ -34,11 +38,16 @@ else:
         ) from None
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.query_stats import track_query
 from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.helpers import LRUCache
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FALKOR_DATABASE = 'default_db'
+FALKOR_GRAPH_HANDLE_CACHE_SIZE = int(os.getenv('FALKOR_GRAPH_HANDLE_CACHE_SIZE', 1024))
+
 STOPWORDS = [
     'a',
     'is',
@@ -102,15 +111,25 @@ class FalkorDriverSession(GraphDriverSession):
         if isinstance(query, list):
             for cypher, params in query:
                 params = convert_datetimes_to_strings(params)
-                await self.graph.query(str(cypher), params)  # type: ignore[reportUnknownArgumentType]
+                with track_query(cypher, params):
+                    await self.graph.query(str(cypher), params)  # type: ignore[reportUnknownArgumentType]
         else:
             params = dict(kwargs)
             params = convert_datetimes_to_strings(params)
-            await self.graph.query(str(query), params)  # type: ignore[reportUnknownArgumentType]
+            with track_query(query, params):
+                await self.graph.query(str(query), params)  # type: ignore[reportUnknownArgumentType]
         # Assuming `graph.query` is async (ideal); otherwise, wrap in executor
         return None
 
 
+class GraphHandleStats(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
 class FalkorDriver(GraphDriver):
     provider = GraphProvider.FALKORDB
     default_group_id: str = '\\_'
@@ -124,7 +143,8 @@ class FalkorDriver(GraphDriver):
         username: str | None = None,
         password: str | None = None,
         falkor_db: FalkorDB | None = None,
-        database: str = 'default_db',
+        database: str = DEFAULT_FALKOR_DATABASE,
+        graph_handle_cache_size: int = FALKOR_GRAPH_HANDLE_CACHE_SIZE,
     ):
         """
         Initialize the FalkorDB driver.
@@ -140,6 +160,7 @@ class FalkorDriver(GraphDriver):
         password (str | None): The password for authentication (if required).
         falkor_db (FalkorDB | None): An existing FalkorDB instance to use instead of creating a new one.
         database (str): The name of the database to connect to. Defaults to 'default_db'.
+        graph_handle_cache_size (int): How many per-graph handles clone() keeps for reuse.
         """
         super().__init__()
         self._database = database
@@ -149,20 +170,22 @@ class FalkorDriver(GraphDriver):
         else:
             self.client = FalkorDB(host=host, port=port, username=username, password=password)
 
-        # Schedule the indices and constraints to be built
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # Schedule the build_indices_and_constraints to run
-            loop.create_task(self.build_indices_and_constraints())
-        except RuntimeError:
-            # No event loop running, this will be handled later
-            pass
+        self.schema_location = self._connection_address(host, port)
+        self._graph: FalkorGraph | None = None
+        # Shared by every handle cloned from this driver
+        self._graph_handles: LRUCache[str, FalkorDriver] = LRUCache(graph_handle_cache_size)
+
+    def _connection_address(self, host: str, port: int) -> str:
+        pool = getattr(getattr(self.client, 'connection', None), 'connection_pool', None)
+        kwargs = getattr(pool, 'connection_kwargs', None) or {'host': host, 'port': port}
+        return f'{kwargs.get("host")}:{kwargs.get("port")}'
 
     def _get_graph(self, graph_name: str | None) -> FalkorGraph:
         # FalkorDB requires a non-None database name for multi-tenant graphs; the default is "default_db"
-        if graph_name is None:
-            graph_name = self._database
+        if graph_name is None or graph_name == self._database:
+            if self._graph is None:
+                self._graph = self.client.select_graph(self._database)
+            return self._graph
         return self.client.select_graph(graph_name)
 
     async def execute_query(self, cypher_query_, **kwargs: Any):
@@ -172,7 +195,9 @@ class FalkorDriver(GraphDriver):
         params = convert_datetimes_to_strings(dict(kwargs))
 
         try:
-            result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            with track_query(cypher_query_, params) as tracked:
+                result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+                tracked.set_result(result.result_set, len(result.result_set))
         except Exception as e:
             if 'already indexed' in str(e):
                 # check if index already exists
@@ -251,19 +276,37 @@ class FalkorDriver(GraphDriver):
 
     def clone(self, database: str) -> 'GraphDriver':
         """
-        Returns a shallow copy of this driver with a different default database.
-        Reuses the same connection (e.g. FalkorDB, Neo4j).
+        Returns a handle to a different graph that shares this driver's connection pool.
+
+        Handles are kept in an LRU shared by every clone, so routing repeated calls to the same
+        tenant graph returns the same handle instead of constructing a new driver.
         """
+        if database == self.default_group_id:
+            database = DEFAULT_FALKOR_DATABASE
         if database == self._database:
-            cloned = self
-        elif database == self.default_group_id:
-            cloned = FalkorDriver(falkor_db=self.client)
-        else:
-            # Create a new instance of FalkorDriver with the same connection but a different database
-            cloned = FalkorDriver(falkor_db=self.client, database=database)
+            return self
+
+        cloned = self._graph_handles.get(database)
+        if cloned is None:
+            cloned = copy.copy(self)
+            cloned._database = database
+            cloned._graph = None
+            self._graph_handles.set(database, cloned)
 
         return cloned
 
+    def with_database(self, database: str) -> 'GraphDriver':
+        return self.clone(database)
+
+    def graph_handle_stats(self) -> GraphHandleStats:
+        return GraphHandleStats(
+            size=len(self._graph_handles),
+            max_size=self._graph_handles.max_size,
+            hits=self._graph_handles.hits,
+            misses=self._graph_handles.misses,
+            evictions=self._graph_handles.evictions,
+        )
+
     async def health_check(self) -> None:
         """Check FalkorDB connectivity by running a simple query."""
         try:
@@ -52,7 +52,7 @@ class GraphOperationsInterface(BaseModel):
         driver: Any,
         group_id: str,
         batch_size: int = 100,
-    ) -> None:
+    ) -> int:
         raise NotImplementedError
 
     async def node_delete_by_uuids(
@@ -62,7 +62,7 @@ class GraphOperationsInterface(BaseModel):
         uuids: list[str],
         group_id: str | None = None,
         batch_size: int = 100,
-    ) -> None:
+    ) -> int:
         raise NotImplementedError
 
     # --------------------------
@@ -0,0 +1,308 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import csv
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from graphiti_core.driver.driver import GraphDriver
+
+# Batches with fewer rows than this are written with one MERGE per row, which is cheaper than
+# staging files for the handful of rows a single episode produces
+KUZU_BULK_COPY_THRESHOLD = int(os.getenv('KUZU_BULK_COPY_THRESHOLD', 200))
+
+CSV_OPTIONS = '(HEADER=true, PARALLEL=false)'
+
+# Characters Kuzu's CSV list parser treats as structure, which cannot appear in list elements
+UNSAFE_LIST_CHARACTERS = frozenset(',[]{}"\'')
+
+
+class Column(NamedTuple):
+    name: str
+    type: str
+    # Strings that must be read back as '' when empty, since Kuzu's CSV reader yields NULL
+    required: bool = False
+
+
+# Column order and types must match the tables in kuzu_driver.SCHEMA_QUERIES
+EPISODIC_COLUMNS = [
+    Column('uuid', 'STRING'),
+    Column('name', 'STRING', True),
+    Column('group_id', 'STRING', True),
+    Column('created_at', 'TIMESTAMP'),
+    Column('source', 'STRING', True),
+    Column('source_description', 'STRING', True),
+    Column('content', 'STRING', True),
+    Column('valid_at', 'TIMESTAMP'),
+    Column('entity_edges', 'STRING[]'),
+]
+
+ENTITY_COLUMNS = [
+    Column('uuid', 'STRING'),
+    Column('name', 'STRING', True),
+    Column('group_id', 'STRING', True),
+    Column('labels', 'STRING[]'),
+    Column('created_at', 'TIMESTAMP'),
+    Column('name_embedding', 'FLOAT[]'),
+    Column('summary', 'STRING', True),
+    Column('attributes', 'STRING', True),
+]
+
+RELATES_TO_NODE_COLUMNS = [
+    Column('uuid', 'STRING'),
+    Column('group_id', 'STRING', True),
+    Column('created_at', 'TIMESTAMP'),
+    Column('name', 'STRING', True),
+    Column('fact', 'STRING', True),
+    Column('fact_embedding', 'FLOAT[]'),
+    Column('episodes', 'STRING[]'),
+    Column('expired_at', 'TIMESTAMP'),
+    Column('valid_at', 'TIMESTAMP'),
+    Column('invalid_at', 'TIMESTAMP'),
+    Column('attributes', 'STRING', True),
+]
+
+MENTIONS_COLUMNS = [
+    Column('source_node_uuid', 'STRING'),
+    Column('target_node_uuid', 'STRING'),
+    Column('uuid', 'STRING'),
+    Column('group_id', 'STRING', True),
+    Column('created_at', 'TIMESTAMP'),
+]
+
+
+class UnsafeCSVValueError(ValueError):
+    pass
+
+
+def _encode(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list | tuple):
+        if value and isinstance(value[0], float):
+            # Embeddings are stored as 32 bit floats, which 9 significant digits identify exactly
+            embedding = np.asarray(value, dtype=np.float32).tolist()
+            return '[' + ','.join(format(x, '.9g') for x in embedding) + ']'
+        elements = [str(element) for element in value]
+        if any(UNSAFE_LIST_CHARACTERS.intersection(element) for element in elements):
+            raise UnsafeCSVValueError(f'List element cannot be staged as CSV: {value!r}')
+        return '[' + ','.join(elements) + ']'
+    return str(value)
+
+
+def _write_csv(path: str, columns: list[Column], rows: list[dict[str, Any]]):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow([column.name for column in columns])
+        for row in rows:
+            writer.writerow([_encode(row.get(column.name)) for column in columns])
+
+
+def _load_from(path: str, columns: list[Column]) -> str:
+    # Explicit column types, so columns that are empty in this batch are not inferred as STRING
+    headers = ', '.join(f'{column.name} {column.type}' for column in columns)
+    return f"LOAD WITH HEADERS ({headers}) FROM '{path}' {CSV_OPTIONS}"
+
+
+def _value(column: Column) -> str:
+    return f"coalesce({column.name}, '')" if column.required else column.name
+
+
+def _copy_query(table: str, path: str, columns: list[Column]) -> str:
+    values = ', '.join(_value(column) for column in columns)
+    return f'COPY {table} FROM ({_load_from(path, columns)} RETURN {values})'
+
+
+def _dedupe(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # COPY rejects duplicate primary keys, so keep the last write of each uuid like MERGE would
+    return list({row['uuid']: row for row in rows}.values())
+
+
+async def _existing_uuids(driver: GraphDriver, label: str, uuids: set[str]) -> set[str]:
+    if not uuids:
+        return set()
+    # Primary key lookups; `WHERE n.uuid IN $uuids` would compare every row against the list
+    records, _, _ = await driver.execute_query(
+        f'UNWIND $uuids AS uuid MATCH (n:{label} {{uuid: uuid}}) RETURN n.uuid AS uuid',
+        uuids=list(uuids),
+    )
+    return {record['uuid'] for record in records}
+
+
+async def _existing_mentions(driver: GraphDriver, episodic_edges: list[dict[str, Any]]) -> set[str]:
+    if not episodic_edges:
+        return set()
+    # MENTIONS has no index on uuid, so expand from the episodes instead of scanning it
+    records, _, _ = await driver.execute_query(
+        """
+        UNWIND $episode_uuids AS episode_uuid
+        MATCH (:Episodic {uuid: episode_uuid})-[e:MENTIONS]->(:Entity)
+        RETURN e.uuid AS uuid
+        """,
+        episode_uuids=list({row['source_node_uuid'] for row in episodic_edges}),
+    )
+    return {record['uuid'] for record in records} & {row['uuid'] for row in episodic_edges}
+
+
+async def _stage(
+    driver: GraphDriver,
+    directory: str,
+    table: str,
+    columns: list[Column],
+    rows: list[dict[str, Any]],
+):
+    if not rows:
+        return
+    path = os.path.join(directory, f'{table}.csv')
+    _write_csv(path, columns, rows)
+    await driver.execute_query(_copy_query(table, path, columns))
+
+
+class ExistingRows(NamedTuple):
+    episodes: list[dict[str, Any]]
+    nodes: list[dict[str, Any]]
+    entity_edges: list[dict[str, Any]]
+    episodic_edges: list[dict[str, Any]]
+
+
+async def copy_nodes_and_edges_bulk(
+    driver: GraphDriver,
+    episodes: list[dict[str, Any]],
+    nodes: list[dict[str, Any]],
+    entity_edges: list[dict[str, Any]],
+    episodic_edges: list[dict[str, Any]],
+) -> ExistingRows:
+    """
+    Save the new rows of a batch to Kuzu with COPY FROM staged CSV files.
+
+    Rows whose uuid is new are appended with COPY. Rows that already exist are not written and
+    are returned, for the caller to MERGE one row at a time: updating COPYed rows from a staged
+    file with LOAD FROM ... MATCH ... SET crashes Kuzu on tables with a full-text index. As with
+    the per-row queries, new edges whose endpoints do not exist are skipped. Raises
+    UnsafeCSVValueError before writing anything if a list value cannot be represented in
+    Kuzu's CSV format.
+    """
+    episodes = _dedupe(episodes)
+    nodes = _dedupe(nodes)
+    entity_edges = _dedupe(entity_edges)
+    episodic_edges = _dedupe(episodic_edges)
+
+    with tempfile.TemporaryDirectory(prefix='graphiti-kuzu-') as directory:
+        # Encode everything up front so an unsupported value fails before the first write
+        for columns, rows in (
+            (EPISODIC_COLUMNS, episodes),
+            (ENTITY_COLUMNS, nodes),
+            (RELATES_TO_NODE_COLUMNS, entity_edges),
+            (MENTIONS_COLUMNS, episodic_edges),
+        ):
+            for column in columns:
+                if column.type.endswith('[]'):
+                    for row in rows:
+                        _encode(row.get(column.name))
+
+        existing_episodes = await _existing_uuids(
+            driver,
+            'Episodic',
+            {row['uuid'] for row in episodes} | {row['source_node_uuid'] for row in episodic_edges},
+        )
+        existing_nodes = await _existing_uuids(
+            driver,
+            'Entity',
+            {row['uuid'] for row in nodes}
+            | {row['source_node_uuid'] for row in entity_edges}
+            | {row['target_node_uuid'] for row in entity_edges}
+            | {row['target_node_uuid'] for row in episodic_edges},
+        )
+        existing_edges = await _existing_uuids(
+            driver, 'RelatesToNode_', {row['uuid'] for row in entity_edges}
+        )
+        existing_mentions = await _existing_mentions(driver, episodic_edges)
+
+        await _stage(
+            driver,
+            directory,
+            'Episodic',
+            EPISODIC_COLUMNS,
+            [row for row in episodes if row['uuid'] not in existing_episodes],
+        )
+        await _stage(
+            driver,
+            directory,
+            'Entity',
+            ENTITY_COLUMNS,
+            [row for row in nodes if row['uuid'] not in existing_nodes],
+        )
+
+        saved_episodes = existing_episodes | {row['uuid'] for row in episodes}
+        saved_nodes = existing_nodes | {row['uuid'] for row in nodes}
+
+        new_edges = [
+            row
+            for row in entity_edges
+            if row['uuid'] not in existing_edges
+            and row['source_node_uuid'] in saved_nodes
+            and row['target_node_uuid'] in saved_nodes
+        ]
+        await _stage(driver, directory, 'RelatesToNode_', RELATES_TO_NODE_COLUMNS, new_edges)
+        if new_edges:
+            for source, target, endpoints in (
+                (
+                    'Entity',
+                    'RelatesToNode_',
+                    [(row['source_node_uuid'], row['uuid']) for row in new_edges],
+                ),
+                (
+                    'RelatesToNode_',
+                    'Entity',
+                    [(row['uuid'], row['target_node_uuid']) for row in new_edges],
+                ),
+            ):
+                path = os.path.join(directory, f'RELATES_TO_{source}.csv')
+                with open(path, 'w', newline='', encoding='utf-8') as file:
+                    writer = csv.writer(file)
+                    writer.writerow(['from', 'to'])
+                    writer.writerows(endpoints)
+                await driver.execute_query(
+                    f"COPY RELATES_TO FROM '{path}' "
+                    f"(HEADER=true, PARALLEL=false, from='{source}', to='{target}')"
+                )
+
+        await _stage(
+            driver,
+            directory,
+            'MENTIONS',
+            MENTIONS_COLUMNS,
+            [
+                row
+                for row in episodic_edges
+                if row['uuid'] not in existing_mentions
+                and row['source_node_uuid'] in saved_episodes
+                and row['target_node_uuid'] in saved_nodes
+            ],
+        )
+
+    return ExistingRows(
+        episodes=[row for row in episodes if row['uuid'] in existing_episodes],
+        nodes=[row for row in nodes if row['uuid'] in existing_nodes],
+        entity_edges=[row for row in entity_edges if row['uuid'] in existing_edges],
+        episodic_edges=[row for row in episodic_edges if row['uuid'] in existing_mentions],
+    )
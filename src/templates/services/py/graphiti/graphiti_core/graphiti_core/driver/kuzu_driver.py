@@ -15,11 +15,13 @@ limitations under the License.
 """
 
 import logging
+import os
 from typing import Any
 
 import kuzu
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.query_stats import track_query
 
 logger = logging.getLogger(__name__)
 
@@ -98,13 +100,20 @@ class KuzuDriver(GraphDriver):
         self,
         db: str = ':memory:',
         max_concurrent_queries: int = 1,
+        max_concurrent_reads: int | None = None,
     ):
         super().__init__()
         self.db = kuzu.Database(db)
 
         self.setup_schema()
 
+        # Writes go through one serialized connection. Queries routed with routing_='r' use a
+        # separate pool sized to the CPU count, so the parallel searches in search() are not
+        # queued behind each other or behind a write.
         self.client = kuzu.AsyncConnection(self.db, max_concurrent_queries=max_concurrent_queries)
+        self.read_client = kuzu.AsyncConnection(
+            self.db, max_concurrent_queries=max_concurrent_reads or os.cpu_count() or 1
+        )
 
     async def execute_query(
         self, cypher_query_: str, **kwargs: Any
@@ -112,22 +121,25 @@ class KuzuDriver(GraphDriver):
         params = {k: v for k, v in kwargs.items() if v is not None}
         # Kuzu does not support these parameters.
         params.pop('database_', None)
-        params.pop('routing_', None)
-
-        try:
-            results = await self.client.execute(cypher_query_, parameters=params)
-        except Exception as e:
-            params = {k: (v[:5] if isinstance(v, list) else v) for k, v in params.items()}
-            logger.error(f'Error executing Kuzu query: {e}\n{cypher_query_}\n{params}')
-            raise
-
-        if not results:
-            return [], None, None
-
-        if isinstance(results, list):
-            dict_results = [list(result.rows_as_dict()) for result in results]
-        else:
-            dict_results = list(results.rows_as_dict())
+        client = self.read_client if params.pop('routing_', None) == 'r' else self.client
+
+        with track_query(cypher_query_, params) as tracked:
+            try:
+                results = await client.execute(cypher_query_, parameters=params)
+            except Exception as e:
+                params = {k: (v[:5] if isinstance(v, list) else v) for k, v in params.items()}
+                logger.error(f'Error executing Kuzu query: {e}\n{cypher_query_}\n{params}')
+                raise
+
+            if not results:
+                return [], None, None
+
+            if isinstance(results, list):
+                dict_results = [list(result.rows_as_dict()) for result in results]
+                tracked.set_result(dict_results, sum(len(rows) for rows in dict_results))
+            else:
+                dict_results = list(results.rows_as_dict())
+                tracked.set_result(dict_results, len(dict_results))
         return dict_results, None, None  # type: ignore
 
     def session(self, _database: str | None = None) -> GraphDriverSession:
@@ -146,6 +158,10 @@ class KuzuDriver(GraphDriver):
         # This method is required by the abstract base class but is a no-op for Kuzu
         pass
 
+    async def ensure_schema(self, force: bool = False) -> bool:
+        # The schema is created by setup_schema() when the driver is constructed
+        return False
+
     def setup_schema(self):
         conn = kuzu.Connection(self.db)
         conn.execute(SCHEMA_QUERIES)
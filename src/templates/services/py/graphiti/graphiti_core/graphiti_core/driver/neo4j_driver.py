@@ -23,6 +23,7 @@ from neo4j.exceptions import ClientError
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.query_stats import query_stats_enabled, track_query
 from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
 from graphiti_core.helpers import semaphore_gather
 
@@ -46,18 +47,7 @@ class Neo4jDriver(GraphDriver):
             auth=(user or '', password or ''),
         )
         self._database = database
-
-        # Schedule the indices and constraints to be built
-        import asyncio
-
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # Schedule the build_indices_and_constraints to run
-            loop.create_task(self.build_indices_and_constraints())
-        except RuntimeError:
-            # No event loop running, this will be handled later
-            pass
+        self.schema_location = uri
 
         self.aoss_client = None
 
@@ -70,7 +60,11 @@ class Neo4jDriver(GraphDriver):
         params.setdefault('database_', self._database)
 
         try:
-            result = await self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
+            with track_query(cypher_query_, params) as tracked:
+                result = await self.client.execute_query(
+                    cypher_query_, parameters_=params, **kwargs
+                )
+                tracked.set_result(result.records, len(result.records))
         except Exception as e:
             logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
             raise
@@ -79,7 +73,10 @@ class Neo4jDriver(GraphDriver):
 
     def session(self, database: str | None = None) -> GraphDriverSession:
         _database = database or self._database
-        return self.client.session(database=_database)  # type: ignore
+        session = self.client.session(database=_database)
+        if query_stats_enabled():
+            return _TrackedSession(session)  # type: ignore
+        return session  # type: ignore
 
     async def close(self) -> None:
         return await self.client.close()
@@ -124,3 +121,51 @@ class Neo4jDriver(GraphDriver):
         except Exception as e:
             print(f'Neo4j health check failed: {e}')
             raise
+
+
+class _TrackedTransaction:
+    """Records the queries a managed transaction runs while query stats are collected."""
+
+    def __init__(self, tx: Any):
+        self._tx = tx
+
+    async def run(self, query: LiteralString, parameters: dict[str, Any] | None = None, **kwargs):
+        # The result is streamed to the caller, so only round trips and latency are recorded
+        with track_query(query, parameters or kwargs):
+            return await self._tx.run(query, parameters, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tx, name)
+
+
+class _TrackedSession:
+    """Neo4j session whose run and transaction functions record query stats."""
+
+    def __init__(self, session: Any):
+        self._session = session
+
+    async def __aenter__(self):
+        await self._session.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self._session.__aexit__(exc_type, exc, tb)
+
+    async def run(self, query: LiteralString, parameters: dict[str, Any] | None = None, **kwargs):
+        with track_query(query, parameters or kwargs):
+            return await self._session.run(query, parameters, **kwargs)
+
+    async def execute_write(self, func, *args, **kwargs):
+        async def tracked(tx, *args, **kwargs):
+            return await func(_TrackedTransaction(tx), *args, **kwargs)
+
+        return await self._session.execute_write(tracked, *args, **kwargs)
+
+    async def execute_read(self, func, *args, **kwargs):
+        async def tracked(tx, *args, **kwargs):
+            return await func(_TrackedTransaction(tx), *args, **kwargs)
+
+        return await self._session.execute_read(tracked, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
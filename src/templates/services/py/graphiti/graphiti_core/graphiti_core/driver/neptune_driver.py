@@ -25,6 +25,7 @@ from langchain_aws.graphs import NeptuneAnalyticsGraph, NeptuneGraph
 from opensearchpy import OpenSearch, Urllib3AWSV4SignerAuth, Urllib3HttpConnection, helpers
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.query_stats import track_query
 
 logger = logging.getLogger(__name__)
 DEFAULT_SIZE = 10
@@ -120,6 +121,7 @@ class NeptuneDriver(GraphDriver):
         """
         if not host:
             raise ValueError('You must provide an endpoint to create a NeptuneDriver')
+        self.schema_location = host
 
         if host.startswith('neptune-db://'):
             # This is a Neptune Database Cluster
@@ -199,17 +201,19 @@ class NeptuneDriver(GraphDriver):
         else:
             return self._run_query(cypher_query_, params)
 
-    def _run_query(self, cypher_query_, params):
-        cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
-        try:
-            result = self.client.query(cypher_query_, params=params)
-        except Exception as e:
-            logger.error('Query: %s', cypher_query_)
-            logger.error('Parameters: %s', params)
-            logger.error('Error executing query: %s', e)
-            raise e
-
-        return result, None, None
+    def _run_query(self, cypher_query_, params) -> tuple[Any, None, None]:
+        # Fingerprint the query before parameters are inlined, so repeated calls group together
+        with track_query(cypher_query_, params) as tracked:
+            cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
+            try:
+                result = self.client.query(cypher_query_, params=params)
+            except Exception as e:
+                logger.error('Query: %s', cypher_query_)
+                logger.error('Parameters: %s', params)
+                logger.error('Error executing query: %s', e)
+                raise e
+            tracked.set_result(result, len(result) if isinstance(result, list) else 0)
+            return result, None, None
 
     def session(self, database: str | None = None) -> GraphDriverSession:
         return NeptuneDriverSession(driver=self)
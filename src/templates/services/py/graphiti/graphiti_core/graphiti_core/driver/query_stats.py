@@ -0,0 +1,244 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from time import perf_counter
+from typing import Any
+
+from pydantic import BaseModel
+
+from graphiti_core.tracer import current_span_name
+
+QUERY_SAMPLE_CHARS = 200
+
+_collectors: ContextVar[tuple['QueryStatsCollector', ...]] = ContextVar(
+    'query_stats_collectors', default=()
+)
+
+
+class QueryStats(BaseModel):
+    operation: str | None
+    fingerprint: str
+    query: str
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class QueryStatsTotals(BaseModel):
+    calls: int
+    errors: int
+    rows: int
+    bytes_sent: int
+    bytes_received: int
+    total_ms: float
+
+
+class QueryStatsCollector:
+    """
+    Accumulates database round trips per enclosing tracer span and query fingerprint.
+
+    Rows and bytes are approximations: bytes are estimated from the Python values sent as
+    parameters and returned as records, not measured on the wire, and queries run inside a
+    Neo4j managed transaction stream their results so they report no rows.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[str | None, str], QueryStats] = {}
+
+    def record(
+        self,
+        operation: str | None,
+        query: str,
+        elapsed_ms: float,
+        rows: int,
+        bytes_sent: int,
+        bytes_received: int,
+        failed: bool,
+    ):
+        fingerprint, sample = fingerprint_query(query)
+        key = (operation, fingerprint)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = QueryStats(operation=operation, fingerprint=fingerprint, query=sample)
+            self._stats[key] = stats
+
+        stats.calls += 1
+        stats.errors += int(failed)
+        stats.rows += rows
+        stats.bytes_sent += bytes_sent
+        stats.bytes_received += bytes_received
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    def stats(self, operation: str | None = None) -> list[QueryStats]:
+        """Return per-fingerprint stats, slowest first, optionally for a single operation."""
+        stats = [
+            s.model_copy()
+            for s in self._stats.values()
+            if operation is None or s.operation == operation
+        ]
+        stats.sort(key=lambda s: s.total_ms, reverse=True)
+        return stats
+
+    def by_operation(self) -> dict[str | None, QueryStatsTotals]:
+        operations: dict[str | None, list[QueryStats]] = {}
+        for stats in self._stats.values():
+            operations.setdefault(stats.operation, []).append(stats)
+        return {operation: _totals(stats) for operation, stats in operations.items()}
+
+    def totals(self) -> QueryStatsTotals:
+        return _totals(list(self._stats.values()))
+
+    def reset(self):
+        self._stats.clear()
+
+
+def _totals(stats: list[QueryStats]) -> QueryStatsTotals:
+    return QueryStatsTotals(
+        calls=sum(s.calls for s in stats),
+        errors=sum(s.errors for s in stats),
+        rows=sum(s.rows for s in stats),
+        bytes_sent=sum(s.bytes_sent for s in stats),
+        bytes_received=sum(s.bytes_received for s in stats),
+        total_ms=sum(s.total_ms for s in stats),
+    )
+
+
+@contextmanager
+def collect_query_stats() -> Generator[QueryStatsCollector, None, None]:
+    """
+    Record every driver round trip made inside the block, including those made by tasks it
+    spawns, into a fresh collector.
+
+    >>> with collect_query_stats() as stats:
+    ...     await graphiti.add_episode(...)
+    >>> stats.by_operation()['add_episode'].calls
+
+    Collectors nest: an inner block's queries are also recorded by every enclosing one.
+    """
+    collector = QueryStatsCollector()
+    token = _collectors.set(_collectors.get() + (collector,))
+    try:
+        yield collector
+    finally:
+        _collectors.reset(token)
+
+
+def fingerprint_query(query: Any) -> tuple[str, str]:
+    """Return a stable hash of the whitespace-normalized query and a truncated sample of it."""
+    normalized = ' '.join(str(query).split())
+    fingerprint = hashlib.sha1(normalized.encode()).hexdigest()[:12]
+    return fingerprint, normalized[:QUERY_SAMPLE_CHARS]
+
+
+def approximate_size(value: Any) -> int:
+    """Estimate the payload size of a query parameter or result value in bytes."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, bytes | bytearray):
+        return len(value)
+    if isinstance(value, bool | int | float | datetime | date):
+        return 8
+    if isinstance(value, dict):
+        return sum(approximate_size(k) + approximate_size(v) for k, v in value.items())
+    if isinstance(value, list | tuple | set):
+        return sum(approximate_size(v) for v in value)
+    return len(str(value))
+
+
+class TrackedQuery:
+    """Times one round trip and reports it to the active collectors on exit."""
+
+    __slots__ = ('collectors', 'query', 'bytes_sent', 'rows', 'bytes_received', 'start')
+
+    def __init__(self, collectors: tuple[QueryStatsCollector, ...], query: Any, params: Any):
+        self.collectors = collectors
+        self.query = query
+        self.bytes_sent = approximate_size(params)
+        self.rows = 0
+        self.bytes_received = 0
+        self.start = 0.0
+
+    def __enter__(self) -> 'TrackedQuery':
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed_ms = (perf_counter() - self.start) * 1000
+        operation = current_span_name.get()
+        for collector in self.collectors:
+            collector.record(
+                operation,
+                self.query,
+                elapsed_ms,
+                self.rows,
+                self.bytes_sent,
+                self.bytes_received,
+                exc_type is not None,
+            )
+
+    def set_result(self, records: Any, rows: int):
+        self.rows = rows
+        self.bytes_received = approximate_size(records)
+
+
+class _UntrackedQuery:
+    __slots__ = ()
+
+    def __enter__(self) -> '_UntrackedQuery':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def set_result(self, records: Any, rows: int):
+        pass
+
+
+_UNTRACKED = _UntrackedQuery()
+
+
+def query_stats_enabled() -> bool:
+    return bool(_collectors.get())
+
+
+def track_query(query: Any, params: Any = None) -> TrackedQuery | _UntrackedQuery:
+    """
+    Wrap a single database round trip. Drivers call set_result with the records and row count
+    the database returned.
+
+    When no collector is active this returns a shared no-op, so the cost of an uninstrumented
+    query is one context variable lookup.
+    """
+    collectors = _collectors.get()
+    if not collectors:
+        return _UNTRACKED
+    return TrackedQuery(collectors, query, params)
@@ -5,6 +5,8 @@ This module provides database-agnostic query generation for Neo4j and FalkorDB,
 supporting index creation, fulltext search, and bulk operations.
 """
 
+import hashlib
+
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphProvider
@@ -127,6 +129,12 @@ def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     ]
 
 
+def get_schema_version(provider: GraphProvider) -> str:
+    """Fingerprint of the index DDL, so changing any index definition outdates stored markers."""
+    ddl = '\n'.join(get_range_indices(provider) + get_fulltext_indices(provider))
+    return hashlib.sha256(ddl.encode()).hexdigest()[:16]
+
+
 def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
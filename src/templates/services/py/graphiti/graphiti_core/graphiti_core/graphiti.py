@@ -14,17 +14,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import copy
 import logging
+import os
+from collections.abc import AsyncIterable, Callable, Iterable
+from contextlib import suppress
 from datetime import datetime
 from time import time
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from typing_extensions import LiteralString
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
-from graphiti_core.decorators import handle_multiple_group_ids
+from graphiti_core.decorators import handle_multiple_group_ids, scatter_gather_group_ids
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.driver.neo4j_driver import Neo4jDriver
 from graphiti_core.edges import (
@@ -35,6 +39,7 @@ from graphiti_core.edges import (
     create_entity_edge_embeddings,
 )
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
+from graphiti_core.errors import NodeNotFoundError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
     get_default_group_id,
@@ -51,7 +56,9 @@ from graphiti_core.nodes import (
     Node,
     create_entity_node_embeddings,
 )
+from graphiti_core.search.graph_snapshot import GraphSnapshotStore
 from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.search_cache import SearchCache
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
@@ -71,11 +78,14 @@ from graphiti_core.utils.bulk_utils import (
     dedupe_edges_bulk,
     dedupe_nodes_bulk,
     extract_nodes_and_edges_bulk,
+    iterate_episode_windows,
     resolve_edge_pointers,
     retrieve_previous_episodes_bulk,
 )
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
+    CommunityDetectionMethod,
+    SummaryCache,
     build_communities,
     remove_communities,
     update_community,
@@ -88,6 +98,7 @@ from graphiti_core.utils.maintenance.edge_operations import (
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
+    get_episode_removal_targets,
     retrieve_episodes,
 )
 from graphiti_core.utils.maintenance.node_operations import (
@@ -101,6 +112,8 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+STREAM_WINDOW_SIZE = int(os.getenv('STREAM_WINDOW_SIZE', 20))
+
 
 class AddEpisodeResults(BaseModel):
     episode: EpisodicNode
@@ -120,6 +133,36 @@ class AddBulkEpisodeResults(BaseModel):
     community_edges: list[CommunityEdge]
 
 
+class BulkWindowExtraction(BaseModel):
+    episodes: list[EpisodicNode]
+    episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]]
+    nodes_by_episode: dict[str, list[EntityNode]]
+    edges_by_episode: dict[str, list[EntityEdge]]
+    episodic_edges: list[EpisodicEdge]
+
+
+class AddEpisodeStreamProgress(BaseModel):
+    window_index: int
+    episode_count: int
+    node_count: int
+    edge_count: int
+    extraction_ms: float
+    resolution_ms: float
+    total_episodes: int
+    total_nodes: int
+    total_edges: int
+
+
+AddEpisodeStreamProgressCallback = Callable[[AddEpisodeStreamProgress], None]
+
+
+class AddEpisodeStreamResults(BaseModel):
+    window_count: int
+    episode_uuids: list[str]
+    node_count: int
+    edge_count: int
+
+
 class AddTripletResults(BaseModel):
     nodes: list[EntityNode]
     edges: list[EntityEdge]
@@ -139,6 +182,8 @@ class Graphiti:
         max_coroutines: int | None = None,
         tracer: Tracer | None = None,
         trace_span_prefix: str = 'graphiti',
+        search_cache: SearchCache | None = None,
+        graph_snapshots: GraphSnapshotStore | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -175,6 +220,12 @@ class Graphiti:
             An OpenTelemetry tracer instance for distributed tracing. If not provided, tracing is disabled (no-op).
         trace_span_prefix : str, optional
             Prefix to prepend to all span names. Defaults to 'graphiti'.
+        search_cache : SearchCache | None, optional
+            Serve repeated search and search_ calls from memory until a write through this
+            instance touches one of the searched groups. Disabled by default.
+        graph_snapshots : GraphSnapshotStore | None, optional
+            Run BFS searches and node distance reranking over in-memory adjacency snapshots of
+            the searched groups instead of variable-length path queries. Disabled by default.
 
         Returns
         -------
@@ -217,6 +268,12 @@ class Graphiti:
         else:
             self.cross_encoder = OpenAIRerankerClient()
 
+        # Summaries of community member subsets, re-used across build_communities calls
+        self.community_summary_cache = SummaryCache()
+
+        self.search_cache = search_cache
+        self.graph_snapshots = graph_snapshots
+
         # Initialize tracer
         self.tracer = create_tracer(tracer, trace_span_prefix)
 
@@ -229,6 +286,7 @@ class Graphiti:
             embedder=self.embedder,
             cross_encoder=self.cross_encoder,
             tracer=self.tracer,
+            graph_snapshots=self.graph_snapshots,
         )
 
         # Capture telemetry event
@@ -385,6 +443,7 @@ class Graphiti:
         nodes: list[EntityNode],
         uuid_map: dict[str, str],
         custom_prompt: str = '',
+        edge_resolution_batch_size: int | None = None,
     ) -> tuple[list[EntityEdge], list[EntityEdge]]:
         """Extract edges from episode and resolve against existing graph."""
         extracted_edges = await extract_edges(
@@ -407,6 +466,7 @@ class Graphiti:
             nodes,
             edge_types or {},
             edge_type_map,
+            batch_size=edge_resolution_batch_size,
         )
 
         return resolved_edges, invalidated_edges
@@ -433,6 +493,7 @@ class Graphiti:
             entity_edges,
             self.embedder,
         )
+        self._apply_graph_snapshot_edges(entity_edges, episodic_edges)
 
         return episodic_edges, episode
 
@@ -475,6 +536,8 @@ class Graphiti:
         edge_types: dict[str, type[BaseModel]] | None,
         edge_type_map: dict[tuple[str, str], list[str]],
         episodes: list[EpisodicNode],
+        attribute_batch_size: int | None = None,
+        edge_resolution_batch_size: int | None = None,
     ) -> tuple[list[EntityNode], list[EntityEdge], list[EntityEdge], dict[str, str]]:
         """Resolve nodes and edges against the existing graph."""
         nodes_by_uuid: dict[str, EntityNode] = {
@@ -534,6 +597,7 @@ class Graphiti:
                     episode,
                     previous_episodes,
                     entity_types,
+                    batch_size=attribute_batch_size,
                 )
                 for episode, previous_episodes in episode_context
             ]
@@ -562,6 +626,7 @@ class Graphiti:
                     final_hydrated_nodes,
                     edge_types or {},
                     edge_type_map,
+                    batch_size=edge_resolution_batch_size,
                 )
                 for episode in episodes
             ]
@@ -575,6 +640,83 @@ class Graphiti:
 
         return final_hydrated_nodes, resolved_edges, invalidated_edges, uuid_map
 
+    def _invalidate_search_cache(self, group_ids: Iterable[str] | None):
+        if self.search_cache is not None:
+            self.search_cache.invalidate(group_ids)
+
+    def _apply_graph_snapshot_edges(
+        self, entity_edges: list[EntityEdge], episodic_edges: list[EpisodicEdge]
+    ):
+        if self.graph_snapshots is not None:
+            self.graph_snapshots.add_edges(entity_edges, episodic_edges)
+
+    async def _cached_search(
+        self,
+        query: str,
+        group_ids: list[str] | None,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        driver: GraphDriver | None = None,
+    ) -> SearchResults:
+        if self.search_cache is None:
+            return await search(
+                self.clients,
+                query,
+                group_ids,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                driver=driver,
+            )
+
+        key = SearchCache.key(
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            getattr(driver or self.driver, '_database', None),
+        )
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        versions = self.search_cache.versions(group_ids)
+        results = await search(
+            self.clients,
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            driver=driver,
+        )
+        self.search_cache.set(key, results, versions)
+        return results
+
+    def with_group(self, group_id: str) -> 'Graphiti':
+        """
+        Return a Graphiti scoped to the database that holds group_id.
+
+        For providers that keep one database per group (FalkorDB) this is a shallow copy
+        sharing clients and caches but holding its own driver, so concurrent calls for
+        different groups never swap the driver out from under each other. For other
+        providers it returns self.
+        """
+        driver = self.driver.clone(database=group_id)
+        if driver is self.driver:
+            return self
+
+        scoped = copy.copy(self)
+        scoped.driver = driver
+        scoped.clients = self.clients.model_copy(update={'driver': driver})
+        return scoped
+
     @handle_multiple_group_ids
     async def retrieve_episodes(
         self,
@@ -630,6 +772,8 @@ class Graphiti:
         edge_types: dict[str, type[BaseModel]] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
         custom_prompt: str = '',
+        attribute_batch_size: int | None = None,
+        edge_resolution_batch_size: int | None = None,
     ) -> AddEpisodeResults:
         """
         Process an episode and update the graph.
@@ -664,6 +808,12 @@ class Graphiti:
         previous_episode_uuids : list[str] | None
             Optional.  list of episode uuids to use as the previous episodes. If this is not provided,
             the most recent episodes by created_at date will be used.
+        attribute_batch_size : int | None
+            Optional. Extract attributes and summaries for this many nodes per LLM call instead of
+            two calls per node. Nodes whose batched result fails validation are retried one by one.
+        edge_resolution_batch_size : int | None
+            Optional. Resolve this many extracted edges against the graph per LLM call instead of
+            one call per edge. Edges missing from the batched result are retried one by one.
 
         Returns
         -------
@@ -676,9 +826,11 @@ class Graphiti:
         and edge invalidation.
 
         It is recommended to run this method as a background process, such as in a queue.
-        It's important that each episode is added sequentially and awaited before adding
-        the next one. For web applications, consider using FastAPI's background tasks
-        or a dedicated task queue like Celery for this purpose.
+        It's important that episodes in the same group are added sequentially, each awaited
+        before adding the next one. Episodes for different groups may run concurrently;
+        `IngestionScheduler` enforces this ordering for you. For web applications, consider
+        using FastAPI's background tasks or a dedicated task queue like Celery for this
+        purpose.
 
         Example using FastAPI background tasks:
             @app.post("/add_episode")
@@ -698,11 +850,30 @@ class Graphiti:
             group_id = get_default_group_id(self.driver.provider)
         else:
             validate_group_id(group_id)
-            if group_id != self.driver._database:
+            scoped = self.with_group(group_id)
+            if scoped is not self:
                 # if group_id is provided, use it as the database name
-                self.driver = self.driver.clone(database=group_id)
-                self.clients.driver = self.driver
+                return await scoped.add_episode(
+                    name=name,
+                    episode_body=episode_body,
+                    source_description=source_description,
+                    reference_time=reference_time,
+                    source=source,
+                    group_id=group_id,
+                    uuid=uuid,
+                    update_communities=update_communities,
+                    entity_types=entity_types,
+                    excluded_entity_types=excluded_entity_types,
+                    previous_episode_uuids=previous_episode_uuids,
+                    edge_types=edge_types,
+                    edge_type_map=edge_type_map,
+                    custom_prompt=custom_prompt,
+                    attribute_batch_size=attribute_batch_size,
+                    edge_resolution_batch_size=edge_resolution_batch_size,
+                )
 
+        # Builds indices on the first write to a database, then costs a cache lookup
+        await self.driver.ensure_schema()
         with self.tracer.start_span('add_episode') as span:
             try:
                 # Retrieve previous episodes for context
@@ -769,11 +940,17 @@ class Graphiti:
                     nodes,
                     uuid_map,
                     custom_prompt,
+                    edge_resolution_batch_size,
                 )
 
                 # Extract node attributes
                 hydrated_nodes = await extract_attributes_from_nodes(
-                    self.clients, nodes, episode, previous_episodes, entity_types
+                    self.clients,
+                    nodes,
+                    episode,
+                    previous_episodes,
+                    entity_types,
+                    batch_size=attribute_batch_size,
                 )
 
                 entity_edges = resolved_edges + invalidated_edges
@@ -831,6 +1008,152 @@ class Graphiti:
                 span.set_status('error', str(e))
                 span.record_exception(e)
                 raise e
+            finally:
+                self._invalidate_search_cache([group_id])
+
+    async def _extract_bulk_window(
+        self,
+        bulk_episodes: list[RawEpisode],
+        group_id: str,
+        now: datetime,
+        entity_types: dict[str, type[BaseModel]] | None,
+        excluded_entity_types: list[str] | None,
+        edge_types: dict[str, type[BaseModel]] | None,
+        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_resolution_batch_size: int | None = None,
+    ) -> BulkWindowExtraction:
+        """Save a window of episodes, then extract and dedupe its nodes and edges in memory."""
+        # Fetch all pre-existing episodes in one round trip
+        existing_episode_uuids = [
+            episode.uuid for episode in bulk_episodes if episode.uuid is not None
+        ]
+        existing_episodes = {
+            episode.uuid: episode
+            for episode in (
+                await EpisodicNode.get_by_uuids(self.driver, existing_episode_uuids)
+                if existing_episode_uuids
+                else []
+            )
+        }
+        for episode_uuid in existing_episode_uuids:
+            if episode_uuid not in existing_episodes:
+                raise NodeNotFoundError(episode_uuid)
+
+        episodes = [
+            existing_episodes[episode.uuid]
+            if episode.uuid is not None
+            else EpisodicNode(
+                name=episode.name,
+                labels=[],
+                source=episode.source,
+                content=episode.content,
+                source_description=episode.source_description,
+                group_id=group_id,
+                created_at=now,
+                valid_at=episode.reference_time,
+            )
+            for episode in bulk_episodes
+        ]
+
+        # Save all episodes
+        await add_nodes_and_edges_bulk(
+            driver=self.driver,
+            episodic_nodes=episodes,
+            episodic_edges=[],
+            entity_nodes=[],
+            entity_edges=[],
+            embedder=self.embedder,
+        )
+
+        # Get previous episode context for each episode
+        episode_context = await retrieve_previous_episodes_bulk(self.driver, episodes)
+
+        # Extract and dedupe nodes and edges
+        (
+            nodes_by_episode,
+            uuid_map,
+            extracted_edges_bulk,
+        ) = await self._extract_and_dedupe_nodes_bulk(
+            episode_context,
+            edge_type_map,
+            edge_types,
+            entity_types,
+            excluded_entity_types,
+        )
+
+        # Create Episodic Edges
+        episodic_edges: list[EpisodicEdge] = []
+        for episode_uuid, nodes in nodes_by_episode.items():
+            episodic_edges.extend(build_episodic_edges(nodes, episode_uuid, now))
+
+        # Re-map edge pointers and dedupe edges
+        extracted_edges_bulk_updated: list[list[EntityEdge]] = [
+            resolve_edge_pointers(edges, uuid_map) for edges in extracted_edges_bulk
+        ]
+
+        edges_by_episode = await dedupe_edges_bulk(
+            self.clients,
+            extracted_edges_bulk_updated,
+            episode_context,
+            [],
+            edge_types or {},
+            edge_type_map,
+            edge_resolution_batch_size,
+        )
+
+        return BulkWindowExtraction(
+            episodes=episodes,
+            episode_context=episode_context,
+            nodes_by_episode=nodes_by_episode,
+            edges_by_episode=edges_by_episode,
+            episodic_edges=episodic_edges,
+        )
+
+    async def _resolve_and_save_bulk_window(
+        self,
+        extraction: BulkWindowExtraction,
+        entity_types: dict[str, type[BaseModel]] | None,
+        edge_types: dict[str, type[BaseModel]] | None,
+        edge_type_map: dict[tuple[str, str], list[str]],
+        attribute_batch_size: int | None = None,
+        edge_resolution_batch_size: int | None = None,
+    ) -> tuple[list[EntityNode], list[EntityEdge], list[EntityEdge], list[EpisodicEdge]]:
+        """Resolve an extracted window against the existing graph and write it."""
+        # Resolve nodes and edges against the existing graph
+        (
+            final_hydrated_nodes,
+            resolved_edges,
+            invalidated_edges,
+            final_uuid_map,
+        ) = await self._resolve_nodes_and_edges_bulk(
+            extraction.nodes_by_episode,
+            extraction.edges_by_episode,
+            extraction.episode_context,
+            entity_types,
+            edge_types,
+            edge_type_map,
+            extraction.episodes,
+            attribute_batch_size,
+            edge_resolution_batch_size,
+        )
+
+        # Resolved pointers for episodic edges
+        resolved_episodic_edges = resolve_edge_pointers(extraction.episodic_edges, final_uuid_map)
+
+        # save data to KG
+        await add_nodes_and_edges_bulk(
+            self.driver,
+            extraction.episodes,
+            resolved_episodic_edges,
+            final_hydrated_nodes,
+            resolved_edges + invalidated_edges,
+            self.embedder,
+        )
+        self._apply_graph_snapshot_edges(
+            resolved_edges + invalidated_edges, resolved_episodic_edges
+        )
+
+        return final_hydrated_nodes, resolved_edges, invalidated_edges, resolved_episodic_edges
 
     async def add_episode_bulk(
         self,
@@ -841,6 +1164,8 @@ class Graphiti:
         edge_types: dict[str, type[BaseModel]] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
         custom_prompt: str = '',
+        attribute_batch_size: int | None = None,
+        edge_resolution_batch_size: int | None = None,
     ) -> AddBulkEpisodeResults:
         """
         Process multiple episodes in bulk and update the graph.
@@ -854,6 +1179,11 @@ class Graphiti:
             A list of RawEpisode objects to be processed and added to the graph.
         group_id : str | None
             An id for the graph partition the episode is a part of.
+        attribute_batch_size : int | None
+            Optional. Extract attributes and summaries for this many nodes per LLM call instead of
+            two calls per node.
+        edge_resolution_batch_size : int | None
+            Optional. Dedupe this many extracted edges per LLM call instead of one call per edge.
 
         Returns
         -------
@@ -878,6 +1208,27 @@ class Graphiti:
         If these operations are required, use the `add_episode` method instead for each
         individual episode.
         """
+        # if group_id is None, use the default group id by the provider
+        if group_id is None:
+            group_id = get_default_group_id(self.driver.provider)
+        else:
+            validate_group_id(group_id)
+            scoped = self.with_group(group_id)
+            if scoped is not self:
+                # if group_id is provided, use it as the database name
+                return await scoped.add_episode_bulk(
+                    bulk_episodes,
+                    group_id=group_id,
+                    entity_types=entity_types,
+                    excluded_entity_types=excluded_entity_types,
+                    edge_types=edge_types,
+                    edge_type_map=edge_type_map,
+                    custom_prompt=custom_prompt,
+                    attribute_batch_size=attribute_batch_size,
+                    edge_resolution_batch_size=edge_resolution_batch_size,
+                )
+
+        await self.driver.ensure_schema()
         with self.tracer.start_span('add_episode_bulk') as bulk_span:
             bulk_span.add_attributes({'episode.count': len(bulk_episodes)})
 
@@ -885,16 +1236,6 @@ class Graphiti:
                 start = time()
                 now = utc_now()
 
-                # if group_id is None, use the default group id by the provider
-                if group_id is None:
-                    group_id = get_default_group_id(self.driver.provider)
-                else:
-                    validate_group_id(group_id)
-                    if group_id != self.driver._database:
-                        # if group_id is provided, use it as the database name
-                        self.driver = self.driver.clone(database=group_id)
-                        self.clients.driver = self.driver
-
                 # Create default edge type map
                 edge_type_map_default = (
                     {('Entity', 'Entity'): list(edge_types.keys())}
@@ -902,95 +1243,31 @@ class Graphiti:
                     else {('Entity', 'Entity'): []}
                 )
 
-                episodes = [
-                    await EpisodicNode.get_by_uuid(self.driver, episode.uuid)
-                    if episode.uuid is not None
-                    else EpisodicNode(
-                        name=episode.name,
-                        labels=[],
-                        source=episode.source,
-                        content=episode.content,
-                        source_description=episode.source_description,
-                        group_id=group_id,
-                        created_at=now,
-                        valid_at=episode.reference_time,
-                    )
-                    for episode in bulk_episodes
-                ]
-
-                # Save all episodes
-                await add_nodes_and_edges_bulk(
-                    driver=self.driver,
-                    episodic_nodes=episodes,
-                    episodic_edges=[],
-                    entity_nodes=[],
-                    entity_edges=[],
-                    embedder=self.embedder,
-                )
-
-                # Get previous episode context for each episode
-                episode_context = await retrieve_previous_episodes_bulk(self.driver, episodes)
-
-                # Extract and dedupe nodes and edges
-                (
-                    nodes_by_episode,
-                    uuid_map,
-                    extracted_edges_bulk,
-                ) = await self._extract_and_dedupe_nodes_bulk(
-                    episode_context,
-                    edge_type_map or edge_type_map_default,
-                    edge_types,
+                extraction = await self._extract_bulk_window(
+                    bulk_episodes,
+                    group_id,
+                    now,
                     entity_types,
                     excluded_entity_types,
-                )
-
-                # Create Episodic Edges
-                episodic_edges: list[EpisodicEdge] = []
-                for episode_uuid, nodes in nodes_by_episode.items():
-                    episodic_edges.extend(build_episodic_edges(nodes, episode_uuid, now))
-
-                # Re-map edge pointers and dedupe edges
-                extracted_edges_bulk_updated: list[list[EntityEdge]] = [
-                    resolve_edge_pointers(edges, uuid_map) for edges in extracted_edges_bulk
-                ]
-
-                edges_by_episode = await dedupe_edges_bulk(
-                    self.clients,
-                    extracted_edges_bulk_updated,
-                    episode_context,
-                    [],
-                    edge_types or {},
+                    edge_types,
                     edge_type_map or edge_type_map_default,
+                    edge_resolution_batch_size,
                 )
 
-                # Resolve nodes and edges against the existing graph
                 (
                     final_hydrated_nodes,
                     resolved_edges,
                     invalidated_edges,
-                    final_uuid_map,
-                ) = await self._resolve_nodes_and_edges_bulk(
-                    nodes_by_episode,
-                    edges_by_episode,
-                    episode_context,
+                    resolved_episodic_edges,
+                ) = await self._resolve_and_save_bulk_window(
+                    extraction,
                     entity_types,
                     edge_types,
                     edge_type_map or edge_type_map_default,
-                    episodes,
-                )
-
-                # Resolved pointers for episodic edges
-                resolved_episodic_edges = resolve_edge_pointers(episodic_edges, final_uuid_map)
-
-                # save data to KG
-                await add_nodes_and_edges_bulk(
-                    self.driver,
-                    episodes,
-                    resolved_episodic_edges,
-                    final_hydrated_nodes,
-                    resolved_edges + invalidated_edges,
-                    self.embedder,
+                    attribute_batch_size,
+                    edge_resolution_batch_size,
                 )
+                episodes = extraction.episodes
 
                 end = time()
 
@@ -1019,10 +1296,216 @@ class Graphiti:
                 bulk_span.set_status('error', str(e))
                 bulk_span.record_exception(e)
                 raise e
+            finally:
+                self._invalidate_search_cache([group_id])
+
+    async def add_episode_bulk_stream(
+        self,
+        bulk_episodes: Iterable[RawEpisode] | AsyncIterable[RawEpisode],
+        group_id: str | None = None,
+        entity_types: dict[str, type[BaseModel]] | None = None,
+        excluded_entity_types: list[str] | None = None,
+        edge_types: dict[str, type[BaseModel]] | None = None,
+        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        window_size: int = STREAM_WINDOW_SIZE,
+        progress_callback: AddEpisodeStreamProgressCallback | None = None,
+        attribute_batch_size: int | None = None,
+        edge_resolution_batch_size: int | None = None,
+    ) -> AddEpisodeStreamResults:
+        """
+        Stream episodes into the graph in bounded windows.
+
+        Episodes are consumed window_size at a time. Extraction of the next window overlaps
+        with resolution and writes of the current one, while windows are still resolved and
+        committed in order so later windows see the entities written by earlier ones. Only
+        one extracted window is buffered ahead, so memory stays bounded regardless of how
+        many episodes the source yields.
+
+        Parameters
+        ----------
+        bulk_episodes : Iterable[RawEpisode] | AsyncIterable[RawEpisode]
+            A sync or async source of RawEpisode objects.
+        group_id : str | None
+            An id for the graph partition the episodes are a part of.
+        window_size : int
+            Number of episodes processed per window.
+        progress_callback : AddEpisodeStreamProgressCallback | None
+            Called with an AddEpisodeStreamProgress after each window is committed.
+        attribute_batch_size : int | None
+            Optional. Extract attributes and summaries for this many nodes per LLM call.
+        edge_resolution_batch_size : int | None
+            Optional. Dedupe and resolve this many extracted edges per LLM call.
+
+        Returns
+        -------
+        AddEpisodeStreamResults
+            Counts for the whole stream. Nodes and edges are not accumulated in memory.
+
+        Notes
+        -----
+        Within a window this behaves like `add_episode_bulk`, so edge invalidation and date
+        extraction are not performed.
+        """
+        # if group_id is None, use the default group id by the provider
+        if group_id is None:
+            group_id = get_default_group_id(self.driver.provider)
+        else:
+            validate_group_id(group_id)
+            scoped = self.with_group(group_id)
+            if scoped is not self:
+                # if group_id is provided, use it as the database name
+                return await scoped.add_episode_bulk_stream(
+                    bulk_episodes,
+                    group_id=group_id,
+                    entity_types=entity_types,
+                    excluded_entity_types=excluded_entity_types,
+                    edge_types=edge_types,
+                    edge_type_map=edge_type_map,
+                    window_size=window_size,
+                    progress_callback=progress_callback,
+                    attribute_batch_size=attribute_batch_size,
+                    edge_resolution_batch_size=edge_resolution_batch_size,
+                )
+
+        await self.driver.ensure_schema()
+        with self.tracer.start_span('add_episode_bulk_stream') as stream_span:
+            try:
+                start = time()
+
+                edge_type_map = edge_type_map or (
+                    {('Entity', 'Entity'): list(edge_types.keys())}
+                    if edge_types is not None
+                    else {('Entity', 'Entity'): []}
+                )
+
+                queue: asyncio.Queue[tuple[BulkWindowExtraction, float] | Exception | None] = (
+                    asyncio.Queue(maxsize=1)
+                )
+
+                async def extract_windows():
+                    try:
+                        async for window in iterate_episode_windows(bulk_episodes, window_size):
+                            extraction_start = time()
+                            extraction = await self._extract_bulk_window(
+                                window,
+                                group_id,
+                                utc_now(),
+                                entity_types,
+                                excluded_entity_types,
+                                edge_types,
+                                edge_type_map,
+                                edge_resolution_batch_size,
+                            )
+                            await queue.put((extraction, (time() - extraction_start) * 1000))
+                        await queue.put(None)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        await queue.put(e)
+
+                producer = asyncio.create_task(extract_windows())
+
+                window_index = 0
+                episode_uuids: list[str] = []
+                total_nodes = 0
+                total_edges = 0
+                try:
+                    while (item := await queue.get()) is not None:
+                        if isinstance(item, Exception):
+                            raise item
+                        extraction, extraction_ms = item
+
+                        with self.tracer.start_span('add_episode_bulk_stream.window') as span:
+                            resolution_start = time()
+                            (
+                                nodes,
+                                resolved_edges,
+                                invalidated_edges,
+                                _,
+                            ) = await self._resolve_and_save_bulk_window(
+                                extraction,
+                                entity_types,
+                                edge_types,
+                                edge_type_map,
+                                attribute_batch_size,
+                                edge_resolution_batch_size,
+                            )
+                            resolution_ms = (time() - resolution_start) * 1000
+                            # Each window is committed, so readers should see it right away
+                            self._invalidate_search_cache([group_id])
+
+                            episode_uuids.extend(episode.uuid for episode in extraction.episodes)
+                            total_nodes += len(nodes)
+                            total_edges += len(resolved_edges) + len(invalidated_edges)
+                            progress = AddEpisodeStreamProgress(
+                                window_index=window_index,
+                                episode_count=len(extraction.episodes),
+                                node_count=len(nodes),
+                                edge_count=len(resolved_edges) + len(invalidated_edges),
+                                extraction_ms=extraction_ms,
+                                resolution_ms=resolution_ms,
+                                total_episodes=len(episode_uuids),
+                                total_nodes=total_nodes,
+                                total_edges=total_edges,
+                            )
+                            span.add_attributes(
+                                {
+                                    'window.index': window_index,
+                                    'episode.count': progress.episode_count,
+                                    'node.count': progress.node_count,
+                                    'edge.count': progress.edge_count,
+                                    'extraction_ms': extraction_ms,
+                                    'resolution_ms': resolution_ms,
+                                }
+                            )
+
+                        if progress_callback is not None:
+                            progress_callback(progress)
+                        window_index += 1
+                finally:
+                    if not producer.done():
+                        producer.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await producer
+
+                end = time()
+
+                stream_span.add_attributes(
+                    {
+                        'group_id': group_id,
+                        'window.count': window_index,
+                        'episode.count': len(episode_uuids),
+                        'node.count': total_nodes,
+                        'edge.count': total_edges,
+                        'duration_ms': (end - start) * 1000,
+                    }
+                )
+
+                logger.info(
+                    f'Completed add_episode_bulk_stream of {len(episode_uuids)} episodes '
+                    f'in {window_index} windows in {(end - start) * 1000} ms'
+                )
+
+                return AddEpisodeStreamResults(
+                    window_count=window_index,
+                    episode_uuids=episode_uuids,
+                    node_count=total_nodes,
+                    edge_count=total_edges,
+                )
+
+            except Exception as e:
+                stream_span.set_status('error', str(e))
+                stream_span.record_exception(e)
+                raise e
+            finally:
+                self._invalidate_search_cache([group_id])
 
     @handle_multiple_group_ids
     async def build_communities(
-        self, group_ids: list[str] | None = None, driver: GraphDriver | None = None
+        self,
+        group_ids: list[str] | None = None,
+        driver: GraphDriver | None = None,
+        community_detection: CommunityDetectionMethod = CommunityDetectionMethod.label_propagation,
     ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
         """
         Use a community clustering algorithm to find communities of nodes. Create community nodes summarising
@@ -1030,34 +1513,49 @@ class Graphiti:
         ----------
         group_ids : list[str] | None
             Optional. Create communities only for the listed group_ids. If blank the entire graph will be used.
+        community_detection : CommunityDetectionMethod
+            Optional. The clustering algorithm to use. Defaults to label propagation; Leiden and Louvain
+            require the `community` extra.
         """
         if driver is None:
             driver = self.clients.driver
 
-        # Clear existing communities
-        await remove_communities(driver)
-
-        community_nodes, community_edges = await build_communities(
-            driver, self.llm_client, group_ids
-        )
+        await driver.ensure_schema()
+        with self.tracer.start_span('build_communities') as span:
+            try:
+                # Clear existing communities
+                await remove_communities(driver)
+
+                community_nodes, community_edges = await build_communities(
+                    driver,
+                    self.llm_client,
+                    group_ids,
+                    community_detection,
+                    summary_cache=self.community_summary_cache,
+                )
 
-        await semaphore_gather(
-            *[node.generate_name_embedding(self.embedder) for node in community_nodes],
-            max_coroutines=self.max_coroutines,
-        )
+                await semaphore_gather(
+                    *[node.generate_name_embedding(self.embedder) for node in community_nodes],
+                    max_coroutines=self.max_coroutines,
+                )
 
-        await semaphore_gather(
-            *[node.save(driver) for node in community_nodes],
-            max_coroutines=self.max_coroutines,
-        )
-        await semaphore_gather(
-            *[edge.save(driver) for edge in community_edges],
-            max_coroutines=self.max_coroutines,
-        )
+                await semaphore_gather(
+                    *[node.save(driver) for node in community_nodes],
+                    max_coroutines=self.max_coroutines,
+                )
+                await semaphore_gather(
+                    *[edge.save(driver) for edge in community_edges],
+                    max_coroutines=self.max_coroutines,
+                )
+                span.add_attributes(
+                    {'community.count': len(community_nodes), 'edge.count': len(community_edges)}
+                )
+            finally:
+                # Communities are removed across every group before they are rebuilt
+                self._invalidate_search_cache(None)
 
         return community_nodes, community_edges
 
-    @handle_multiple_group_ids
     async def search(
         self,
         query: str,
@@ -1102,22 +1600,17 @@ class Graphiti:
         """
         search_config = (
             EDGE_HYBRID_SEARCH_RRF if center_node_uuid is None else EDGE_HYBRID_SEARCH_NODE_DISTANCE
-        )
-        search_config.limit = num_results
-
-        edges = (
-            await search(
-                self.clients,
-                query,
-                group_ids,
-                search_config,
-                search_filter if search_filter is not None else SearchFilters(),
-                driver=driver,
-                center_node_uuid=center_node_uuid,
-            )
-        ).edges
+        ).model_copy(update={'limit': num_results})
 
-        return edges
+        results = await self.search_(
+            query,
+            config=search_config,
+            group_ids=group_ids,
+            center_node_uuid=center_node_uuid,
+            search_filter=search_filter,
+            driver=driver,
+        )
+        return results.edges
 
     async def _search(
         self,
@@ -1133,7 +1626,7 @@ class Graphiti:
             query, config, group_ids, center_node_uuid, bfs_origin_node_uuids, search_filter
         )
 
-    @handle_multiple_group_ids
+    @scatter_gather_group_ids
     async def search_(
         self,
         query: str,
@@ -1151,16 +1644,16 @@ class Graphiti:
         For different config recipes refer to search/search_config_recipes.
         """
 
-        return await search(
-            self.clients,
-            query,
-            group_ids,
-            config,
-            search_filter if search_filter is not None else SearchFilters(),
-            center_node_uuid,
-            bfs_origin_node_uuids,
-            driver=driver,
-        )
+        with self.tracer.start_span('search'):
+            return await self._cached_search(
+                query,
+                group_ids,
+                config,
+                search_filter if search_filter is not None else SearchFilters(),
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                driver=driver,
+            )
 
     async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
         episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
@@ -1179,6 +1672,7 @@ class Graphiti:
     async def add_triplet(
         self, source_node: EntityNode, edge: EntityEdge, target_node: EntityNode
     ) -> AddTripletResults:
+        await self.driver.ensure_schema()
         if source_node.name_embedding is None:
             await source_node.generate_name_embedding(self.embedder)
         if target_node.name_embedding is None:
@@ -1239,35 +1733,50 @@ class Graphiti:
         await create_entity_edge_embeddings(self.embedder, edges)
         await create_entity_node_embeddings(self.embedder, nodes)
 
-        await add_nodes_and_edges_bulk(self.driver, [], [], nodes, edges, self.embedder)
+        try:
+            await add_nodes_and_edges_bulk(self.driver, [], [], nodes, edges, self.embedder)
+            self._apply_graph_snapshot_edges(edges, [])
+        finally:
+            self._invalidate_search_cache({item.group_id for item in [*nodes, *edges]})
         return AddTripletResults(edges=edges, nodes=nodes)
 
     async def remove_episode(self, episode_uuid: str):
         # Find the episode to be deleted
         episode = await EpisodicNode.get_by_uuid(self.driver, episode_uuid)
 
-        # Find edges mentioned by the episode
-        edges = await EntityEdge.get_by_uuids(self.driver, episode.entity_edges)
+        await self._remove_episodes([episode])
 
-        # We should only delete edges created by the episode
-        edges_to_delete: list[EntityEdge] = []
-        for edge in edges:
-            if edge.episodes and edge.episodes[0] == episode.uuid:
-                edges_to_delete.append(edge)
+    async def remove_episodes(self, episode_uuids: list[str]):
+        """
+        Remove many episodes in one pass.
 
-        # Find nodes mentioned by the episode
-        nodes = await get_mentioned_nodes(self.driver, [episode])
-        # We should delete all nodes that are only mentioned in the deleted episode
-        nodes_to_delete: list[EntityNode] = []
-        for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
+        Deletes the episodes, the entity edges they created and the entity nodes that are not
+        mentioned by any remaining episode. Unknown uuids are ignored.
+        """
+        if not episode_uuids:
+            return
 
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
+        episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
 
-        await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
-        await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
+        await self._remove_episodes(episodes)
 
-        await episode.delete(self.driver)
+    async def _remove_episodes(self, episodes: list[EpisodicNode]):
+        if not episodes:
+            return
+
+        # Find edges created by these episodes and nodes only mentioned by them in one round trip
+        node_uuids, edge_uuids = await get_episode_removal_targets(self.driver, episodes)
+
+        try:
+            if edge_uuids:
+                await Edge.delete_by_uuids(self.driver, edge_uuids)
+            if node_uuids:
+                await Node.delete_by_uuids(self.driver, node_uuids)
+
+            await Node.delete_by_uuids(self.driver, [episode.uuid for episode in episodes])
+        finally:
+            group_ids = {episode.group_id for episode in episodes}
+            self._invalidate_search_cache(group_ids)
+            if self.graph_snapshots is not None:
+                # Deletions are not applied incrementally, the groups are reloaded on next use
+                self.graph_snapshots.invalidate(group_ids)
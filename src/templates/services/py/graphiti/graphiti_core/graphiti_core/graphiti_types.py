@@ -20,6 +20,7 @@ from graphiti_core.cross_encoder import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.llm_client import LLMClient
+from graphiti_core.search.graph_snapshot import GraphSnapshotStore
 from graphiti_core.tracer import Tracer
 
 
@@ -29,5 +30,6 @@ class GraphitiClients(BaseModel):
     embedder: EmbedderClient
     cross_encoder: CrossEncoderClient
     tracer: Tracer
+    graph_snapshots: GraphSnapshotStore | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
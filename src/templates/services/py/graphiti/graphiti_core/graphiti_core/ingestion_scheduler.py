@@ -0,0 +1,225 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from datetime import datetime
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict
+
+from graphiti_core.helpers import get_default_group_id, validate_group_id
+
+if TYPE_CHECKING:
+    from graphiti_core.graphiti import AddEpisodeResults, Graphiti
+
+logger = logging.getLogger(__name__)
+
+INGESTION_CONCURRENCY = int(os.getenv('INGESTION_CONCURRENCY', 4))
+
+
+class GroupIngestionMetrics(BaseModel):
+    group_id: str
+    queue_depth: int
+    running: bool
+    lag_seconds: float
+    completed: int
+    failed: int
+
+
+class IngestionMetrics(BaseModel):
+    queue_depth: int
+    running: int
+    active_groups: int
+    completed: int
+    failed: int
+    groups: list[GroupIngestionMetrics]
+
+
+class _IngestionJob(BaseModel):
+    kwargs: dict[str, Any]
+    future: asyncio.Future
+    enqueued_at: float
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class _GroupState:
+    def __init__(self):
+        self.pending: deque[_IngestionJob] = deque()
+        self.running: _IngestionJob | None = None
+        self.worker: asyncio.Task | None = None
+        self.completed = 0
+        self.failed = 0
+
+    def lag_seconds(self, now: float) -> float:
+        oldest = self.running or (self.pending[0] if self.pending else None)
+        return now - oldest.enqueued_at if oldest is not None else 0.0
+
+
+class IngestionScheduler:
+    """
+    Runs add_episode for many groups concurrently while keeping each group in FIFO order.
+
+    Episodes within a group are processed one at a time, in submission order, because each
+    episode is extracted against the ones before it. Different groups run concurrently, up to
+    max_concurrency episodes in flight at once. Each call is scoped to its group through
+    `Graphiti.with_group`, so a single Graphiti instance can be shared across tenants.
+    """
+
+    def __init__(self, graphiti: 'Graphiti', max_concurrency: int = INGESTION_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+
+        self.graphiti = graphiti
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._groups: dict[str, _GroupState] = {}
+        self._completed = 0
+        self._failed = 0
+
+    def submit(
+        self,
+        name: str,
+        episode_body: str,
+        source_description: str,
+        reference_time: datetime,
+        group_id: str | None = None,
+        **kwargs: Any,
+    ) -> 'asyncio.Future[AddEpisodeResults]':
+        """
+        Queue an episode for its group and return a future for its AddEpisodeResults.
+
+        Extra keyword arguments are passed through to `Graphiti.add_episode`.
+        """
+        if group_id is None:
+            group_id = get_default_group_id(self.graphiti.driver.provider)
+        else:
+            validate_group_id(group_id)
+
+        job = _IngestionJob(
+            kwargs={
+                'name': name,
+                'episode_body': episode_body,
+                'source_description': source_description,
+                'reference_time': reference_time,
+                'group_id': group_id,
+                **kwargs,
+            },
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=monotonic(),
+        )
+
+        state = self._groups.setdefault(group_id, _GroupState())
+        state.pending.append(job)
+        if state.worker is None:
+            state.worker = asyncio.create_task(self._run_group(group_id, state))
+
+        return job.future
+
+    async def add_episode(
+        self,
+        name: str,
+        episode_body: str,
+        source_description: str,
+        reference_time: datetime,
+        group_id: str | None = None,
+        **kwargs: Any,
+    ) -> 'AddEpisodeResults':
+        """Submit an episode and wait for it to be processed."""
+        return await self.submit(
+            name, episode_body, source_description, reference_time, group_id, **kwargs
+        )
+
+    async def _run_group(self, group_id: str, state: _GroupState):
+        graphiti = self.graphiti.with_group(group_id)
+        try:
+            while state.pending:
+                job = state.pending.popleft()
+                if job.future.cancelled():
+                    continue
+
+                # The slot is taken per episode so busy groups cannot starve the others
+                async with self._semaphore:
+                    state.running = job
+                    try:
+                        result = await graphiti.add_episode(**job.kwargs)
+                    except Exception as e:
+                        state.failed += 1
+                        self._failed += 1
+                        logger.error(f'Ingestion failed for group {group_id}: {e}')
+                        if not job.future.cancelled():
+                            job.future.set_exception(e)
+                    else:
+                        state.completed += 1
+                        self._completed += 1
+                        if not job.future.cancelled():
+                            job.future.set_result(result)
+                    finally:
+                        state.running = None
+        finally:
+            state.worker = None
+            if not state.pending:
+                self._groups.pop(group_id, None)
+
+    def metrics(self) -> IngestionMetrics:
+        """Return queue depth and per-group lag for groups with pending or running episodes."""
+        now = monotonic()
+        groups = [
+            GroupIngestionMetrics(
+                group_id=group_id,
+                queue_depth=len(state.pending),
+                running=state.running is not None,
+                lag_seconds=state.lag_seconds(now),
+                completed=state.completed,
+                failed=state.failed,
+            )
+            for group_id, state in self._groups.items()
+        ]
+
+        return IngestionMetrics(
+            queue_depth=sum(group.queue_depth for group in groups),
+            running=sum(1 for group in groups if group.running),
+            active_groups=len(groups),
+            completed=self._completed,
+            failed=self._failed,
+            groups=groups,
+        )
+
+    async def drain(self):
+        """Wait until every submitted episode has been processed."""
+        while self._groups:
+            workers = [state.worker for state in self._groups.values() if state.worker]
+            if not workers:
+                return
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def close(self):
+        """Cancel pending episodes and stop all group workers."""
+        for state in self._groups.values():
+            jobs = [*state.pending, state.running] if state.running else list(state.pending)
+            for job in jobs:
+                job.future.cancel()
+            state.pending.clear()
+            if state.worker is not None:
+                state.worker.cancel()
+
+        workers = [state.worker for state in self._groups.values() if state.worker]
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._groups.clear()
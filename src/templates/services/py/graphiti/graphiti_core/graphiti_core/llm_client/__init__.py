@@ -17,6 +17,14 @@ limitations under the License.
 from .client import LLMClient
 from .config import LLMConfig
 from .errors import RateLimitError
+from .metrics import LLMMetricsSnapshot, llm_metrics
 from .openai_client import OpenAIClient
 
-__all__ = ['LLMClient', 'OpenAIClient', 'LLMConfig', 'RateLimitError']
+__all__ = [
+    'LLMClient',
+    'OpenAIClient',
+    'LLMConfig',
+    'RateLimitError',
+    'LLMMetricsSnapshot',
+    'llm_metrics',
+]
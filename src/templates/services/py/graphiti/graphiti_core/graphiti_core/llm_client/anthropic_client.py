@@ -116,6 +116,10 @@ class AnthropicClient(LLMClient):
     Notes:
         - If a LLMConfig is not provided, api_key will be pulled from the ANTHROPIC_API_KEY environment
             variable, and all default values will be used for the LLMConfig.
+        - With prompt_cache enabled the tool schema and system prompt are marked with
+            cache_control, so repeated prompts over the same ontology are served from
+            Anthropic's prompt cache. Prefixes below the model's minimum cacheable length are
+            sent uncached by the API.
 
     """
 
@@ -127,6 +131,7 @@ class AnthropicClient(LLMClient):
         cache: bool = False,
         client: AsyncAnthropic | None = None,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        prompt_cache: bool = True,
     ) -> None:
         if config is None:
             config = LLMConfig()
@@ -148,6 +153,8 @@ class AnthropicClient(LLMClient):
         else:
             self.client = client
 
+        self.prompt_cache = prompt_cache
+
     def _extract_json_from_text(self, text: str) -> dict[str, typing.Any]:
         """Extract JSON from text content.
 
@@ -278,6 +285,18 @@ class AnthropicClient(LLMClient):
         user_messages = [{'role': m.role, 'content': m.content} for m in messages[1:]]
         user_messages_cast = typing.cast(list[MessageParam], user_messages)
 
+        # Tools render before the system prompt, so one breakpoint on the system block caches
+        # the tool schema, instructions and type definitions together
+        system: str | list[dict[str, typing.Any]] = system_message.content
+        if self.prompt_cache:
+            system = [
+                {
+                    'type': 'text',
+                    'text': system_message.content,
+                    'cache_control': {'type': 'ephemeral'},
+                }
+            ]
+
         # Resolve max_tokens dynamically based on the model's capabilities
         # This allows different models to use their full output capacity
         max_creation_tokens: int = self._resolve_max_tokens(max_tokens, self.model)
@@ -286,7 +305,7 @@ class AnthropicClient(LLMClient):
             # Create the appropriate tool based on whether response_model is provided
             tools, tool_choice = self._create_tool(response_model)
             result = await self.client.messages.create(
-                system=system_message.content,
+                system=system,  # type: ignore[arg-type]
                 max_tokens=max_creation_tokens,
                 temperature=self.temperature,
                 messages=user_messages_cast,
@@ -295,6 +314,20 @@ class AnthropicClient(LLMClient):
                 tool_choice=tool_choice,
             )
 
+            # Anthropic reports cache reads and writes apart from input_tokens; fold them in so
+            # input_tokens is the full prompt size as with the other providers
+            usage = result.usage
+            cache_read_tokens = getattr(usage, 'cache_read_input_tokens', 0) or 0
+            cache_creation_tokens = getattr(usage, 'cache_creation_input_tokens', 0) or 0
+            self._record_usage(
+                input_tokens=usage.input_tokens + cache_read_tokens + cache_creation_tokens,
+                output_tokens=usage.output_tokens,
+                cached_input_tokens=cache_read_tokens,
+                cache_creation_input_tokens=cache_creation_tokens,
+            )
+            if result.stop_reason == 'max_tokens':
+                self._record_truncation()
+
             # Extract the tool output from the response
             for content_item in result.content:
                 if content_item.type == 'tool_use':
@@ -319,6 +352,7 @@ class AnthropicClient(LLMClient):
             )
 
         except anthropic.RateLimitError as e:
+            self._record_rate_limit()
             raise RateLimitError(f'Rate limit exceeded. Please try again later. Error: {e}') from e
         except anthropic.APIError as e:
             # Special case for content policy violations. We convert these to RefusalError
@@ -359,11 +393,15 @@ class AnthropicClient(LLMClient):
             max_tokens = self.max_tokens
 
         # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
+        with (
+            self.tracer.start_span('llm.generate') as span,
+            self._track_usage(span, prompt_name, model_size),
+        ):
             attributes = {
                 'llm.provider': 'anthropic',
                 'model.size': model_size.value,
                 'max_tokens': max_tokens,
+                'prompt_cache.enabled': self.prompt_cache,
             }
             if prompt_name:
                 attributes['prompt.name'] = prompt_name
@@ -419,6 +457,7 @@ class AnthropicClient(LLMClient):
 
                     # Common retry logic
                     retry_count += 1
+                    self._record_retry()
                     messages.append(Message(role='user', content=error_context))
                     logger.warning(
                         f'Retrying after error (attempt {retry_count}/{max_retries}): {e}'
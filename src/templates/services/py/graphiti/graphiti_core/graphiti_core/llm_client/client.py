@@ -19,6 +19,10 @@ import json
 import logging
 import typing
 from abc import ABC, abstractmethod
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
 
 import httpx
 from diskcache import Cache
@@ -26,9 +30,10 @@ from pydantic import BaseModel
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from ..prompts.models import Message
-from ..tracer import NoOpTracer, Tracer
+from ..tracer import NoOpTracer, Tracer, TracerSpan
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
+from .metrics import CallStats, llm_metrics
 
 DEFAULT_TEMPERATURE = 0
 DEFAULT_CACHE_DIR = './llm_cache'
@@ -58,6 +63,10 @@ def get_extraction_language_instruction(group_id: str | None = None) -> str:
 logger = logging.getLogger(__name__)
 
 
+# Stats of the generate_response call running in the current task, filled in by providers
+_call_stats: ContextVar[CallStats | None] = ContextVar('llm_call_stats', default=None)
+
+
 def is_server_or_retry_error(exception):
     if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
         return True
@@ -89,6 +98,97 @@ class LLMClient(ABC):
         """Set the tracer for this LLM client."""
         self.tracer = tracer
 
+    def _record_usage(
+        self,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cached_input_tokens: int = 0,
+        cache_creation_input_tokens: int = 0,
+    ) -> None:
+        """Add provider-reported token usage to the generate_response call in progress."""
+        call = _call_stats.get()
+        if call is None:
+            return
+
+        call.usage.input_tokens += input_tokens
+        call.usage.output_tokens += output_tokens
+        call.usage.cached_input_tokens += cached_input_tokens
+        call.usage.cache_creation_input_tokens += cache_creation_input_tokens
+
+    def _record_retry(self) -> None:
+        """Count another attempt of the generate_response call in progress."""
+        call = _call_stats.get()
+        if call is not None:
+            call.retries += 1
+
+    def _record_rate_limit(self) -> None:
+        """Count a provider 429 during the generate_response call in progress."""
+        call = _call_stats.get()
+        if call is not None:
+            call.rate_limited += 1
+
+    def _record_truncation(self) -> None:
+        """Count a response cut off by max_tokens during the generate_response call in progress."""
+        call = _call_stats.get()
+        if call is not None:
+            call.truncated += 1
+
+    def _record_chat_completion_usage(self, response: typing.Any) -> None:
+        """Record usage from an OpenAI-compatible chat completion response."""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+
+        prompt_details = getattr(usage, 'prompt_tokens_details', None)
+        self._record_usage(
+            input_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+            output_tokens=getattr(usage, 'completion_tokens', 0) or 0,
+            cached_input_tokens=getattr(prompt_details, 'cached_tokens', 0) or 0,
+        )
+
+        choices = getattr(response, 'choices', None)
+        if choices and getattr(choices[0], 'finish_reason', None) == 'length':
+            self._record_truncation()
+
+    @contextmanager
+    def _track_usage(
+        self,
+        span: TracerSpan,
+        prompt_name: str | None = None,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> Generator[CallStats, None, None]:
+        """
+        Collect usage, retries and latency across the attempts of one call, add them to its span
+        and record them in llm_metrics under the call's prompt name and model size.
+        """
+        call = CallStats()
+        token = _call_stats.set(call)
+        start = perf_counter()
+        error = False
+        try:
+            yield call
+        except BaseException:
+            error = True
+            raise
+        finally:
+            latency_ms = (perf_counter() - start) * 1000
+            _call_stats.reset(token)
+            llm_metrics.record(prompt_name, model_size.value, latency_ms, call, error=error)
+            span.add_attributes(
+                {
+                    'llm.usage.input_tokens': call.usage.input_tokens,
+                    'llm.usage.output_tokens': call.usage.output_tokens,
+                    'llm.usage.cached_input_tokens': call.usage.cached_input_tokens,
+                    'llm.usage.cache_creation_input_tokens': (
+                        call.usage.cache_creation_input_tokens
+                    ),
+                    'llm.retries': call.retries,
+                    'llm.rate_limited': call.rate_limited,
+                    'llm.truncated': call.truncated,
+                    'llm.latency_ms': latency_ms,
+                }
+            )
+
     def _clean_input(self, input: str) -> str:
         """Clean input string of invalid unicode and control characters.
 
@@ -115,6 +215,7 @@ class LLMClient(ABC):
         stop=stop_after_attempt(4),
         wait=wait_random_exponential(multiplier=10, min=5, max=120),
         retry=retry_if_exception(is_server_or_retry_error),
+        before_sleep=lambda retry_state: retry_state.args[0]._record_retry(),
         after=lambda retry_state: logger.warning(
             f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
         )
@@ -162,22 +263,27 @@ class LLMClient(ABC):
         if max_tokens is None:
             max_tokens = self.max_tokens
 
+        # Add multilingual extraction instructions
+        messages[0].content += get_extraction_language_instruction(group_id)
+
+        # The schema is static per prompt, so it goes in the system message with the other
+        # instructions rather than after the episode content, keeping the prompt prefix cacheable
         if response_model is not None:
             serialized_model = json.dumps(response_model.model_json_schema())
             messages[
-                -1
+                0
             ].content += (
                 f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
             )
 
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
-
         for message in messages:
             message.content = self._clean_input(message.content)
 
         # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
+        with (
+            self.tracer.start_span('llm.generate') as span,
+            self._track_usage(span, prompt_name, model_size) as call,
+        ):
             attributes = {
                 'llm.provider': self._get_provider_type(),
                 'model.size': model_size.value,
@@ -195,6 +301,7 @@ class LLMClient(ABC):
                 if cached_response is not None:
                     logger.debug(f'Cache hit for {cache_key}')
                     span.add_attributes({'cache.hit': True})
+                    call.cache_hit = True
                     return cached_response
 
             span.add_attributes({'cache.hit': False})
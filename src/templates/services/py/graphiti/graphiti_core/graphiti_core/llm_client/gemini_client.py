@@ -14,15 +14,19 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
 import typing
+from time import time
 from typing import TYPE_CHECKING, ClassVar
 
 from pydantic import BaseModel
 
 from ..prompts.models import Message
+from ..utils.text_utils import estimate_tokens
 from .client import LLMClient, get_extraction_language_instruction
 from .config import LLMConfig, ModelSize
 from .errors import RateLimitError
@@ -65,6 +69,10 @@ GEMINI_MODEL_MAX_TOKENS = {
 # Default max tokens for models not in the mapping
 DEFAULT_GEMINI_MAX_TOKENS = 8192
 
+# Gemini rejects explicit caches smaller than this many tokens
+GEMINI_MIN_CACHE_TOKENS = 1024
+DEFAULT_PROMPT_CACHE_TTL_SECONDS = 3600
+
 
 class GeminiClient(LLMClient):
     """
@@ -96,6 +104,8 @@ class GeminiClient(LLMClient):
         max_tokens: int | None = None,
         thinking_config: types.ThinkingConfig | None = None,
         client: 'genai.Client | None' = None,
+        prompt_cache: bool = False,
+        prompt_cache_ttl: int = DEFAULT_PROMPT_CACHE_TTL_SECONDS,
     ):
         """
         Initialize the GeminiClient with the provided configuration, cache setting, and optional thinking config.
@@ -106,6 +116,9 @@ class GeminiClient(LLMClient):
             thinking_config (types.ThinkingConfig | None): Optional thinking configuration for models that support it.
                 Only use with models that support thinking (gemini-2.5+). Defaults to None.
             client (genai.Client | None): An optional async client instance to use. If not provided, a new genai.Client is created.
+            prompt_cache (bool): Whether to store system prompts (instructions, type definitions and
+                schema) as explicit Gemini caches and reference them on later calls. Defaults to False.
+            prompt_cache_ttl (int): Lifetime in seconds of each explicit cache.
         """
         if config is None:
             config = LLMConfig()
@@ -121,6 +134,11 @@ class GeminiClient(LLMClient):
 
         self.max_tokens = max_tokens
         self.thinking_config = thinking_config
+        self.prompt_cache = prompt_cache
+        self.prompt_cache_ttl = prompt_cache_ttl
+        # Cache key -> (cached content name or None if uncachable, local expiry time)
+        self._cached_contents: dict[str, tuple[str | None, float]] = {}
+        self._cache_creations: dict[str, asyncio.Task[str | None]] = {}
 
     def _check_safety_blocks(self, response) -> None:
         """Check if response was blocked for safety reasons and raise appropriate exceptions."""
@@ -197,6 +215,45 @@ class GeminiClient(LLMClient):
         # 3. Use model-specific maximum or return DEFAULT_GEMINI_MAX_TOKENS
         return self._get_max_tokens_for_model(model)
 
+    async def _get_cached_content(self, model: str, system_prompt: str) -> str | None:
+        """Return the name of an explicit cache holding system_prompt, creating it on first use."""
+        if estimate_tokens(system_prompt) < GEMINI_MIN_CACHE_TOKENS:
+            return None
+
+        key = hashlib.sha256(f'{model}:{system_prompt}'.encode()).hexdigest()
+        entry = self._cached_contents.get(key)
+        if entry is not None and entry[1] > time():
+            return entry[0]
+
+        # Check-and-set without an await in between, so concurrent callers share one creation
+        # and no lock is held across the network call
+        creation = self._cache_creations.get(key)
+        if creation is None:
+            creation = asyncio.create_task(self._create_cached_content(model, system_prompt, key))
+            self._cache_creations[key] = creation
+        return await asyncio.shield(creation)
+
+    async def _create_cached_content(self, model: str, system_prompt: str, key: str) -> str | None:
+        try:
+            cached_content = await self.client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    ttl=f'{self.prompt_cache_ttl}s',
+                    display_name=f'graphiti-{key[:16]}',
+                ),
+            )
+        except Exception as e:
+            logger.warning(f'Could not create Gemini prompt cache, sending uncached: {e}')
+            self._cached_contents[key] = (None, time() + self.prompt_cache_ttl)
+            return None
+        finally:
+            self._cache_creations.pop(key, None)
+
+        # Expire locally ahead of the server so requests never reference a deleted cache
+        self._cached_contents[key] = (cached_content.name, time() + self.prompt_cache_ttl * 0.9)
+        return cached_content.name
+
     def salvage_json(self, raw_output: str) -> dict[str, typing.Any] | None:
         """
         Attempt to salvage a JSON object if the raw output is truncated.
@@ -286,13 +343,20 @@ class GeminiClient(LLMClient):
             # Resolve max_tokens using precedence rules (see _resolve_max_tokens for details)
             resolved_max_tokens = self._resolve_max_tokens(max_tokens, model)
 
+            # The system prompt carries the static instructions and schema, so it is the part
+            # worth caching; the episode content follows in the user messages
+            cached_content = (
+                await self._get_cached_content(model, system_prompt) if self.prompt_cache else None
+            )
+
             # Create generation config
             generation_config = types.GenerateContentConfig(
                 temperature=self.temperature,
                 max_output_tokens=resolved_max_tokens,
                 response_mime_type='application/json' if response_model else None,
                 response_schema=response_model if response_model else None,
-                system_instruction=system_prompt,
+                system_instruction=None if cached_content else system_prompt,
+                cached_content=cached_content,
                 thinking_config=self.thinking_config,
             )
 
@@ -303,6 +367,18 @@ class GeminiClient(LLMClient):
                 config=generation_config,
             )
 
+            usage_metadata = getattr(response, 'usage_metadata', None)
+            if usage_metadata is not None:
+                self._record_usage(
+                    input_tokens=usage_metadata.prompt_token_count or 0,
+                    output_tokens=usage_metadata.candidates_token_count or 0,
+                    cached_input_tokens=usage_metadata.cached_content_token_count or 0,
+                )
+
+            candidates = getattr(response, 'candidates', None)
+            if candidates and getattr(candidates[0], 'finish_reason', None) == 'MAX_TOKENS':
+                self._record_truncation()
+
             # Always capture the raw output for debugging
             raw_output = getattr(response, 'text', None)
 
@@ -345,6 +421,7 @@ class GeminiClient(LLMClient):
                 or 'resource_exhausted' in error_message
                 or '429' in str(e)
             ):
+                self._record_rate_limit()
                 raise RateLimitError from e
 
             logger.error(f'Error in generating LLM response: {e}')
@@ -378,11 +455,15 @@ class GeminiClient(LLMClient):
         messages[0].content += get_extraction_language_instruction(group_id)
 
         # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
+        with (
+            self.tracer.start_span('llm.generate') as span,
+            self._track_usage(span, prompt_name, model_size),
+        ):
             attributes = {
                 'llm.provider': 'gemini',
                 'model.size': model_size.value,
                 'max_tokens': max_tokens or self.max_tokens,
+                'prompt_cache.enabled': self.prompt_cache,
             }
             if prompt_name:
                 attributes['prompt.name'] = prompt_name
@@ -393,6 +474,8 @@ class GeminiClient(LLMClient):
             last_output = None
 
             while retry_count < self.MAX_RETRIES:
+                if retry_count:
+                    self._record_retry()
                 try:
                     response = await self._generate_response(
                         messages=messages,
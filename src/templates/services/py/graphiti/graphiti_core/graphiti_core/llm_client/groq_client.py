@@ -76,9 +76,11 @@ class GroqClient(LLMClient):
                 max_tokens=max_tokens or self.max_tokens,
                 response_format={'type': 'json_object'},
             )
+            self._record_chat_completion_usage(response)
             result = response.choices[0].message.content or ''
             return json.loads(result)
         except groq.RateLimitError as e:
+            self._record_rate_limit()
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
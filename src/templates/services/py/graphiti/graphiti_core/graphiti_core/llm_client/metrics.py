@@ -0,0 +1,146 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+from bisect import bisect_left
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from ..utils.datetime_utils import utc_now
+
+# Upper bounds of the latency histogram buckets; the last bucket counts everything slower
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
+UNNAMED_PROMPT = 'unnamed'
+
+
+class TokenUsage(BaseModel):
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # Input tokens served from the provider's prompt cache
+    cached_input_tokens: int = 0
+    # Input tokens written to the provider's prompt cache (Anthropic only)
+    cache_creation_input_tokens: int = 0
+
+
+class CallStats(BaseModel):
+    """What happened during one generate_response call, across all of its attempts."""
+
+    usage: TokenUsage = Field(default_factory=TokenUsage)
+    retries: int = 0
+    rate_limited: int = 0
+    truncated: int = 0
+    cache_hit: bool = False
+
+
+class PromptMetrics(BaseModel):
+    prompt_name: str
+    model_size: str
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    truncated: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    # Counts per LATENCY_BUCKETS_MS bound, plus a final overflow bucket
+    latency_histogram: list[int] = Field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+
+class LLMMetricsSnapshot(BaseModel):
+    since: datetime
+    latency_buckets_ms: list[float]
+    prompts: list[PromptMetrics]
+
+
+class LLMMetrics:
+    """
+    In-process aggregate of generate_response calls per prompt name and model size.
+
+    Every LLM client records into the shared `llm_metrics` instance, so the totals cover all
+    clients in the process. Calls may complete on several threads, so updates take a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prompts: dict[tuple[str, str], PromptMetrics] = {}
+        self._since = utc_now()
+
+    def record(
+        self,
+        prompt_name: str | None,
+        model_size: str,
+        latency_ms: float,
+        call: CallStats,
+        error: bool = False,
+    ):
+        prompt_name = prompt_name or UNNAMED_PROMPT
+        bucket = bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+        with self._lock:
+            metrics = self._prompts.get((prompt_name, model_size))
+            if metrics is None:
+                metrics = PromptMetrics(prompt_name=prompt_name, model_size=model_size)
+                self._prompts[(prompt_name, model_size)] = metrics
+
+            metrics.calls += 1
+            metrics.errors += int(error)
+            metrics.cache_hits += int(call.cache_hit)
+            metrics.input_tokens += call.usage.input_tokens
+            metrics.output_tokens += call.usage.output_tokens
+            metrics.cached_input_tokens += call.usage.cached_input_tokens
+            metrics.cache_creation_input_tokens += call.usage.cache_creation_input_tokens
+            metrics.retries += call.retries
+            metrics.rate_limited += call.rate_limited
+            metrics.truncated += call.truncated
+            metrics.total_latency_ms += latency_ms
+            metrics.max_latency_ms = max(metrics.max_latency_ms, latency_ms)
+            metrics.latency_histogram[bucket] += 1
+
+    def snapshot(self) -> LLMMetricsSnapshot:
+        """Return a copy of the current totals, most expensive prompts first."""
+        with self._lock:
+            prompts = [metrics.model_copy(deep=True) for metrics in self._prompts.values()]
+            since = self._since
+        prompts.sort(key=lambda m: m.total_latency_ms, reverse=True)
+        return LLMMetricsSnapshot(
+            since=since, latency_buckets_ms=list(LATENCY_BUCKETS_MS), prompts=prompts
+        )
+
+    def reset(self):
+        with self._lock:
+            self._prompts.clear()
+            self._since = utc_now()
+
+
+llm_metrics = LLMMetrics()
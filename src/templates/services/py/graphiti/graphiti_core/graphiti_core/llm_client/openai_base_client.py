@@ -171,7 +171,8 @@ class BaseOpenAIClient(LLMClient):
                     max_tokens=max_tokens or self.max_tokens,
                     response_model=response_model,
                 )
-                
+                self._record_chat_completion_usage(response)
+
                 # If we're using OpenRouter or a fallback was triggered, handle as JSON
                 if self._is_openrouter() or not hasattr(response, 'output_text'):
                     return self._handle_json_response(response, response_model)
@@ -184,11 +185,14 @@ class BaseOpenAIClient(LLMClient):
                     temperature=self.temperature,
                     max_tokens=max_tokens or self.max_tokens,
                 )
+                self._record_chat_completion_usage(response)
                 return self._handle_json_response(response)
 
         except openai.LengthFinishReasonError as e:
+            self._record_truncation()
             raise Exception(f'Output length exceeded max tokens {self.max_tokens}: {e}') from e
         except openai.RateLimitError as e:
+            self._record_rate_limit()
             raise RateLimitError from e
         except openai.AuthenticationError as e:
             logger.error(
@@ -223,7 +227,10 @@ class BaseOpenAIClient(LLMClient):
         messages[0].content += get_extraction_language_instruction(group_id)
 
         # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
+        with (
+            self.tracer.start_span('llm.generate') as span,
+            self._track_usage(span, prompt_name, model_size),
+        ):
             attributes = {
                 'llm.provider': 'openai',
                 'model.size': model_size.value,
@@ -265,6 +272,7 @@ class BaseOpenAIClient(LLMClient):
                         raise
 
                     retry_count += 1
+                    self._record_retry()
 
                     # Construct a detailed error message for the LLM
                     error_context = (
@@ -127,9 +127,11 @@ class OpenAIGenericClient(LLMClient):
                 max_tokens=self.max_tokens,
                 response_format=response_format,  # type: ignore[arg-type]
             )
+            self._record_chat_completion_usage(response)
             result = response.choices[0].message.content or ''
             return json.loads(result)
         except openai.RateLimitError as e:
+            self._record_rate_limit()
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
@@ -151,7 +153,10 @@ class OpenAIGenericClient(LLMClient):
         messages[0].content += get_extraction_language_instruction(group_id)
 
         # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
+        with (
+            self.tracer.start_span('llm.generate') as span,
+            self._track_usage(span, prompt_name, model_size),
+        ):
             attributes = {
                 'llm.provider': 'openai',
                 'model.size': model_size.value,
@@ -193,6 +198,7 @@ class OpenAIGenericClient(LLMClient):
                         raise
 
                     retry_count += 1
+                    self._record_retry()
 
                     # Construct a detailed error message for the LLM
                     error_context = (
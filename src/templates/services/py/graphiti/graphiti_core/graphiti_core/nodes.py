@@ -17,6 +17,7 @@ limitations under the License.
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 from time import time
@@ -47,6 +48,49 @@ from graphiti_core.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DELETE_BATCH_SIZE = 100
+
+
+class DeleteProgress(BaseModel):
+    label: str = Field(description='label of the nodes being deleted')
+    deleted: int = Field(description='number of nodes with this label deleted so far')
+    batches: int = Field(description='number of batches completed for this label')
+
+
+DeleteProgressCallback = Callable[[DeleteProgress], None]
+
+
+async def _delete_in_batches(
+    driver: GraphDriver,
+    label: str,
+    match_query: str,
+    batch_size: int,
+    progress_callback: DeleteProgressCallback | None,
+    **params: Any,
+) -> int:
+    """Repeatedly detach delete up to batch_size nodes selected by match_query until none remain."""
+    deleted = 0
+    batches = 0
+    while True:
+        records, _, _ = await driver.execute_query(
+            match_query
+            + """
+            DETACH DELETE n
+            RETURN count(*) AS deleted
+            """,
+            batch_size=batch_size,
+            **params,
+        )
+        batch_deleted = records[0]['deleted'] if records else 0
+        deleted += batch_deleted
+        batches += 1
+
+        if progress_callback is not None:
+            progress_callback(DeleteProgress(label=label, deleted=deleted, batches=batches))
+
+        if batch_deleted < batch_size:
+            return deleted
+
 
 class EpisodeType(Enum):
     """
@@ -112,40 +156,9 @@ class Node(BaseModel, ABC):
                     uuid=self.uuid,
                 )
 
-            case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{uuid: $uuid}})
-                        DETACH DELETE n
-                        """,
-                        uuid=self.uuid,
-                    )
-                # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
-                # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {uuid: $uuid})-[:RELATES_TO]->(e:RelatesToNode_)
-                    DETACH DELETE e
-                    """,
-                    uuid=self.uuid,
-                )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {uuid: $uuid})
-                    DETACH DELETE n
-                    """,
-                    uuid=self.uuid,
-                )
-            case _:  # FalkorDB, Neptune
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{uuid: $uuid}})
-                        DETACH DELETE n
-                        """,
-                        uuid=self.uuid,
-                    )
+            case _:  # FalkorDB, Kuzu, Neptune
+                # Only match on this node's own label so the uuid lookup uses the label index
+                await self.delete_by_uuids(driver, [self.uuid], labels=self._delete_labels())
 
         logger.debug(f'Deleted Node: {self.uuid}')
 
@@ -158,132 +171,128 @@ class Node(BaseModel, ABC):
         return False
 
     @classmethod
-    async def delete_by_group_id(cls, driver: GraphDriver, group_id: str, batch_size: int = 100):
+    def _delete_labels(cls) -> list[str]:
+        for label, node_cls in NODE_LABEL_CLASSES.items():
+            if issubclass(cls, node_cls):
+                return [label]
+        return list(NODE_LABEL_CLASSES.keys())
+
+    @classmethod
+    async def delete_by_group_id(
+        cls,
+        driver: GraphDriver,
+        group_id: str,
+        batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+        progress_callback: DeleteProgressCallback | None = None,
+    ) -> int:
+        """
+        Delete every Entity, Episodic and Community node of a group in fixed-size batches.
+
+        Each batch is its own query on a single label, so it can use the label's group_id index and
+        never holds more than batch_size nodes in one transaction. Returns the number of deleted nodes.
+        """
         if driver.graph_operations_interface:
             return await driver.graph_operations_interface.node_delete_by_group_id(
                 cls, driver, group_id, batch_size
             )
 
-        match driver.provider:
-            case GraphProvider.NEO4J:
-                async with driver.session() as session:
-                    await session.run(
-                        """
-                        MATCH (n:Entity|Episodic|Community {group_id: $group_id})
-                        CALL (n) {
-                            DETACH DELETE n
-                        } IN TRANSACTIONS OF $batch_size ROWS
-                        """,
-                        group_id=group_id,
-                        batch_size=batch_size,
-                    )
+        labels = list(NODE_LABEL_CLASSES.keys())
+        if driver.provider == GraphProvider.KUZU:
+            # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
+            # Explicitly delete the "edge" nodes first, then the entity nodes.
+            labels.insert(0, 'RelatesToNode_')
+
+        deleted = 0
+        for label in labels:
+            deleted += await _delete_in_batches(
+                driver,
+                label,
+                f"""
+                MATCH (n:{label} {{group_id: $group_id}})
+                WITH n LIMIT $batch_size
+                """,
+                batch_size,
+                progress_callback,
+                group_id=group_id,
+            )
 
-            case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{group_id: $group_id}})
-                        DETACH DELETE n
-                        """,
-                        group_id=group_id,
-                    )
-                # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
-                # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]->(e:RelatesToNode_)
-                    DETACH DELETE e
-                    """,
-                    group_id=group_id,
-                )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity {group_id: $group_id})
-                    DETACH DELETE n
-                    """,
-                    group_id=group_id,
-                )
-            case _:  # FalkorDB, Neptune
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label} {{group_id: $group_id}})
-                        DETACH DELETE n
-                        """,
-                        group_id=group_id,
-                    )
+        return deleted
 
     @classmethod
-    async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str], batch_size: int = 100):
+    async def delete_by_uuids(
+        cls,
+        driver: GraphDriver,
+        uuids: list[str],
+        batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+        progress_callback: DeleteProgressCallback | None = None,
+        labels: list[str] | None = None,
+    ) -> int:
+        """
+        Delete nodes by uuid in chunks of batch_size uuids.
+
+        Returns the number of deleted nodes.
+        """
         if driver.graph_operations_interface:
             return await driver.graph_operations_interface.node_delete_by_uuids(
                 cls, driver, uuids, group_id=None, batch_size=batch_size
             )
 
-        match driver.provider:
-            case GraphProvider.FALKORDB:
-                for label in ['Entity', 'Episodic', 'Community']:
-                    await driver.execute_query(
-                        f"""
-                        MATCH (n:{label})
-                        WHERE n.uuid IN $uuids
+        if labels is None:
+            labels = list(NODE_LABEL_CLASSES.keys())
+
+        if driver.provider == GraphProvider.NEO4J:
+            label_filter = '|'.join(labels)
+            async with driver.session() as session:
+                result = await session.run(
+                    f"""
+                    MATCH (n:{label_filter})
+                    WHERE n.uuid IN $uuids
+                    CALL (n) {{
                         DETACH DELETE n
-                        """,
-                        uuids=uuids,
-                    )
-            case GraphProvider.KUZU:
-                for label in ['Episodic', 'Community']:
+                    }} IN TRANSACTIONS OF $batch_size ROWS
+                    RETURN count(*) AS deleted
+                    """,
+                    uuids=uuids,
+                    batch_size=batch_size,
+                )
+                record = await result.single()
+            deleted = record['deleted'] if record else 0
+            if progress_callback is not None:
+                progress_callback(DeleteProgress(label=label_filter, deleted=deleted, batches=1))
+            return deleted
+
+        deleted = 0
+        for label in labels:
+            total = 0
+            for batch_index, start in enumerate(range(0, len(uuids), batch_size)):
+                chunk = uuids[start : start + batch_size]
+                if driver.provider == GraphProvider.KUZU and label == 'Entity':
+                    # Entity edges are actually nodes in Kuzu, delete them before their entities.
                     await driver.execute_query(
-                        f"""
-                        MATCH (n:{label})
+                        """
+                        MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)
                         WHERE n.uuid IN $uuids
-                        DETACH DELETE n
+                        DETACH DELETE e
                         """,
-                        uuids=uuids,
+                        uuids=chunk,
                     )
-                # Entity edges are actually nodes in Kuzu, so simple `DETACH DELETE` will not work.
-                # Explicitly delete the "edge" nodes first, then the entity node.
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)
-                    WHERE n.uuid IN $uuids
-                    DETACH DELETE e
-                    """,
-                    uuids=uuids,
-                )
-                await driver.execute_query(
-                    """
-                    MATCH (n:Entity)
+                records, _, _ = await driver.execute_query(
+                    f"""
+                    MATCH (n:{label})
                     WHERE n.uuid IN $uuids
                     DETACH DELETE n
+                    RETURN count(*) AS deleted
                     """,
-                    uuids=uuids,
+                    uuids=chunk,
                 )
-            case _:  # Neo4J, Neptune
-                async with driver.session() as session:
-                    # Collect all edge UUIDs before deleting nodes
-                    await session.run(
-                        """
-                        MATCH (n:Entity|Episodic|Community)
-                        WHERE n.uuid IN $uuids
-                        MATCH (n)-[r]-()
-                        RETURN collect(r.uuid) AS edge_uuids
-                        """,
-                        uuids=uuids,
+                total += records[0]['deleted'] if records else 0
+                if progress_callback is not None:
+                    progress_callback(
+                        DeleteProgress(label=label, deleted=total, batches=batch_index + 1)
                     )
+            deleted += total
 
-                    # Now delete the nodes in batches
-                    await session.run(
-                        """
-                        MATCH (n:Entity|Episodic|Community)
-                        WHERE n.uuid IN $uuids
-                        CALL (n) {
-                            DETACH DELETE n
-                        } IN TRANSACTIONS OF $batch_size ROWS
-                        """,
-                        uuids=uuids,
-                        batch_size=batch_size,
-                    )
+        return deleted
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
@@ -729,6 +738,14 @@ class CommunityNode(Node):
 
 
 # Node helpers
+# Node labels in the order their nodes are deleted by the batched delete paths
+NODE_LABEL_CLASSES: dict[str, type[Node]] = {
+    'Entity': EntityNode,
+    'Episodic': EpisodicNode,
+    'Community': CommunityNode,
+}
+
+
 def get_episodic_node_from_record(record: Any) -> EpisodicNode:
     created_at = parse_db_date(record['created_at'])
     valid_at = parse_db_date(record['valid_at'])
@@ -34,6 +34,14 @@ class EdgeDuplicate(BaseModel):
     fact_type: str = Field(..., description='One of the provided fact types or DEFAULT')
 
 
+class EdgeResolution(EdgeDuplicate):
+    id: int = Field(..., description='integer id of the NEW FACT this resolution is for')
+
+
+class EdgeResolutions(BaseModel):
+    edge_resolutions: list[EdgeResolution] = Field(..., description='List of resolved facts')
+
+
 class UniqueFact(BaseModel):
     uuid: str = Field(..., description='unique identifier of the fact')
     fact: str = Field(..., description='fact of a unique edge')
@@ -47,12 +55,14 @@ class Prompt(Protocol):
     edge: PromptVersion
     edge_list: PromptVersion
     resolve_edge: PromptVersion
+    resolve_edge_batch: PromptVersion
 
 
 class Versions(TypedDict):
     edge: PromptFunction
     edge_list: PromptFunction
     resolve_edge: PromptFunction
+    resolve_edge_batch: PromptFunction
 
 
 def edge(context: dict[str, Any]) -> list[Message]:
@@ -118,39 +128,39 @@ def resolve_edge(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='You are a helpful assistant that de-duplicates facts from fact lists and determines which existing '
-            'facts are contradicted by the new fact.',
+            content="""You are a helpful assistant that de-duplicates facts from fact lists and determines which existing facts are contradicted by the new fact.
+
+Task:
+You will receive TWO separate lists of facts. Each list uses 'idx' as its index field, starting from 0.
+
+1. DUPLICATE DETECTION:
+   - If the NEW FACT represents identical factual information as any fact in EXISTING FACTS, return those idx values in duplicate_facts.
+   - Facts with similar information that contain key differences should NOT be marked as duplicates.
+   - Return idx values from EXISTING FACTS.
+   - If no duplicates, return an empty list for duplicate_facts.
+
+2. FACT TYPE CLASSIFICATION:
+   - Given the predefined FACT TYPES, determine if the NEW FACT should be classified as one of these types.
+   - Return the fact type as fact_type or DEFAULT if NEW FACT is not one of the FACT TYPES.
+
+3. CONTRADICTION DETECTION:
+   - Based on FACT INVALIDATION CANDIDATES and NEW FACT, determine which facts the new fact contradicts.
+   - Return idx values from FACT INVALIDATION CANDIDATES.
+   - If no contradictions, return an empty list for contradicted_facts.
+
+IMPORTANT:
+- duplicate_facts: Use ONLY 'idx' values from EXISTING FACTS
+- contradicted_facts: Use ONLY 'idx' values from FACT INVALIDATION CANDIDATES
+- These are two separate lists with independent idx ranges starting from 0
+
+Guidelines:
+1. Some facts may be very similar but will have key differences, particularly around numeric values in the facts.
+    Do not mark these facts as duplicates.
+""",
         ),
         Message(
             role='user',
             content=f"""
-        Task:
-        You will receive TWO separate lists of facts. Each list uses 'idx' as its index field, starting from 0.
-
-        1. DUPLICATE DETECTION:
-           - If the NEW FACT represents identical factual information as any fact in EXISTING FACTS, return those idx values in duplicate_facts.
-           - Facts with similar information that contain key differences should NOT be marked as duplicates.
-           - Return idx values from EXISTING FACTS.
-           - If no duplicates, return an empty list for duplicate_facts.
-
-        2. FACT TYPE CLASSIFICATION:
-           - Given the predefined FACT TYPES, determine if the NEW FACT should be classified as one of these types.
-           - Return the fact type as fact_type or DEFAULT if NEW FACT is not one of the FACT TYPES.
-
-        3. CONTRADICTION DETECTION:
-           - Based on FACT INVALIDATION CANDIDATES and NEW FACT, determine which facts the new fact contradicts.
-           - Return idx values from FACT INVALIDATION CANDIDATES.
-           - If no contradictions, return an empty list for contradicted_facts.
-
-        IMPORTANT:
-        - duplicate_facts: Use ONLY 'idx' values from EXISTING FACTS
-        - contradicted_facts: Use ONLY 'idx' values from FACT INVALIDATION CANDIDATES
-        - These are two separate lists with independent idx ranges starting from 0
-
-        Guidelines:
-        1. Some facts may be very similar but will have key differences, particularly around numeric values in the facts.
-            Do not mark these facts as duplicates.
-
         <FACT TYPES>
         {context['edge_types']}
         </FACT TYPES>
@@ -171,4 +181,70 @@ def resolve_edge(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'edge': edge, 'edge_list': edge_list, 'resolve_edge': resolve_edge}
+def resolve_edge_batch(context: dict[str, Any]) -> list[Message]:
+    # The instructions are the same for every batch, so they lead the prompt where providers can
+    # cache them as a shared prefix
+    sys_prompt = """You are a helpful assistant that de-duplicates facts from fact lists and determines which existing facts are contradicted by new facts.
+
+Task:
+You will receive a list of NEW FACTS. Each NEW FACT comes with its own two lists of facts, each using 'idx' as
+its index field, starting from 0. Resolve every NEW FACT independently, using only its own lists.
+
+1. DUPLICATE DETECTION:
+   - If the NEW FACT represents identical factual information as any fact in its existing_facts, return those idx values in duplicate_facts.
+   - Facts with similar information that contain key differences should NOT be marked as duplicates.
+   - If no duplicates, return an empty list for duplicate_facts.
+
+2. FACT TYPE CLASSIFICATION:
+   - Given the FACT TYPES named in the NEW FACT's fact_types, determine if the NEW FACT should be classified as one of these types.
+   - Return the fact type as fact_type or DEFAULT if the NEW FACT is not one of its fact_types.
+
+3. CONTRADICTION DETECTION:
+   - Based on the NEW FACT's invalidation_candidates, determine which facts the new fact contradicts.
+   - If no contradictions, return an empty list for contradicted_facts.
+
+IMPORTANT:
+- duplicate_facts: Use ONLY 'idx' values from the NEW FACT's existing_facts
+- contradicted_facts: Use ONLY 'idx' values from the NEW FACT's invalidation_candidates
+- Every NEW FACT has its own lists with independent idx ranges starting from 0
+
+Guidelines:
+1. Some facts may be very similar but will have key differences, particularly around numeric values in the facts.
+    Do not mark these facts as duplicates.
+"""
+
+    return [
+        Message(role='system', content=sys_prompt),
+        Message(
+            role='user',
+            content=f"""
+        <FACT TYPES>
+        {to_prompt_json(context['edge_types'])}
+        </FACT TYPES>
+
+        Each entry in NEW FACTS is an object with the following structure:
+        {{
+            id: integer id of the new fact,
+            fact: "the new fact",
+            fact_types: ["names of the FACT TYPES this fact may be classified as", ...],
+            existing_facts: [{{idx: integer index, fact: "existing fact"}}, ...],
+            invalidation_candidates: [{{idx: integer index, fact: "candidate fact"}}, ...]
+        }}
+
+        <NEW FACTS>
+        {to_prompt_json(context['new_edges'])}
+        </NEW FACTS>
+
+        NEW FACTS contains {len(context['new_edges'])} facts with IDs 0 through {len(context['new_edges']) - 1}.
+        Your response MUST include EXACTLY {len(context['new_edges'])} resolutions with IDs 0 through {len(context['new_edges']) - 1}. Do not skip or add IDs.
+        """,
+        ),
+    ]
+
+
+versions: Versions = {
+    'edge': edge,
+    'edge_list': edge_list,
+    'resolve_edge': resolve_edge,
+    'resolve_edge_batch': resolve_edge_batch,
+}
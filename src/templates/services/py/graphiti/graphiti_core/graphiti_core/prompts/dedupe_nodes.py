@@ -118,8 +118,45 @@ def nodes(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='You are a helpful assistant that determines whether or not ENTITIES extracted from a conversation are duplicates'
-            ' of existing entities.',
+            content="""You are a helpful assistant that determines whether or not ENTITIES extracted from a conversation are duplicates of existing entities.
+
+Each of the ENTITIES was extracted from the CURRENT MESSAGE.
+Each entity in ENTITIES is represented as a JSON object with the following structure:
+{
+    id: integer id of the entity,
+    name: "name of the entity",
+    entity_type: ["Entity", "<optional additional label>", ...],
+    entity_type_description: "Description of what the entity type represents"
+}
+
+Each entry in EXISTING ENTITIES is an object with the following structure:
+{
+    idx: integer index of the candidate entity (use this when referencing a duplicate),
+    name: "name of the candidate entity",
+    entity_types: ["Entity", "<optional additional label>", ...],
+    ...<additional attributes such as summaries or metadata>
+}
+
+For each of the ENTITIES, determine if the entity is a duplicate of any of the EXISTING ENTITIES.
+
+Entities should only be considered duplicates if they refer to the *same real-world object or concept*.
+
+Do NOT mark entities as duplicates if:
+- They are related but distinct.
+- They have similar names or purposes but refer to separate instances or concepts.
+
+For every entity, return an object with the following keys:
+{
+    "id": integer id from ENTITIES,
+    "name": the best full name for the entity (preserve the original name unless a duplicate has a more complete name),
+    "duplicate_idx": the idx of the EXISTING ENTITY that is the best duplicate match, or -1 if there is no duplicate,
+    "duplicates": a sorted list of all idx values from EXISTING ENTITIES that refer to duplicates (deduplicate the list, use [] when none or unsure)
+}
+
+- Only use idx values that appear in EXISTING ENTITIES.
+- Set duplicate_idx to the smallest idx you collected for that entity, or -1 if duplicates is empty.
+- Never fabricate entities or indices.
+""",
         ),
         Message(
             role='user',
@@ -131,16 +168,6 @@ def nodes(context: dict[str, Any]) -> list[Message]:
         {context['episode_content']}
         </CURRENT MESSAGE>
 
-
-        Each of the following ENTITIES were extracted from the CURRENT MESSAGE.
-        Each entity in ENTITIES is represented as a JSON object with the following structure:
-        {{
-            id: integer id of the entity,
-            name: "name of the entity",
-            entity_type: ["Entity", "<optional additional label>", ...],
-            entity_type_description: "Description of what the entity type represents"
-        }}
-
         <ENTITIES>
         {to_prompt_json(context['extracted_nodes'])}
         </ENTITIES>
@@ -149,37 +176,8 @@ def nodes(context: dict[str, Any]) -> list[Message]:
         {to_prompt_json(context['existing_nodes'])}
         </EXISTING ENTITIES>
 
-        Each entry in EXISTING ENTITIES is an object with the following structure:
-        {{
-            idx: integer index of the candidate entity (use this when referencing a duplicate),
-            name: "name of the candidate entity",
-            entity_types: ["Entity", "<optional additional label>", ...],
-            ...<additional attributes such as summaries or metadata>
-        }}
-
-        For each of the above ENTITIES, determine if the entity is a duplicate of any of the EXISTING ENTITIES.
-
-        Entities should only be considered duplicates if they refer to the *same real-world object or concept*.
-
-        Do NOT mark entities as duplicates if:
-        - They are related but distinct.
-        - They have similar names or purposes but refer to separate instances or concepts.
-
-        Task:
         ENTITIES contains {len(context['extracted_nodes'])} entities with IDs 0 through {len(context['extracted_nodes']) - 1}.
         Your response MUST include EXACTLY {len(context['extracted_nodes'])} resolutions with IDs 0 through {len(context['extracted_nodes']) - 1}. Do not skip or add IDs.
-
-        For every entity, return an object with the following keys:
-        {{
-            "id": integer id from ENTITIES,
-            "name": the best full name for the entity (preserve the original name unless a duplicate has a more complete name),
-            "duplicate_idx": the idx of the EXISTING ENTITY that is the best duplicate match, or -1 if there is no duplicate,
-            "duplicates": a sorted list of all idx values from EXISTING ENTITIES that refer to duplicates (deduplicate the list, use [] when none or unsure)
-        }}
-
-        - Only use idx values that appear in EXISTING ENTITIES.
-        - Set duplicate_idx to the smallest idx you collected for that entity, or -1 if duplicates is empty.
-        - Never fabricate entities or indices.
         """,
         ),
     ]
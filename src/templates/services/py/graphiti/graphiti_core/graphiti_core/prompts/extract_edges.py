@@ -65,36 +65,20 @@ class Versions(TypedDict):
 
 
 def edge(context: dict[str, Any]) -> list[Message]:
+    # Instructions and fact types stay identical across episodes, so they lead the prompt
+    # where providers can cache them as a shared prefix
     return [
         Message(
             role='system',
             content='You are an expert fact extractor that extracts fact triples from text. '
             '1. Extracted fact triples should also be extracted with relevant date information.'
-            '2. Treat the CURRENT TIME as the time the CURRENT MESSAGE was sent. All temporal information should be extracted relative to this time.',
-        ),
-        Message(
-            role='user',
-            content=f"""
+            '2. Treat the CURRENT TIME as the time the CURRENT MESSAGE was sent. All temporal information should be extracted relative to this time.'
+            f"""
+
 <FACT TYPES>
 {context['edge_types']}
 </FACT TYPES>
 
-<PREVIOUS_MESSAGES>
-{to_prompt_json([ep for ep in context['previous_episodes']])}
-</PREVIOUS_MESSAGES>
-
-<CURRENT_MESSAGE>
-{context['episode_content']}
-</CURRENT_MESSAGE>
-
-<ENTITIES>
-{to_prompt_json(context['nodes'])}
-</ENTITIES>
-
-<REFERENCE_TIME>
-{context['reference_time']}  # ISO 8601 (UTC); used to resolve relative time mentions
-</REFERENCE_TIME>
-
 # TASK
 Extract all factual relationships between the given ENTITIES based on the CURRENT MESSAGE.
 Only extract facts that:
@@ -109,12 +93,9 @@ Only extract facts that:
 
 You may use information from the PREVIOUS MESSAGES only to disambiguate references or support continuity.
 
-
-{context['custom_prompt']}
-
 # EXTRACTION RULES
 
-1. **Entity ID Validation**: `source_entity_id` and `target_entity_id` must use only the `id` values from the ENTITIES list provided above.
+1. **Entity ID Validation**: `source_entity_id` and `target_entity_id` must use only the `id` values from the ENTITIES list provided.
    - **CRITICAL**: Using IDs not in the list will cause the edge to be rejected
 2. Each fact must involve two **distinct** entities.
 3. Use a SCREAMING_SNAKE_CASE string as the `relation_type` (e.g., FOUNDED, WORKS_AT).
@@ -131,6 +112,28 @@ You may use information from the PREVIOUS MESSAGES only to disambiguate referenc
 - Leave both fields `null` if no explicit or resolvable time is stated.
 - If only a date is mentioned (no time), assume 00:00:00.
 - If only a year is mentioned, use January 1st at 00:00:00.
+""",
+        ),
+        Message(
+            role='user',
+            content=f"""
+<PREVIOUS_MESSAGES>
+{to_prompt_json([ep for ep in context['previous_episodes']])}
+</PREVIOUS_MESSAGES>
+
+<CURRENT_MESSAGE>
+{context['episode_content']}
+</CURRENT_MESSAGE>
+
+<ENTITIES>
+{to_prompt_json(context['nodes'])}
+</ENTITIES>
+
+<REFERENCE_TIME>
+{context['reference_time']}  # ISO 8601 (UTC); used to resolve relative time mentions
+</REFERENCE_TIME>
+
+{context['custom_prompt']}
         """,
         ),
     ]
@@ -168,12 +171,19 @@ def extract_attributes(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='You are a helpful assistant that extracts fact properties from the provided text.',
+            content="""You are a helpful assistant that extracts fact properties from the provided text.
+
+Given a MESSAGE, its REFERENCE TIME, and a FACT, update any of the FACT's attributes based on the information provided
+in MESSAGE. Use the provided attribute descriptions to better understand how each attribute should be determined.
+
+Guidelines:
+1. Do not hallucinate entity property values if they cannot be found in the current context.
+2. Only use the provided MESSAGES and FACT to set attribute values.
+""",
         ),
         Message(
             role='user',
             content=f"""
-
         <MESSAGE>
         {to_prompt_json(context['episode_content'])}
         </MESSAGE>
@@ -181,13 +191,6 @@ def extract_attributes(context: dict[str, Any]) -> list[Message]:
         {context['reference_time']}
         </REFERENCE TIME>
 
-        Given the above MESSAGE, its REFERENCE TIME, and the following FACT, update any of its attributes based on the information provided
-        in MESSAGE. Use the provided attribute descriptions to better understand how each attribute should be determined.
-
-        Guidelines:
-        1. Do not hallucinate entity property values if they cannot be found in the current context.
-        2. Only use the provided MESSAGES and FACT to set attribute values.
-
         <FACT>
         {context['fact']}
         </FACT>
@@ -71,6 +71,7 @@ class Prompt(Protocol):
     classify_nodes: PromptVersion
     extract_attributes: PromptVersion
     extract_summary: PromptVersion
+    extract_attributes_batch: PromptVersion
 
 
 class Versions(TypedDict):
@@ -81,25 +82,19 @@ class Versions(TypedDict):
     classify_nodes: PromptFunction
     extract_attributes: PromptFunction
     extract_summary: PromptFunction
+    extract_attributes_batch: PromptFunction
 
 
 def extract_message(context: dict[str, Any]) -> list[Message]:
-    sys_prompt = """You are an AI assistant that extracts entity nodes from conversational messages. 
-    Your primary task is to extract and classify the speaker and other significant entities mentioned in the conversation."""
+    # Instructions and entity types stay identical across episodes, so they lead the prompt
+    # where providers can cache them as a shared prefix
+    sys_prompt = f"""You are an AI assistant that extracts entity nodes from conversational messages. 
+    Your primary task is to extract and classify the speaker and other significant entities mentioned in the conversation.
 
-    user_prompt = f"""
 <ENTITY TYPES>
 {context['entity_types']}
 </ENTITY TYPES>
 
-<PREVIOUS MESSAGES>
-{to_prompt_json([ep for ep in context['previous_episodes']])}
-</PREVIOUS MESSAGES>
-
-<CURRENT MESSAGE>
-{context['episode_content']}
-</CURRENT MESSAGE>
-
 Instructions:
 
 You are given a conversation context and a CURRENT MESSAGE. Your task is to extract **entity nodes** mentioned **explicitly or implicitly** in the CURRENT MESSAGE.
@@ -123,6 +118,16 @@ reference entities. Only extract distinct entities from the CURRENT MESSAGE. Don
 
 5. **Formatting**:
    - Be **explicit and unambiguous** in naming entities (e.g., use full names when available).
+"""
+
+    user_prompt = f"""
+<PREVIOUS MESSAGES>
+{to_prompt_json([ep for ep in context['previous_episodes']])}
+</PREVIOUS MESSAGES>
+
+<CURRENT MESSAGE>
+{context['episode_content']}
+</CURRENT MESSAGE>
 
 {context['custom_prompt']}
 """
@@ -133,14 +138,24 @@ reference entities. Only extract distinct entities from the CURRENT MESSAGE. Don
 
 
 def extract_json(context: dict[str, Any]) -> list[Message]:
-    sys_prompt = """You are an AI assistant that extracts entity nodes from JSON. 
-    Your primary task is to extract and classify relevant entities from JSON files"""
+    sys_prompt = f"""You are an AI assistant that extracts entity nodes from JSON. 
+    Your primary task is to extract and classify relevant entities from JSON files
 
-    user_prompt = f"""
 <ENTITY TYPES>
 {context['entity_types']}
 </ENTITY TYPES>
 
+Given a SOURCE DESCRIPTION and JSON, extract relevant entities from the provided JSON.
+For each entity extracted, also determine its entity type based on the provided ENTITY TYPES and their descriptions.
+Indicate the classified entity type by providing its entity_type_id.
+
+Guidelines:
+1. Extract all entities that the JSON represents. This will often be something like a "name" or "user" field
+2. Extract all entities mentioned in all other properties throughout the JSON structure
+3. Do NOT extract any properties that contain dates
+"""
+
+    user_prompt = f"""
 <SOURCE DESCRIPTION>:
 {context['source_description']}
 </SOURCE DESCRIPTION>
@@ -149,15 +164,6 @@ def extract_json(context: dict[str, Any]) -> list[Message]:
 </JSON>
 
 {context['custom_prompt']}
-
-Given the above source description and JSON, extract relevant entities from the provided JSON.
-For each entity extracted, also determine its entity type based on the provided ENTITY TYPES and their descriptions.
-Indicate the classified entity type by providing its entity_type_id.
-
-Guidelines:
-1. Extract all entities that the JSON represents. This will often be something like a "name" or "user" field
-2. Extract all entities mentioned in all other properties throughout the JSON structure
-3. Do NOT extract any properties that contain dates
 """
     return [
         Message(role='system', content=sys_prompt),
@@ -166,29 +172,30 @@ Guidelines:
 
 
 def extract_text(context: dict[str, Any]) -> list[Message]:
-    sys_prompt = """You are an AI assistant that extracts entity nodes from text. 
-    Your primary task is to extract and classify the speaker and other significant entities mentioned in the provided text."""
+    sys_prompt = f"""You are an AI assistant that extracts entity nodes from text. 
+    Your primary task is to extract and classify the speaker and other significant entities mentioned in the provided text.
 
-    user_prompt = f"""
 <ENTITY TYPES>
 {context['entity_types']}
 </ENTITY TYPES>
 
-<TEXT>
-{context['episode_content']}
-</TEXT>
-
-Given the above text, extract entities from the TEXT that are explicitly or implicitly mentioned.
+Extract entities from the TEXT that are explicitly or implicitly mentioned.
 For each entity extracted, also determine its entity type based on the provided ENTITY TYPES and their descriptions.
 Indicate the classified entity type by providing its entity_type_id.
 
-{context['custom_prompt']}
-
 Guidelines:
 1. Extract significant entities, concepts, or actors mentioned in the conversation.
 2. Avoid creating nodes for relationships or actions.
 3. Avoid creating nodes for temporal information like dates, times or years (these will be added to edges later).
 4. Be as explicit as possible in your node names, using full names and avoiding abbreviations.
+"""
+
+    user_prompt = f"""
+<TEXT>
+{context['episode_content']}
+</TEXT>
+
+{context['custom_prompt']}
 """
     return [
         Message(role='system', content=sys_prompt),
@@ -256,18 +263,19 @@ def extract_attributes(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='You are a helpful assistant that extracts entity properties from the provided text.',
+            content="""You are a helpful assistant that extracts entity properties from the provided text.
+
+Given the MESSAGES and the ENTITY, update any of its attributes based on the information provided
+in MESSAGES. Use the provided attribute descriptions to better understand how each attribute should be determined.
+
+Guidelines:
+1. Do not hallucinate entity property values if they cannot be found in the current context.
+2. Only use the provided MESSAGES and ENTITY to set attribute values.
+""",
         ),
         Message(
             role='user',
             content=f"""
-        Given the MESSAGES and the following ENTITY, update any of its attributes based on the information provided
-        in MESSAGES. Use the provided attribute descriptions to better understand how each attribute should be determined.
-
-        Guidelines:
-        1. Do not hallucinate entity property values if they cannot be found in the current context.
-        2. Only use the provided MESSAGES and ENTITY to set attribute values.
-
         <MESSAGES>
         {to_prompt_json(context['previous_episodes'])}
         {to_prompt_json(context['episode_content'])}
@@ -285,16 +293,17 @@ def extract_summary(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
             role='system',
-            content='You are a helpful assistant that extracts entity summaries from the provided text.',
+            content=f"""You are a helpful assistant that extracts entity summaries from the provided text.
+
+Given the MESSAGES and the ENTITY, update the summary that combines relevant information about the entity
+from the messages and relevant information from the existing summary.
+
+{summary_instructions}
+""",
         ),
         Message(
             role='user',
             content=f"""
-        Given the MESSAGES and the ENTITY, update the summary that combines relevant information about the entity
-        from the messages and relevant information from the existing summary.
-
-        {summary_instructions}
-
         <MESSAGES>
         {to_prompt_json(context['previous_episodes'])}
         {to_prompt_json(context['episode_content'])}
@@ -308,6 +317,40 @@ def extract_summary(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def extract_attributes_batch(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content=f"""You are a helpful assistant that extracts entity properties and summaries from the provided text.
+
+Given the MESSAGES and the ENTITIES, respond with one object per entity, keyed by the entity's `id`.
+
+For each entity:
+- If its object has attribute fields, update them based on the information provided in MESSAGES.
+  Use the provided attribute descriptions to better understand how each attribute should be determined.
+  Do not hallucinate entity property values if they cannot be found in the current context.
+- If its object has a `summary` field, update the summary so it combines relevant information about
+  the entity from the messages and relevant information from its existing summary.
+
+{summary_instructions}
+""",
+        ),
+        Message(
+            role='user',
+            content=f"""
+        <MESSAGES>
+        {to_prompt_json(context['previous_episodes'])}
+        {to_prompt_json(context['episode_content'])}
+        </MESSAGES>
+
+        <ENTITIES>
+        {to_prompt_json(context['nodes'])}
+        </ENTITIES>
+        """,
+        ),
+    ]
+
+
 versions: Versions = {
     'extract_message': extract_message,
     'extract_json': extract_json,
@@ -316,4 +359,5 @@ versions: Versions = {
     'extract_summary': extract_summary,
     'classify_nodes': classify_nodes,
     'extract_attributes': extract_attributes,
+    'extract_attributes_batch': extract_attributes_batch,
 }
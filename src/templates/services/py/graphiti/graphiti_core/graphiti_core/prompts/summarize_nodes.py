@@ -34,14 +34,26 @@ class SummaryDescription(BaseModel):
     description: str = Field(..., description='One sentence description of the provided summary')
 
 
+class SummaryWithDescription(BaseModel):
+    summary: str = Field(
+        ...,
+        description='Summary containing the important information about the entities. Under 250 characters',
+    )
+    description: str = Field(..., description='One sentence description of the summary')
+
+
 class Prompt(Protocol):
     summarize_pair: PromptVersion
+    summarize_many: PromptVersion
+    summarize_many_with_description: PromptVersion
     summarize_context: PromptVersion
     summary_description: PromptVersion
 
 
 class Versions(TypedDict):
     summarize_pair: PromptFunction
+    summarize_many: PromptFunction
+    summarize_many_with_description: PromptFunction
     summarize_context: PromptFunction
     summary_description: PromptFunction
 
@@ -66,6 +78,48 @@ def summarize_pair(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def summarize_many(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that combines summaries.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Synthesize the information from the following summaries into a single succinct summary.
+
+        IMPORTANT: Keep the summary concise and to the point. SUMMARIES MUST BE LESS THAN 250 CHARACTERS.
+
+        Summaries:
+        {to_prompt_json(context['node_summaries'])}
+        """,
+        ),
+    ]
+
+
+def summarize_many_with_description(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that combines summaries and describes the result.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Synthesize the information from the following summaries into a single succinct summary.
+        Then create a short one sentence description of that summary that explains what kind of
+        information is summarized.
+
+        IMPORTANT: Keep the summary concise and to the point. SUMMARIES MUST BE LESS THAN 250 CHARACTERS.
+
+        Summaries:
+        {to_prompt_json(context['node_summaries'])}
+        """,
+        ),
+    ]
+
+
 def summarize_context(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
@@ -126,6 +180,8 @@ def summary_description(context: dict[str, Any]) -> list[Message]:
 
 versions: Versions = {
     'summarize_pair': summarize_pair,
+    'summarize_many': summarize_many,
+    'summarize_many_with_description': summarize_many_with_description,
     'summarize_context': summarize_context,
     'summary_description': summary_description,
 }
@@ -0,0 +1,415 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+
+if TYPE_CHECKING:
+    from graphiti_core.edges import EntityEdge, EpisodicEdge
+
+logger = logging.getLogger(__name__)
+
+GRAPH_SNAPSHOT_TTL = float(os.getenv('GRAPH_SNAPSHOT_TTL', 300))
+GRAPH_SNAPSHOT_MAX_EDGES = int(os.getenv('GRAPH_SNAPSHOT_MAX_EDGES', 2_000_000))
+
+# Rebuild the CSR arrays once edges added since the last build exceed this share of them
+COMPACTION_RATIO = 0.25
+MIN_COMPACTION_EDGES = 1024
+
+
+class GraphSnapshotMetrics(BaseModel):
+    groups: int
+    nodes: int
+    edges: int
+    loads: int
+    load_ms: float
+    deltas: int
+    compactions: int
+    oversized_groups: int
+
+
+class _CSR:
+    """Row offsets and edge ids of one direction of the adjacency, in compressed sparse rows."""
+
+    __slots__ = ('offsets', 'edge_ids')
+
+    def __init__(self, node_count: int, edge_rows: array):
+        counts = array('i', [0]) * (node_count + 1)
+        for row in edge_rows:
+            counts[row + 1] += 1
+        for i in range(node_count):
+            counts[i + 1] += counts[i]
+
+        edge_ids = array('i', [0]) * len(edge_rows)
+        cursor = counts[:-1]
+        for edge_id, row in enumerate(edge_rows):
+            edge_ids[cursor[row]] = edge_id
+            cursor[row] += 1
+
+        self.offsets = counts
+        self.edge_ids = edge_ids
+
+
+class GraphSnapshot:
+    """
+    Adjacency of one group's entity and episodic nodes.
+
+    Nodes and edges are numbered densely in load order: node_uuids and edge_uuids map the ints
+    back to uuids and edge_sources / edge_targets hold the endpoints of every edge. Outgoing and
+    incoming edge ids per node are kept in CSR arrays built at load time; edges added later are
+    indexed in small per-node lists until the next compaction rebuilds the arrays.
+    """
+
+    def __init__(self, group_id: str):
+        self.group_id = group_id
+        self.loaded_at = monotonic()
+        self.node_uuids: list[str] = []
+        self.node_index: dict[str, int] = {}
+        self.edge_uuids: list[str] = []
+        self.edge_index: dict[str, int] = {}
+        self.edge_sources = array('i')
+        self.edge_targets = array('i')
+        # 1 for RELATES_TO edges between entities, 0 for MENTIONS edges from episodes
+        self.entity_edges = bytearray()
+        self.compactions = 0
+
+        self._out = _CSR(0, self.edge_sources)
+        self._in = _CSR(0, self.edge_targets)
+        self._indexed_nodes = 0
+        self._indexed_edges = 0
+        self._delta_out: dict[int, list[int]] = {}
+        self._delta_in: dict[int, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.edge_uuids)
+
+    def _node(self, uuid: str) -> int:
+        index = self.node_index.get(uuid)
+        if index is None:
+            index = len(self.node_uuids)
+            self.node_index[uuid] = index
+            self.node_uuids.append(uuid)
+        return index
+
+    def add_edge(self, uuid: str, source_uuid: str, target_uuid: str, entity_edge: bool) -> bool:
+        """Add an edge unless it is already known. Returns whether it was new."""
+        if uuid in self.edge_index:
+            return False
+
+        edge_id = len(self.edge_uuids)
+        source = self._node(source_uuid)
+        target = self._node(target_uuid)
+        self.edge_index[uuid] = edge_id
+        self.edge_uuids.append(uuid)
+        self.edge_sources.append(source)
+        self.edge_targets.append(target)
+        self.entity_edges.append(int(entity_edge))
+
+        self._delta_out.setdefault(source, []).append(edge_id)
+        self._delta_in.setdefault(target, []).append(edge_id)
+        return True
+
+    def compact(self):
+        """Rebuild the CSR arrays so they cover every node and edge."""
+        node_count = len(self.node_uuids)
+        self._out = _CSR(node_count, self.edge_sources)
+        self._in = _CSR(node_count, self.edge_targets)
+        self._indexed_nodes = node_count
+        self._indexed_edges = len(self.edge_uuids)
+        self._delta_out.clear()
+        self._delta_in.clear()
+        self.compactions += 1
+
+    def maybe_compact(self):
+        pending = len(self.edge_uuids) - self._indexed_edges
+        if pending > max(MIN_COMPACTION_EDGES, self._indexed_edges * COMPACTION_RATIO):
+            self.compact()
+
+    def _edges(self, csr: _CSR, delta: dict[int, list[int]], node: int) -> Iterable[int]:
+        if node < self._indexed_nodes:
+            yield from csr.edge_ids[csr.offsets[node] : csr.offsets[node + 1]]
+        extra = delta.get(node)
+        if extra:
+            yield from extra
+
+    def out_edges(self, node: int) -> Iterable[int]:
+        return self._edges(self._out, self._delta_out, node)
+
+    def in_edges(self, node: int) -> Iterable[int]:
+        return self._edges(self._in, self._delta_in, node)
+
+    def expand(self, origin_uuids: list[str], max_depth: int) -> tuple[list[str], list[str]]:
+        """
+        Follow outgoing RELATES_TO and MENTIONS edges from the origins for up to max_depth hops.
+
+        Returns the entity nodes reached and the RELATES_TO edges traversed, both in breadth
+        first order, matching the variable-length path queries of the database BFS search.
+        """
+        depth: dict[int, int] = {}
+        queue: deque[int] = deque()
+        for uuid in origin_uuids:
+            origin = self.node_index.get(uuid)
+            if origin is not None and origin not in depth:
+                depth[origin] = 0
+                queue.append(origin)
+
+        origins = set(depth)
+        nodes: list[str] = []
+        edges: list[str] = []
+        seen_edges: set[int] = set()
+        while queue:
+            node = queue.popleft()
+            node_depth = depth[node]
+            if node_depth >= max_depth:
+                continue
+
+            for edge_id in self.out_edges(node):
+                target = self.edge_targets[edge_id]
+                if self.entity_edges[edge_id] and edge_id not in seen_edges:
+                    seen_edges.add(edge_id)
+                    edges.append(self.edge_uuids[edge_id])
+                if target not in depth:
+                    depth[target] = node_depth + 1
+                    queue.append(target)
+                    if target not in origins:
+                        nodes.append(self.node_uuids[target])
+
+        # Episodes are only ever reached as origins, so every node found is an entity
+        return nodes, edges
+
+    def hop_distances(
+        self, center_uuid: str, max_depth: int, targets: Iterable[str] | None = None
+    ) -> dict[str, int]:
+        """
+        Hop counts from the center over RELATES_TO edges in either direction, up to max_depth.
+
+        When targets are given the search stops as soon as all of them have been reached.
+        """
+        center = self.node_index.get(center_uuid)
+        if center is None:
+            return {}
+
+        remaining = (
+            {self.node_index[uuid] for uuid in targets if uuid in self.node_index}
+            if targets is not None
+            else None
+        )
+        depth = {center: 0}
+        queue = deque([center])
+        while queue and (remaining is None or remaining):
+            node = queue.popleft()
+            node_depth = depth[node]
+            if node_depth >= max_depth:
+                continue
+
+            for edge_id in self.out_edges(node):
+                if self.entity_edges[edge_id]:
+                    self._visit(self.edge_targets[edge_id], node_depth, depth, queue, remaining)
+            for edge_id in self.in_edges(node):
+                if self.entity_edges[edge_id]:
+                    self._visit(self.edge_sources[edge_id], node_depth, depth, queue, remaining)
+
+        return {self.node_uuids[node]: hops for node, hops in depth.items()}
+
+    @staticmethod
+    def _visit(
+        node: int,
+        node_depth: int,
+        depth: dict[int, int],
+        queue: deque[int],
+        remaining: set[int] | None,
+    ):
+        if node in depth:
+            return
+        depth[node] = node_depth + 1
+        queue.append(node)
+        if remaining is not None:
+            remaining.discard(node)
+
+
+class GraphSnapshotStore:
+    """
+    Lazily loaded, incrementally updated adjacency snapshots per group.
+
+    A group's snapshot is loaded with two queries the first time a search needs it and is
+    reloaded once it is older than ttl seconds, which bounds how long writes made outside this
+    process stay invisible. Writes made through Graphiti are applied as deltas right away.
+    Groups with more than max_edges edges are never loaded and always use the database.
+    """
+
+    def __init__(self, ttl: float = GRAPH_SNAPSHOT_TTL, max_edges: int = GRAPH_SNAPSHOT_MAX_EDGES):
+        self.ttl = ttl
+        self.max_edges = max_edges
+        self._snapshots: dict[str, GraphSnapshot] = {}
+        self._oversized: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        # Deltas that arrive while a group is loading, applied once the load completes
+        self._pending: dict[str, list[tuple[str, str, str, bool]]] = {}
+
+        self._loads = 0
+        self._load_time = 0.0
+        self._deltas = 0
+
+    async def get(self, driver: GraphDriver, group_id: str) -> GraphSnapshot | None:
+        """Return the group's snapshot, loading it if missing or expired, or None if too large."""
+        snapshot = self._snapshots.get(group_id)
+        if snapshot is not None and monotonic() - snapshot.loaded_at < self.ttl:
+            return snapshot
+
+        oversized_at = self._oversized.get(group_id)
+        if oversized_at is not None and monotonic() - oversized_at < self.ttl:
+            return None
+
+        lock = self._locks.setdefault(group_id, asyncio.Lock())
+        async with lock:
+            snapshot = self._snapshots.get(group_id)
+            if snapshot is not None and monotonic() - snapshot.loaded_at < self.ttl:
+                return snapshot
+            return await self._load(driver, group_id)
+
+    async def get_many(
+        self, driver: GraphDriver, group_ids: list[str]
+    ) -> list[GraphSnapshot] | None:
+        """Return snapshots for every group, or None if any group cannot be snapshotted."""
+        snapshots = []
+        for group_id in group_ids:
+            snapshot = await self.get(driver, group_id)
+            if snapshot is None:
+                return None
+            snapshots.append(snapshot)
+        return snapshots
+
+    async def _load(self, driver: GraphDriver, group_id: str) -> GraphSnapshot | None:
+        start = monotonic()
+        self._pending[group_id] = []
+        try:
+            entity_records, mention_records = await self._fetch(driver, group_id)
+        except Exception:
+            del self._pending[group_id]
+            raise
+
+        pending = self._pending.pop(group_id)
+        if len(entity_records) + len(mention_records) > self.max_edges:
+            logger.info(f'Group {group_id} is too large to snapshot; BFS will use the database')
+            self._snapshots.pop(group_id, None)
+            self._oversized[group_id] = monotonic()
+            return None
+
+        snapshot = GraphSnapshot(group_id)
+        for record in entity_records:
+            snapshot.add_edge(record['uuid'], record['source'], record['target'], True)
+        for record in mention_records:
+            snapshot.add_edge(record['uuid'], record['source'], record['target'], False)
+        for delta in pending:
+            snapshot.add_edge(*delta)
+        snapshot.compact()
+
+        self._snapshots[group_id] = snapshot
+        self._oversized.pop(group_id, None)
+        self._loads += 1
+        self._load_time += monotonic() - start
+        return snapshot
+
+    @staticmethod
+    async def _fetch(driver: GraphDriver, group_id: str) -> tuple[list, list]:
+        entity_query = """
+            MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+            WHERE e.group_id = $group_id
+            RETURN e.uuid AS uuid, n.uuid AS source, m.uuid AS target
+        """
+        if driver.provider == GraphProvider.KUZU:
+            entity_query = """
+                MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+                WHERE e.group_id = $group_id
+                RETURN e.uuid AS uuid, n.uuid AS source, m.uuid AS target
+            """
+
+        entity_records, _, _ = await driver.execute_query(
+            entity_query, group_id=group_id, routing_='r'
+        )
+        mention_records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Episodic)-[e:MENTIONS]->(m:Entity)
+            WHERE e.group_id = $group_id
+            RETURN e.uuid AS uuid, n.uuid AS source, m.uuid AS target
+            """,
+            group_id=group_id,
+            routing_='r',
+        )
+        return entity_records, mention_records
+
+    def add_edges(
+        self,
+        entity_edges: Iterable['EntityEdge'] = (),
+        episodic_edges: Iterable['EpisodicEdge'] = (),
+    ):
+        """Apply edges that were just saved to the snapshots of their groups."""
+        deltas = [
+            (edge.group_id, (edge.uuid, edge.source_node_uuid, edge.target_node_uuid, True))
+            for edge in entity_edges
+        ] + [
+            (edge.group_id, (edge.uuid, edge.source_node_uuid, edge.target_node_uuid, False))
+            for edge in episodic_edges
+        ]
+
+        touched: set[str] = set()
+        for group_id, delta in deltas:
+            pending = self._pending.get(group_id)
+            if pending is not None:
+                pending.append(delta)
+                continue
+
+            snapshot = self._snapshots.get(group_id)
+            if snapshot is not None and snapshot.add_edge(*delta):
+                self._deltas += 1
+                touched.add(group_id)
+
+        for group_id in touched:
+            self._snapshots[group_id].maybe_compact()
+
+    def invalidate(self, group_ids: Iterable[str] | None = None):
+        """Drop snapshots, of every group when group_ids is None, so they are reloaded."""
+        if group_ids is None:
+            self._snapshots.clear()
+            self._oversized.clear()
+            return
+
+        for group_id in group_ids:
+            self._snapshots.pop(group_id, None)
+            self._oversized.pop(group_id, None)
+
+    def metrics(self) -> GraphSnapshotMetrics:
+        snapshots = list(self._snapshots.values())
+        return GraphSnapshotMetrics(
+            groups=len(snapshots),
+            nodes=sum(len(snapshot.node_uuids) for snapshot in snapshots),
+            edges=sum(len(snapshot) for snapshot in snapshots),
+            loads=self._loads,
+            load_ms=self._load_time * 1000,
+            deltas=self._deltas,
+            compactions=sum(snapshot.compactions for snapshot in snapshots),
+            oversized_groups=len(self._oversized),
+        )
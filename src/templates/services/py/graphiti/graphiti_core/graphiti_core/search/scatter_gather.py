@@ -0,0 +1,211 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import math
+import os
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from time import perf_counter
+
+from pydantic import BaseModel
+
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_utils import rrf
+
+logger = logging.getLogger(__name__)
+
+
+class ShardMerge(Enum):
+    score = 'score'
+    rrf = 'rrf'
+
+
+# Seconds after which shards that have not answered are cancelled and left out, 0 waits for all
+SEARCH_SHARD_DEADLINE = float(os.getenv('SEARCH_SHARD_DEADLINE', 0))
+# Each shard returns ceil(limit * factor / shards) results, 0 returns the full limit (exact top-k)
+SEARCH_SHARD_LIMIT_FACTOR = float(os.getenv('SEARCH_SHARD_LIMIT_FACTOR', 0))
+SEARCH_SHARD_MERGE = ShardMerge(os.getenv('SEARCH_SHARD_MERGE', ShardMerge.score.value))
+
+RESULT_FIELDS = [
+    ('edges', 'edge_reranker_scores'),
+    ('nodes', 'node_reranker_scores'),
+    ('episodes', 'episode_reranker_scores'),
+    ('communities', 'community_reranker_scores'),
+]
+
+_collectors: ContextVar[tuple[list['ShardTiming'], ...]] = ContextVar(
+    'shard_timing_collectors', default=()
+)
+
+
+class ShardTiming(BaseModel):
+    group_id: str
+    status: str  # 'ok', 'timeout' or 'error'
+    elapsed_ms: float
+    results: int
+
+
+@contextmanager
+def collect_shard_timings() -> Generator[list[ShardTiming], None, None]:
+    """
+    Record the timing of every shard searched by a scatter-gather search inside the block.
+
+    >>> with collect_shard_timings() as timings:
+    ...     await graphiti.search_(query, group_ids=group_ids)
+    >>> max(timings, key=lambda t: t.elapsed_ms)
+    """
+    timings: list[ShardTiming] = []
+    token = _collectors.set(_collectors.get() + (timings,))
+    try:
+        yield timings
+    finally:
+        _collectors.reset(token)
+
+
+def shard_limit(limit: int, shards: int, factor: float = SEARCH_SHARD_LIMIT_FACTOR) -> int:
+    if factor <= 0 or shards <= 1:
+        return limit
+    return max(1, min(limit, math.ceil(limit * factor / shards)))
+
+
+def merge_search_results(
+    results_list: list[SearchResults], limit: int, merge: ShardMerge = SEARCH_SHARD_MERGE
+) -> SearchResults:
+    """
+    Merge per-shard results into a global top-limit for each result type.
+
+    With ShardMerge.score, results are ordered by their reranker scores, which is exact when
+    every shard uses the same reranker. With ShardMerge.rrf, results are fused by their rank in
+    each shard, which suits rerankers whose scores are not comparable across graphs.
+    """
+    merged = SearchResults()
+    for items_field, scores_field in RESULT_FIELDS:
+        items_by_uuid = {}
+        if merge == ShardMerge.rrf:
+            rankings = []
+            for results in results_list:
+                items = getattr(results, items_field)
+                for item in items:
+                    items_by_uuid.setdefault(item.uuid, item)
+                rankings.append([item.uuid for item in items])
+            uuids, scores = rrf(rankings)
+        else:
+            best: dict[str, float] = {}
+            for results in results_list:
+                items = getattr(results, items_field)
+                item_scores = getattr(results, scores_field)
+                for rank, item in enumerate(items):
+                    # Fall back to rank order for shards that did not report scores
+                    score = item_scores[rank] if rank < len(item_scores) else 1 / (rank + 1)
+                    if item.uuid not in best or score > best[item.uuid]:
+                        best[item.uuid] = score
+                        items_by_uuid[item.uuid] = item
+            uuids = sorted(best, key=lambda uuid: best[uuid], reverse=True)
+            scores = [best[uuid] for uuid in uuids]
+
+        setattr(merged, items_field, [items_by_uuid[uuid] for uuid in uuids[:limit]])
+        setattr(merged, scores_field, scores[:limit])
+
+    return merged
+
+
+async def scatter_gather_search(
+    shards: dict[str, Callable[[], Awaitable[SearchResults]]],
+    limit: int,
+    deadline: float = SEARCH_SHARD_DEADLINE,
+    merge: ShardMerge = SEARCH_SHARD_MERGE,
+    max_coroutines: int | None = None,
+) -> SearchResults:
+    """
+    Search every shard concurrently and merge their results into a global top-limit.
+
+    Shards still running after deadline seconds are cancelled, awaited and left out of the
+    results, so the call costs roughly the slowest shard that makes the deadline. A shard that raises fails
+    the whole search, as before. Timings are reported to collect_shard_timings.
+    """
+    semaphore = asyncio.Semaphore(max_coroutines or len(shards) or 1)
+    start = perf_counter()
+    finished: dict[str, float] = {}
+
+    async def run_shard(group_id: str, search: Callable[[], Awaitable[SearchResults]]):
+        async with semaphore:
+            try:
+                return await search()
+            finally:
+                finished[group_id] = (perf_counter() - start) * 1000
+
+    tasks = {
+        asyncio.create_task(run_shard(group_id, search)): group_id
+        for group_id, search in shards.items()
+    }
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=deadline or None)
+    finally:
+        # Stop stragglers, or every shard if the caller was cancelled, and let them unwind
+        # before returning so no shard keeps querying in the background
+        unfinished = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+    timings: list[ShardTiming] = []
+    shard_results: list[SearchResults] = []
+    error: BaseException | None = None
+    for task, group_id in tasks.items():
+        if task in pending:
+            timings.append(
+                ShardTiming(
+                    group_id=group_id, status='timeout', elapsed_ms=deadline * 1000, results=0
+                )
+            )
+            continue
+
+        exception = task.exception()
+        if exception is not None:
+            error = error or exception
+            timings.append(
+                ShardTiming(
+                    group_id=group_id, status='error', elapsed_ms=finished[group_id], results=0
+                )
+            )
+            continue
+
+        results = task.result()
+        shard_results.append(results)
+        timings.append(
+            ShardTiming(
+                group_id=group_id,
+                status='ok',
+                elapsed_ms=finished[group_id],
+                results=sum(len(getattr(results, field)) for field, _ in RESULT_FIELDS),
+            )
+        )
+
+    for collector in _collectors.get():
+        collector.extend(timings)
+    if pending:
+        logger.warning(
+            f'Search deadline of {deadline}s passed before {len(pending)} of {len(tasks)} shards '
+            f'answered: {[tasks[task] for task in pending]}'
+        )
+    if error is not None:
+        raise error
+
+    return merge_search_results(shard_results, limit, merge)
@@ -26,6 +26,7 @@ from graphiti_core.errors import SearchRerankerError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
+from graphiti_core.search.graph_snapshot import GraphSnapshotStore
 from graphiti_core.search.search_config import (
     DEFAULT_SEARCH_LIMIT,
     CommunityReranker,
@@ -128,6 +129,7 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            clients.graph_snapshots,
         ),
         node_search(
             driver,
@@ -141,6 +143,7 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            clients.graph_snapshots,
         ),
         episode_search(
             driver,
@@ -195,6 +198,7 @@ async def edge_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    graph_snapshots: GraphSnapshotStore | None = None,
 ) -> tuple[list[EntityEdge], list[float]]:
     if config is None:
         return [], []
@@ -227,6 +231,7 @@ async def edge_search(
                 search_filter,
                 group_ids,
                 2 * limit,
+                graph_snapshots=graph_snapshots,
             )
         )
 
@@ -245,6 +250,7 @@ async def edge_search(
                 search_filter,
                 group_ids,
                 2 * limit,
+                graph_snapshots=graph_snapshots,
             )
         )
 
@@ -267,7 +273,10 @@ async def edge_search(
             reranker_min_score,
         )
     elif config.reranker == EdgeReranker.cross_encoder:
-        fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
+        # use rrf as a preliminary reranker, so a reranker that times out falls back to rrf order
+        search_result_uuids = [[edge.uuid for edge in result] for result in search_results]
+        rrf_result_uuids, _ = rrf(search_result_uuids)
+        fact_to_uuid_map = {edge_uuid_map[uuid].fact: uuid for uuid in rrf_result_uuids[:limit]}
         reranked_facts = await cross_encoder.rank(query, list(fact_to_uuid_map.keys()))
         reranked_uuids = [
             fact_to_uuid_map[fact] for fact, score in reranked_facts if score >= reranker_min_score
@@ -292,7 +301,13 @@ async def edge_search(
         source_uuids = [source_node_uuid for source_node_uuid in source_to_edge_uuid_map]
 
         reranked_node_uuids, edge_scores = await node_distance_reranker(
-            driver, source_uuids, center_node_uuid, min_score=reranker_min_score
+            driver,
+            source_uuids,
+            center_node_uuid,
+            min_score=reranker_min_score,
+            group_ids=group_ids,
+            graph_snapshots=graph_snapshots,
+            max_depth=config.node_distance_max_depth,
         )
 
         for node_uuid in reranked_node_uuids:
@@ -318,6 +333,7 @@ async def node_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    graph_snapshots: GraphSnapshotStore | None = None,
 ) -> tuple[list[EntityNode], list[float]]:
     if config is None:
         return [], []
@@ -348,6 +364,7 @@ async def node_search(
                 config.bfs_max_depth,
                 group_ids,
                 2 * limit,
+                graph_snapshots=graph_snapshots,
             )
         )
 
@@ -366,6 +383,7 @@ async def node_search(
                 config.bfs_max_depth,
                 group_ids,
                 2 * limit,
+                graph_snapshots=graph_snapshots,
             )
         )
 
@@ -388,7 +406,9 @@ async def node_search(
             reranker_min_score,
         )
     elif config.reranker == NodeReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
+        # use rrf as a preliminary reranker, so a reranker that times out falls back to rrf order
+        rrf_result_uuids, _ = rrf(search_result_uuids)
+        name_to_uuid_map = {node_uuid_map[uuid].name: uuid for uuid in rrf_result_uuids}
 
         reranked_node_names = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
         reranked_uuids = [
@@ -409,6 +429,9 @@ async def node_search(
             rrf(search_result_uuids, min_score=reranker_min_score)[0],
             center_node_uuid,
             min_score=reranker_min_score,
+            group_ids=group_ids,
+            graph_snapshots=graph_snapshots,
+            max_depth=config.node_distance_max_depth,
         )
 
     reranked_nodes = [node_uuid_map[uuid] for uuid in reranked_uuids]
@@ -507,7 +530,9 @@ async def community_search(
             query_vector, search_result_uuids_and_vectors, config.mmr_lambda, reranker_min_score
         )
     elif config.reranker == CommunityReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for result in search_results for node in result}
+        # use rrf as a preliminary reranker, so a reranker that times out falls back to rrf order
+        rrf_result_uuids, _ = rrf(search_result_uuids)
+        name_to_uuid_map = {community_uuid_map[uuid].name: uuid for uuid in rrf_result_uuids}
         reranked_nodes = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
         reranked_uuids = [
             name_to_uuid_map[name] for name, score in reranked_nodes if score >= reranker_min_score
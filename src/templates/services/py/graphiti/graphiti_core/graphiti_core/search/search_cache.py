@@ -0,0 +1,178 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+
+from pydantic import BaseModel
+
+from graphiti_core.helpers import LRUCache
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_filters import SearchFilters
+
+SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', 1024))
+
+
+class SearchCacheStats(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    stale: int
+    evictions: int
+    invalidations: int
+    hit_rate: float
+
+
+class SearchCacheVersions(BaseModel):
+    epoch: int
+    # Versions of the searched groups, or of all writes when the search spans every group
+    group_versions: dict[str, int] | None
+    any_version: int
+
+
+class _CacheEntry(BaseModel):
+    results: SearchResults
+    versions: SearchCacheVersions
+
+
+class SearchCache:
+    """
+    In-memory LRU of search results, invalidated by per-group version counters.
+
+    Every write to a group bumps that group's version. A search captures the versions of the
+    groups it reads before it starts and its results are only cached, and later served, while
+    those versions are unchanged, so a write that lands mid-search is never hidden. Searches
+    across all groups (group_ids=None) depend on every write and go stale on any invalidation.
+    """
+
+    def __init__(self, max_size: int = SEARCH_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+        # Hits and misses are counted here, since a stale entry is a miss to callers
+        self._entries: LRUCache[str, _CacheEntry] = LRUCache(max_size)
+        self._group_versions: dict[str, int] = {}
+        # Bumped by every invalidation, so searches spanning all groups see any write
+        self._any_version = 0
+        # Bumped when an invalidation does not name its groups
+        self._epoch = 0
+
+    @staticmethod
+    def key(
+        query: str,
+        group_ids: list[str] | None,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        database: str | None = None,
+    ) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                [
+                    query,
+                    sorted(group_ids) if group_ids is not None else None,
+                    config.model_dump(mode='json'),
+                    search_filter.model_dump(mode='json'),
+                    center_node_uuid,
+                    sorted(bfs_origin_node_uuids) if bfs_origin_node_uuids is not None else None,
+                    database,
+                ],
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+    def versions(self, group_ids: list[str] | None) -> SearchCacheVersions:
+        """Capture the versions a search over group_ids depends on, before it runs."""
+        return SearchCacheVersions(
+            epoch=self._epoch,
+            group_versions=(
+                {group_id: self._group_versions.get(group_id, 0) for group_id in group_ids}
+                if group_ids
+                else None
+            ),
+            any_version=self._any_version,
+        )
+
+    def get(self, key: str) -> SearchResults | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if not self._is_current(entry.versions):
+            self._entries.pop(key)
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Callers may modify what they get back, so the cached copy is never handed out
+        return entry.results.model_copy(deep=True)
+
+    def set(self, key: str, results: SearchResults, versions: SearchCacheVersions):
+        if not self._is_current(versions):
+            # A write landed while the search ran, so its results may already be out of date
+            return
+
+        self._entries.set(
+            key, _CacheEntry(results=results.model_copy(deep=True), versions=versions)
+        )
+
+    def invalidate(self, group_ids: Iterable[str] | None = None):
+        """Mark results for group_ids, or for every group when None, as stale."""
+        self.invalidations += 1
+        self._any_version += 1
+        if group_ids is None:
+            self._epoch += 1
+            return
+
+        for group_id in group_ids:
+            self._group_versions[group_id] = self._group_versions.get(group_id, 0) + 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> SearchCacheStats:
+        lookups = self.hits + self.misses
+        return SearchCacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+            stale=self.stale,
+            evictions=self._entries.evictions,
+            invalidations=self.invalidations,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+        )
+
+    def _is_current(self, versions: SearchCacheVersions) -> bool:
+        if versions.epoch != self._epoch:
+            return False
+        if versions.group_versions is None:
+            return versions.any_version == self._any_version
+        return all(
+            self._group_versions.get(group_id, 0) == version
+            for group_id, version in versions.group_versions.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -83,6 +83,8 @@ class EdgeSearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    # Hops from the center node beyond which the node_distance reranker scores 0
+    node_distance_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
 class NodeSearchConfig(BaseModel):
@@ -91,6 +93,8 @@ class NodeSearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    # Hops from the center node beyond which the node_distance reranker scores 0
+    node_distance_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
 class EpisodeSearchConfig(BaseModel):
@@ -52,6 +52,7 @@ from graphiti_core.nodes import (
     get_entity_node_from_record,
     get_episodic_node_from_record,
 )
+from graphiti_core.search.graph_snapshot import GraphSnapshotStore
 from graphiti_core.search.search_filters import (
     SearchFilters,
     edge_search_filter_query_constructor,
@@ -437,11 +438,21 @@ async def edge_bfs_search(
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
+    graph_snapshots: GraphSnapshotStore | None = None,
 ) -> list[EntityEdge]:
     # vector similarity search over embedded facts
     if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
         return []
 
+    if graph_snapshots is not None:
+        expanded = await snapshot_bfs(
+            driver, graph_snapshots, bfs_origin_node_uuids, bfs_max_depth, group_ids
+        )
+        if expanded is not None:
+            return await get_entity_edges_in_order(
+                driver, expanded[1], search_filter, group_ids, limit
+            )
+
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -553,6 +564,143 @@ async def edge_bfs_search(
     return edges
 
 
+async def snapshot_bfs(
+    driver: GraphDriver,
+    graph_snapshots: GraphSnapshotStore,
+    bfs_origin_node_uuids: list[str],
+    bfs_max_depth: int,
+    group_ids: list[str] | None,
+) -> tuple[list[str], list[str]] | None:
+    """
+    Run a BFS over the in-memory snapshots of group_ids, returning the entity node uuids and
+    entity edge uuids reached in breadth first order.
+
+    Returns None when the database has to be searched instead: when the search is not scoped to
+    groups, a group is too large to snapshot, or an origin is missing from the snapshots, which
+    happens when it was written by another process since they were loaded.
+    """
+    if not group_ids:
+        return None
+
+    snapshots = await graph_snapshots.get_many(driver, group_ids)
+    if snapshots is None:
+        return None
+
+    if any(
+        all(uuid not in snapshot.node_index for snapshot in snapshots)
+        for uuid in bfs_origin_node_uuids
+    ):
+        return None
+
+    node_uuids: dict[str, None] = {}
+    edge_uuids: dict[str, None] = {}
+    for snapshot in snapshots:
+        origins = [uuid for uuid in bfs_origin_node_uuids if uuid in snapshot.node_index]
+        if not origins:
+            continue
+        nodes, edges = snapshot.expand(origins, bfs_max_depth)
+        node_uuids.update(dict.fromkeys(nodes))
+        edge_uuids.update(dict.fromkeys(edges))
+
+    return list(node_uuids), list(edge_uuids)
+
+
+async def get_entity_edges_in_order(
+    driver: GraphDriver,
+    edge_uuids: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EntityEdge]:
+    """Load the first limit edges of edge_uuids that pass the filters, keeping their order."""
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+    filter_queries.append('e.uuid IN $edge_uuids')
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    match_query = """
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+        """
+
+    query = (
+        match_query
+        + ' WHERE '
+        + ' AND '.join(filter_queries)
+        + """
+        RETURN
+        """
+        + get_entity_edge_return_query(driver.provider)
+    )
+
+    edges: list[EntityEdge] = []
+    # Unfiltered searches fill the limit from the first batch; filters may need more
+    for i in range(0, len(edge_uuids), limit):
+        batch = edge_uuids[i : i + limit]
+        records, _, _ = await driver.execute_query(
+            query, edge_uuids=batch, routing_='r', **filter_params
+        )
+        found = {
+            edge.uuid: edge
+            for edge in (get_entity_edge_from_record(record, driver.provider) for record in records)
+        }
+        edges.extend(found[uuid] for uuid in batch if uuid in found)
+        if len(edges) >= limit:
+            break
+
+    return edges[:limit]
+
+
+async def get_entity_nodes_in_order(
+    driver: GraphDriver,
+    node_uuids: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EntityNode]:
+    """Load the first limit nodes of node_uuids that pass the filters, keeping their order."""
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+    filter_queries.append('n.uuid IN $node_uuids')
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    query = (
+        """
+        MATCH (n:Entity)
+        WHERE """
+        + ' AND '.join(filter_queries)
+        + """
+        RETURN
+        """
+        + get_entity_node_return_query(driver.provider)
+    )
+
+    nodes: list[EntityNode] = []
+    for i in range(0, len(node_uuids), limit):
+        batch = node_uuids[i : i + limit]
+        records, _, _ = await driver.execute_query(
+            query, node_uuids=batch, routing_='r', **filter_params
+        )
+        found = {
+            node.uuid: node
+            for node in (get_entity_node_from_record(record, driver.provider) for record in records)
+        }
+        nodes.extend(found[uuid] for uuid in batch if uuid in found)
+        if len(nodes) >= limit:
+            break
+
+    return nodes[:limit]
+
+
 async def node_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -771,10 +919,20 @@ async def node_bfs_search(
     bfs_max_depth: int,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
+    graph_snapshots: GraphSnapshotStore | None = None,
 ) -> list[EntityNode]:
     if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
         return []
 
+    if graph_snapshots is not None:
+        expanded = await snapshot_bfs(
+            driver, graph_snapshots, bfs_origin_node_uuids, bfs_max_depth, group_ids
+        )
+        if expanded is not None:
+            return await get_entity_nodes_in_order(
+                driver, expanded[0], search_filter, group_ids, limit
+            )
+
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -1753,37 +1911,34 @@ async def node_distance_reranker(
     node_uuids: list[str],
     center_node_uuid: str,
     min_score: float = 0,
+    group_ids: list[str] | None = None,
+    graph_snapshots: GraphSnapshotStore | None = None,
+    max_depth: int = MAX_SEARCH_DEPTH,
 ) -> tuple[list[str], list[float]]:
+    """
+    Rank nodes by the number of RELATES_TO hops, in either direction, to the center node.
+
+    Nodes k hops away score 1/k. Nodes further than max_depth hops, or not connected, score 0.
+    """
     # filter out node_uuid center node node uuid
     filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
     scores: dict[str, float] = {center_node_uuid: 0.0}
 
-    query = """
-    UNWIND $node_uuids AS node_uuid
-    MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-    RETURN 1 AS score, node_uuid AS uuid
-    """
-    if driver.provider == GraphProvider.KUZU:
-        query = """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
-        """
+    distances = None
+    if graph_snapshots is not None and group_ids:
+        snapshots = await graph_snapshots.get_many(driver, group_ids)
+        center_snapshot = next(
+            (s for s in snapshots or [] if center_node_uuid in s.node_index), None
+        )
+        if center_snapshot is not None:
+            distances = center_snapshot.hop_distances(center_node_uuid, max_depth, filtered_uuids)
 
-    # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
-    )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
+    if distances is None:
+        distances = await get_hop_distances(driver, filtered_uuids, center_node_uuid, max_depth)
 
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+    for uuid, hops in distances.items():
+        if hops > 0:
+            scores[uuid] = hops
 
     for uuid in filtered_uuids:
         if uuid not in scores:
@@ -1802,6 +1957,50 @@ async def node_distance_reranker(
     ]
 
 
+async def get_hop_distances(
+    driver: GraphDriver,
+    node_uuids: list[str],
+    center_node_uuid: str,
+    max_depth: int = MAX_SEARCH_DEPTH,
+) -> dict[str, int]:
+    """
+    Return the shortest RELATES_TO hop count from the center to each of node_uuids within
+    max_depth, in a single query. Nodes that are further away are omitted.
+    """
+    if not node_uuids or max_depth < 1:
+        return {}
+
+    if driver.provider == GraphProvider.NEO4J:
+        query = f"""
+        UNWIND $node_uuids AS node_uuid
+        MATCH (center:Entity {{uuid: $center_uuid}}), (n:Entity {{uuid: node_uuid}})
+        MATCH path = shortestPath((center)-[:RELATES_TO*..{max_depth}]-(n))
+        RETURN length(path) AS distance, node_uuid AS uuid
+        """
+    elif driver.provider == GraphProvider.KUZU:
+        # Every entity edge is two RELATES_TO hops through its RelatesToNode_
+        query = f"""
+        UNWIND $node_uuids AS node_uuid
+        MATCH path = (center:Entity {{uuid: $center_uuid}})-[:RELATES_TO* SHORTEST 1..{max_depth * 2}]-(n:Entity {{uuid: node_uuid}})
+        RETURN length(path) / 2 AS distance, node_uuid AS uuid
+        """
+    else:
+        query = f"""
+        UNWIND $node_uuids AS node_uuid
+        MATCH path = (center:Entity {{uuid: $center_uuid}})-[:RELATES_TO*1..{max_depth}]-(n:Entity {{uuid: node_uuid}})
+        RETURN min(length(path)) AS distance, node_uuid AS uuid
+        """
+
+    results, _, _ = await driver.execute_query(
+        query,
+        node_uuids=node_uuids,
+        center_uuid=center_node_uuid,
+        routing_='r',
+    )
+
+    return {result['uuid']: result['distance'] for result in results}
+
+
 async def episode_mentions_reranker(
     driver: GraphDriver, node_uuids: list[list[str]], min_score: float = 0
 ) -> tuple[list[str], list[float]]:
@@ -17,6 +17,7 @@ limitations under the License.
 from abc import ABC, abstractmethod
 from collections.abc import Generator
 from contextlib import AbstractContextManager, contextmanager, suppress
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -29,6 +30,19 @@ try:
 except ImportError:
     OTEL_AVAILABLE = False
 
+# Name of the innermost span started through a graphiti tracer, used to attribute work such as
+# database round trips to the operation that caused it
+current_span_name: ContextVar[str | None] = ContextVar('graphiti_current_span_name', default=None)
+
+
+@contextmanager
+def _span_name_scope(name: str) -> Generator[None, None, None]:
+    token = current_span_name.set(name)
+    try:
+        yield
+    finally:
+        current_span_name.reset(token)
+
 
 class TracerSpan(ABC):
     """Abstract base class for tracer spans."""
@@ -77,7 +91,8 @@ class NoOpTracer(Tracer):
     @contextmanager
     def start_span(self, name: str) -> Generator[NoOpSpan, None, None]:
         """Return a no-op span."""
-        yield NoOpSpan()
+        with _span_name_scope(name):
+            yield NoOpSpan()
 
 
 class OpenTelemetrySpan(TracerSpan):
@@ -149,7 +164,7 @@ class OpenTelemetryTracer(Tracer):
         """Start a new OpenTelemetry span with the configured prefix."""
         try:
             full_name = f'{self._span_prefix}.{name}'
-            with self._tracer.start_as_current_span(full_name) as span:
+            with _span_name_scope(name), self._tracer.start_as_current_span(full_name) as span:
                 yield OpenTelemetrySpan(span)
         except Exception:
             # If tracing fails, yield a no-op span to prevent breaking the operation
@@ -16,8 +16,13 @@ limitations under the License.
 
 import json
 import logging
+import os
 import typing
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime
+from time import perf_counter
 
 import numpy as np
 from pydantic import BaseModel, Field
@@ -28,6 +33,11 @@ from graphiti_core.driver.driver import (
     GraphDriverSession,
     GraphProvider,
 )
+from graphiti_core.driver.kuzu_bulk import (
+    KUZU_BULK_COPY_THRESHOLD,
+    UnsafeCSVValueError,
+    copy_nodes_and_edges_bulk,
+)
 from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.graphiti_types import GraphitiClients
@@ -40,8 +50,13 @@ from graphiti_core.models.nodes.node_db_queries import (
     get_entity_node_save_bulk_query,
     get_episode_node_save_bulk_query,
 )
-from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
-from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
+from graphiti_core.nodes import (
+    EntityNode,
+    EpisodeType,
+    EpisodicNode,
+    create_entity_node_embeddings,
+)
+from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings, ensure_utc
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupResolutionState,
     _build_candidate_indexes,
@@ -51,10 +66,12 @@ from graphiti_core.utils.maintenance.dedup_helpers import (
 from graphiti_core.utils.maintenance.edge_operations import (
     extract_edges,
     resolve_extracted_edge,
+    resolve_extracted_edges_batch,
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
     retrieve_episodes,
+    retrieve_episodes_between,
 )
 from graphiti_core.utils.maintenance.node_operations import (
     extract_nodes,
@@ -65,6 +82,9 @@ logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 10
 
+# Maximum rows written per transaction by add_nodes_and_edges_bulk, 0 writes each batch at once
+BULK_WRITE_CHUNK_SIZE = int(os.getenv('BULK_WRITE_CHUNK_SIZE', 1000))
+
 
 def _build_directed_uuid_map(pairs: list[tuple[str, str]]) -> dict[str, str]:
     """Collapse alias -> canonical chains while preserving direction.
@@ -107,24 +127,126 @@ class RawEpisode(BaseModel):
     reference_time: datetime
 
 
+class BulkWriteChunk(BaseModel):
+    index: int
+    episodes: int
+    entity_nodes: int
+    episodic_edges: int
+    entity_edges: int
+    elapsed_ms: float
+
+
+async def iterate_episode_windows(
+    episodes: Iterable[RawEpisode] | AsyncIterable[RawEpisode], window_size: int
+) -> AsyncIterator[list[RawEpisode]]:
+    """Yield consecutive windows of at most window_size episodes from a sync or async source."""
+    if window_size < 1:
+        raise ValueError('window_size must be at least 1')
+
+    window: list[RawEpisode] = []
+    if isinstance(episodes, AsyncIterable):
+        async for episode in episodes:
+            window.append(episode)
+            if len(window) == window_size:
+                yield window
+                window = []
+    else:
+        for episode in episodes:
+            window.append(episode)
+            if len(window) == window_size:
+                yield window
+                window = []
+
+    if window:
+        yield window
+
+
 async def retrieve_previous_episodes_bulk(
     driver: GraphDriver, episodes: list[EpisodicNode]
 ) -> list[tuple[EpisodicNode, list[EpisodicNode]]]:
-    previous_episodes_list = await semaphore_gather(
+    """
+    Compute the previous episode window of every episode in a batch.
+
+    Rather than querying once per episode, this fetches the stored episodes that fall within the
+    batch's time range plus the window preceding it, merges in the batch's own episodes and slices
+    each window in memory.
+    """
+    if not episodes:
+        return []
+
+    episodes_by_group: dict[str, list[EpisodicNode]] = defaultdict(list)
+    for episode in episodes:
+        episodes_by_group[episode.group_id].append(episode)
+
+    group_ids = list(episodes_by_group.keys())
+    valid_ats = [episode.valid_at for episode in episodes]
+    start_time = min(valid_ats, key=_episode_time)
+    end_time = max(valid_ats, key=_episode_time)
+
+    stored_in_range, *stored_before = await semaphore_gather(
+        retrieve_episodes_between(driver, start_time, end_time, group_ids),
         *[
-            retrieve_episodes(
-                driver, episode.valid_at, last_n=EPISODE_WINDOW_LEN, group_ids=[episode.group_id]
-            )
-            for episode in episodes
-        ]
+            retrieve_episodes(driver, start_time, last_n=EPISODE_WINDOW_LEN, group_ids=[group_id])
+            for group_id in group_ids
+        ],
     )
+
+    candidates_by_group: dict[str, dict[str, EpisodicNode]] = defaultdict(dict)
+    for episode in [*stored_in_range, *(e for lst in stored_before for e in lst), *episodes]:
+        candidates_by_group[episode.group_id][episode.uuid] = episode
+
+    windows: dict[str, list[EpisodicNode]] = {}
+    for group_id, group_episodes in episodes_by_group.items():
+        timeline = sorted(
+            candidates_by_group[group_id].values(),
+            key=lambda e: _episode_time(e.valid_at),
+        )
+        timeline_times = [_episode_time(e.valid_at) for e in timeline]
+        for episode in group_episodes:
+            # Matches retrieve_episodes: the last N episodes with valid_at <= the episode's valid_at
+            end = bisect_right(timeline_times, _episode_time(episode.valid_at))
+            windows[episode.uuid] = timeline[max(end - EPISODE_WINDOW_LEN, 0) : end]
+
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]] = [
-        (episode, previous_episodes_list[i]) for i, episode in enumerate(episodes)
+        (episode, windows[episode.uuid]) for episode in episodes
     ]
 
     return episode_tuples
 
 
+def _episode_time(valid_at: datetime) -> datetime:
+    return ensure_utc(valid_at) or valid_at
+
+
+def _bulk_write_chunks(
+    episodic_nodes: list[EpisodicNode],
+    episodic_edges: list[EpisodicEdge],
+    entity_nodes: list[EntityNode],
+    entity_edges: list[EntityEdge],
+    chunk_size: int,
+) -> Iterable[tuple[list[EpisodicNode], list[EpisodicEdge], list[EntityNode], list[EntityEdge]]]:
+    # Every node chunk comes before the first edge chunk, so edge endpoints are always committed
+    nodes: list[EpisodicNode | EntityNode] = [*episodic_nodes, *entity_nodes]
+    for start in range(0, len(nodes), chunk_size):
+        chunk = nodes[start : start + chunk_size]
+        yield (
+            [node for node in chunk if isinstance(node, EpisodicNode)],
+            [],
+            [node for node in chunk if isinstance(node, EntityNode)],
+            [],
+        )
+
+    edges: list[EpisodicEdge | EntityEdge] = [*episodic_edges, *entity_edges]
+    for start in range(0, len(edges), chunk_size):
+        chunk = edges[start : start + chunk_size]
+        yield (
+            [],
+            [edge for edge in chunk if isinstance(edge, EpisodicEdge)],
+            [],
+            [edge for edge in chunk if isinstance(edge, EntityEdge)],
+        )
+
+
 async def add_nodes_and_edges_bulk(
     driver: GraphDriver,
     episodic_nodes: list[EpisodicNode],
@@ -132,21 +254,68 @@ async def add_nodes_and_edges_bulk(
     entity_nodes: list[EntityNode],
     entity_edges: list[EntityEdge],
     embedder: EmbedderClient,
-):
+    chunk_size: int | None = None,
+) -> list[BulkWriteChunk]:
+    """
+    Save a batch of nodes and edges, returning the row counts and timing of every transaction.
+
+    Batches larger than chunk_size (default BULK_WRITE_CHUNK_SIZE) rows are split into separate
+    write transactions: all episodes and entities first, then mentions and entity edges. Each
+    chunk is its own managed transaction, so a transient error retries that chunk instead of the
+    whole batch, and because the save queries MERGE on uuid a replayed chunk does not duplicate
+    rows. Kuzu always saves the batch at once, since it has no transactions to bound and its
+    COPY FROM path is faster on larger batches.
+    """
+    chunk_size = BULK_WRITE_CHUNK_SIZE if chunk_size is None else chunk_size
+    total_rows = len(episodic_nodes) + len(episodic_edges) + len(entity_nodes) + len(entity_edges)
+
+    if chunk_size <= 0 or total_rows <= chunk_size or driver.provider == GraphProvider.KUZU:
+        chunks: Iterable[
+            tuple[list[EpisodicNode], list[EpisodicEdge], list[EntityNode], list[EntityEdge]]
+        ] = [(episodic_nodes, episodic_edges, entity_nodes, entity_edges)]
+    else:
+        # Embed up front rather than inside the transactions, which would hold them open
+        await semaphore_gather(
+            create_entity_node_embeddings(
+                embedder, [node for node in entity_nodes if node.name_embedding is None]
+            ),
+            create_entity_edge_embeddings(
+                embedder, [edge for edge in entity_edges if edge.fact_embedding is None]
+            ),
+        )
+        chunks = _bulk_write_chunks(
+            episodic_nodes, episodic_edges, entity_nodes, entity_edges, chunk_size
+        )
+
+    timings: list[BulkWriteChunk] = []
     session = driver.session()
     try:
-        await session.execute_write(
-            add_nodes_and_edges_bulk_tx,
-            episodic_nodes,
-            episodic_edges,
-            entity_nodes,
-            entity_edges,
-            embedder,
-            driver=driver,
-        )
+        for index, (episodes, mentions, nodes, edges) in enumerate(chunks):
+            start = perf_counter()
+            await session.execute_write(
+                add_nodes_and_edges_bulk_tx,
+                episodes,
+                mentions,
+                nodes,
+                edges,
+                embedder,
+                driver=driver,
+            )
+            timing = BulkWriteChunk(
+                index=index,
+                episodes=len(episodes),
+                entity_nodes=len(nodes),
+                episodic_edges=len(mentions),
+                entity_edges=len(edges),
+                elapsed_ms=(perf_counter() - start) * 1000,
+            )
+            logger.debug(f'Saved bulk write chunk {timing}')
+            timings.append(timing)
     finally:
         await session.close()
 
+    return timings
+
 
 async def add_nodes_and_edges_bulk_tx(
     tx: GraphDriverSession,
@@ -222,7 +391,18 @@ async def add_nodes_and_edges_bulk_tx(
         await driver.graph_operations_interface.edge_save_bulk(None, driver, tx, edges)
 
     elif driver.provider == GraphProvider.KUZU:
-        # FIXME: Kuzu's UNWIND does not currently support STRUCT[] type properly, so we insert the data one by one instead for now.
+        mentions = [edge.model_dump() for edge in episodic_edges]
+        # Kuzu's UNWIND does not support STRUCT[] properly, so large batches are staged as CSV
+        # and loaded with COPY FROM, and small ones are inserted one row at a time.
+        if len(episodes) + len(nodes) + len(edges) + len(mentions) >= KUZU_BULK_COPY_THRESHOLD:
+            try:
+                # Only new rows are copied, the rows that already exist are merged below
+                episodes, nodes, edges, mentions = await copy_nodes_and_edges_bulk(
+                    driver, episodes, nodes, edges, mentions
+                )
+            except UnsafeCSVValueError as e:
+                logger.warning(f'Falling back to per-row Kuzu inserts: {e}')
+
         episode_query = get_episode_node_save_bulk_query(driver.provider)
         for episode in episodes:
             await tx.run(episode_query, **episode)
@@ -233,8 +413,8 @@ async def add_nodes_and_edges_bulk_tx(
         for edge in edges:
             await tx.run(entity_edge_query, **edge)
         episodic_edge_query = get_episodic_edge_save_bulk_query(driver.provider)
-        for edge in episodic_edges:
-            await tx.run(episodic_edge_query, **edge.model_dump())
+        for mention in mentions:
+            await tx.run(episodic_edge_query, **mention)
     else:
         await tx.run(get_episode_node_save_bulk_query(driver.provider), episodes=episodes)
         await tx.run(
@@ -406,6 +586,7 @@ async def dedupe_edges_bulk(
     _entities: list[EntityNode],
     edge_types: dict[str, type[BaseModel]],
     _edge_type_map: dict[tuple[str, str], list[str]],
+    batch_size: int | None = None,
 ) -> dict[str, list[EntityEdge]]:
     embedder = clients.embedder
     min_score = 0.6
@@ -453,22 +634,33 @@ async def dedupe_edges_bulk(
 
             dedupe_tuples.append((episode_tuples[i][0], edge, candidates))
 
-    bulk_edge_resolutions: list[
-        tuple[EntityEdge, EntityEdge, list[EntityEdge]]
-    ] = await semaphore_gather(
-        *[
-            resolve_extracted_edge(
-                clients.llm_client,
-                edge,
-                candidates,
-                candidates,
-                episode,
-                edge_types,
-                set(edge_types),
-            )
-            for episode, edge, candidates in dedupe_tuples
-        ]
-    )
+    bulk_edge_resolutions: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]
+    if batch_size is not None:
+        bulk_edge_resolutions = await resolve_extracted_edges_batch(
+            clients.llm_client,
+            [edge for _, edge, _ in dedupe_tuples],
+            [candidates for _, _, candidates in dedupe_tuples],
+            [candidates for _, _, candidates in dedupe_tuples],
+            [episode for episode, _, _ in dedupe_tuples],
+            [edge_types] * len(dedupe_tuples),
+            set(edge_types),
+            batch_size,
+        )
+    else:
+        bulk_edge_resolutions = await semaphore_gather(
+            *[
+                resolve_extracted_edge(
+                    clients.llm_client,
+                    edge,
+                    candidates,
+                    candidates,
+                    episode,
+                    edge_types,
+                    set(edge_types),
+                )
+                for episode, edge, candidates in dedupe_tuples
+            ]
+        )
 
     # For now we won't track edge invalidation
     duplicate_pairs: list[tuple[str, str]] = []
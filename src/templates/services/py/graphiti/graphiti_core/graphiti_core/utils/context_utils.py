@@ -0,0 +1,128 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+
+from pydantic import BaseModel
+
+from graphiti_core.nodes import EpisodicNode
+from graphiti_core.utils.text_utils import CHARS_PER_TOKEN, estimate_tokens, truncate_at_sentence
+
+# Token budget for previous-episode context in episode-level extraction prompts
+CONTEXT_TOKEN_BUDGET = int(os.getenv('CONTEXT_TOKEN_BUDGET', 2000))
+# Token budget for previous-episode context in prompts that fan out per node
+NODE_CONTEXT_TOKEN_BUDGET = int(os.getenv('NODE_CONTEXT_TOKEN_BUDGET', 500))
+
+# Previous episodes that would get less than this many tokens are dropped, not truncated
+MIN_EPISODE_TOKENS = 50
+
+PROMPT_CONTEXT_TOKEN_BUDGETS: dict[str, int] = {
+    'extract_nodes.extract_attributes': NODE_CONTEXT_TOKEN_BUDGET,
+    'extract_nodes.extract_summary': NODE_CONTEXT_TOKEN_BUDGET,
+}
+
+
+def get_context_token_budget(prompt_name: str) -> int:
+    return PROMPT_CONTEXT_TOKEN_BUDGETS.get(prompt_name, CONTEXT_TOKEN_BUDGET)
+
+
+class PromptContextStats(BaseModel):
+    calls: int = 0
+    original_tokens: int = 0
+    sent_tokens: int = 0
+    tokens_saved: int = 0
+
+
+class ContextTokenStats:
+    """Running totals of previous-episode tokens sent and saved, keyed by prompt_name."""
+
+    def __init__(self):
+        self._stats: dict[str, PromptContextStats] = {}
+
+    def record(self, prompt_name: str, original_tokens: int, sent_tokens: int):
+        stats = self._stats.setdefault(prompt_name, PromptContextStats())
+        stats.calls += 1
+        stats.original_tokens += original_tokens
+        stats.sent_tokens += sent_tokens
+        stats.tokens_saved += original_tokens - sent_tokens
+
+    def snapshot(self) -> dict[str, PromptContextStats]:
+        return {name: stats.model_copy() for name, stats in self._stats.items()}
+
+    def reset(self):
+        self._stats.clear()
+
+
+context_token_stats = ContextTokenStats()
+
+
+def compress_episode_contents(contents: list[str], token_budget: int) -> list[str]:
+    """
+    Fit episode contents into token_budget, keeping the most recent episodes intact.
+
+    contents are in chronological order. Episodes are taken newest first; the first one that
+    does not fit is cut at a sentence boundary and everything older is dropped. The result
+    keeps chronological order.
+    """
+    kept: list[str] = []
+    remaining = token_budget
+    for content in reversed(contents):
+        tokens = estimate_tokens(content)
+        if tokens <= remaining:
+            kept.append(content)
+            remaining -= tokens
+            continue
+
+        if remaining >= MIN_EPISODE_TOKENS:
+            kept.append(truncate_at_sentence(content, remaining * CHARS_PER_TOKEN))
+        break
+
+    kept.reverse()
+    return kept
+
+
+class PreviousEpisodeContext:
+    """
+    Previous-episode context for one episode, compressed once per budget and shared by every
+    prompt built from it.
+    """
+
+    def __init__(
+        self,
+        previous_episodes: list[EpisodicNode] | None,
+        stats: ContextTokenStats | None = None,
+    ):
+        self._contents = [ep.content for ep in previous_episodes or []]
+        self._original_tokens = sum(estimate_tokens(content) for content in self._contents)
+        self._compressed: dict[int, tuple[list[str], int]] = {}
+        self._stats = stats if stats is not None else context_token_stats
+
+    def for_prompt(self, prompt_name: str) -> list[str]:
+        """Return the previous-episode contents to send with prompt_name and record the savings."""
+        budget = get_context_token_budget(prompt_name)
+        if budget not in self._compressed:
+            if self._original_tokens <= budget:
+                compressed = self._contents
+            else:
+                compressed = compress_episode_contents(self._contents, budget)
+            self._compressed[budget] = (
+                compressed,
+                sum(estimate_tokens(content) for content in compressed),
+            )
+
+        contents, sent_tokens = self._compressed[budget]
+        self._stats.record(prompt_name, self._original_tokens, sent_tokens)
+        return contents
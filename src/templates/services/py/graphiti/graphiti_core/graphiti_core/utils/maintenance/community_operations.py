@@ -1,33 +1,72 @@
 import asyncio
+import hashlib
+import json
 import logging
+import os
 from collections import defaultdict
+from enum import Enum
 
+import numpy as np
 from pydantic import BaseModel
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
-from graphiti_core.helpers import semaphore_gather
+from graphiti_core.helpers import LRUCache, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.models.nodes.node_db_queries import COMMUNITY_NODE_RETURN
 from graphiti_core.nodes import CommunityNode, EntityNode, get_community_node_from_record
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.summarize_nodes import Summary, SummaryDescription
+from graphiti_core.prompts.summarize_nodes import (
+    Summary,
+    SummaryDescription,
+    SummaryWithDescription,
+)
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
+from graphiti_core.utils.text_utils import estimate_tokens
 
 MAX_COMMUNITY_BUILD_CONCURRENCY = 10
+MAX_LABEL_PROPAGATION_ITERATIONS = 100
+LABEL_PROPAGATION_TOLERANCE = 0.0
+MAX_SUMMARY_FAN_IN = int(os.getenv('MAX_SUMMARY_FAN_IN', 16))
+SUMMARY_TOKEN_BUDGET = int(os.getenv('SUMMARY_TOKEN_BUDGET', 4000))
+DEFAULT_SUMMARY_CACHE_SIZE = 4096
 
 logger = logging.getLogger(__name__)
 
 
+class CommunityDetectionMethod(Enum):
+    label_propagation = 'label_propagation'
+    leiden = 'leiden'
+    louvain = 'louvain'
+
+
 class Neighbor(BaseModel):
     node_uuid: str
     edge_count: int
 
 
+class SummaryCache(LRUCache[str, dict[str, str]]):
+    """
+    In-memory LRU of LLM summaries keyed by the exact set of summaries they were built from.
+
+    Rebuilding a community that only gained or lost a few members re-uses the summaries of
+    every member subset that did not change.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SUMMARY_CACHE_SIZE):
+        super().__init__(max_size)
+
+    @staticmethod
+    def key(prompt_name: str, summaries: list[str]) -> str:
+        return hashlib.sha256(json.dumps([prompt_name, sorted(summaries)]).encode()).hexdigest()
+
+
 async def get_community_clusters(
-    driver: GraphDriver, group_ids: list[str] | None
+    driver: GraphDriver,
+    group_ids: list[str] | None,
+    method: CommunityDetectionMethod = CommunityDetectionMethod.label_propagation,
 ) -> list[list[EntityNode]]:
     community_clusters: list[list[EntityNode]] = []
 
@@ -70,7 +109,7 @@ async def get_community_clusters(
                 Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
             ]
 
-        cluster_uuids = label_propagation(projection)
+        cluster_uuids = detect_communities(projection, method)
 
         community_clusters.extend(
             list(
@@ -83,52 +122,170 @@ async def get_community_clusters(
     return community_clusters
 
 
-def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
+def detect_communities(
+    projection: dict[str, list[Neighbor]],
+    method: CommunityDetectionMethod = CommunityDetectionMethod.label_propagation,
+) -> list[list[str]]:
+    if method == CommunityDetectionMethod.label_propagation:
+        return label_propagation(projection)
+
+    return modularity_communities(projection, method)
+
+
+def build_csr_adjacency(
+    projection: dict[str, list[Neighbor]],
+) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert a neighbor projection into CSR arrays.
+
+    Returns the node uuids in index order along with the indptr, indices and weights arrays.
+    Neighbors that are not part of the projection are dropped.
+    """
+    uuids = list(projection.keys())
+    index_map = {uuid: i for i, uuid in enumerate(uuids)}
+
+    indptr = np.zeros(len(uuids) + 1, dtype=np.int64)
+    indices: list[int] = []
+    weights: list[float] = []
+    for i, uuid in enumerate(uuids):
+        for neighbor in projection[uuid]:
+            neighbor_index = index_map.get(neighbor.node_uuid)
+            if neighbor_index is None:
+                continue
+            indices.append(neighbor_index)
+            weights.append(neighbor.edge_count)
+        indptr[i + 1] = len(indices)
+
+    return (
+        uuids,
+        indptr,
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+    )
+
+
+def label_propagation(
+    projection: dict[str, list[Neighbor]],
+    max_iterations: int = MAX_LABEL_PROPAGATION_ITERATIONS,
+    tolerance: float = LABEL_PROPAGATION_TOLERANCE,
+) -> list[list[str]]:
     # Implement the label propagation community detection algorithm.
     # 1. Start with each node being assigned its own community
     # 2. Each node will take on the community of the plurality of its neighbors
     # 3. Ties are broken by going to the largest community
-    # 4. Continue until no communities change during propagation
-
-    community_map = {uuid: i for i, uuid in enumerate(projection.keys())}
+    # 4. Continue until the fraction of nodes changing community is at most `tolerance`,
+    #    or until `max_iterations` rounds have run (synchronous updates can oscillate)
 
-    while True:
-        no_change = True
-        new_community_map: dict[str, int] = {}
+    uuids, indptr, indices, weights = build_csr_adjacency(projection)
+    labels = label_propagation_csr(indptr, indices, weights, max_iterations, tolerance)
 
-        for uuid, neighbors in projection.items():
-            curr_community = community_map[uuid]
+    community_cluster_map = defaultdict(list)
+    for uuid, community in zip(uuids, labels.tolist(), strict=True):
+        community_cluster_map[community].append(uuid)
 
-            community_candidates: dict[int, int] = defaultdict(int)
-            for neighbor in neighbors:
-                community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
-            community_lst = [
-                (count, community) for community, count in community_candidates.items()
-            ]
+    clusters = [cluster for cluster in community_cluster_map.values()]
+    return clusters
 
-            community_lst.sort(reverse=True)
-            candidate_rank, community_candidate = community_lst[0] if community_lst else (0, -1)
-            if community_candidate != -1 and candidate_rank > 1:
-                new_community = community_candidate
-            else:
-                new_community = max(community_candidate, curr_community)
 
-            new_community_map[uuid] = new_community
+def label_propagation_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    max_iterations: int = MAX_LABEL_PROPAGATION_ITERATIONS,
+    tolerance: float = LABEL_PROPAGATION_TOLERANCE,
+) -> np.ndarray:
+    """
+    Vectorized label propagation over a CSR adjacency.
 
-            if new_community != curr_community:
-                no_change = False
+    Each round tallies the weighted votes of every (node, neighbor community) pair at once
+    and picks the plurality community per node, breaking ties towards the larger community id.
+    Returns the community label of every node.
+    """
+    node_count = len(indptr) - 1
+    labels = np.arange(node_count, dtype=np.int64)
+    if node_count == 0 or len(indices) == 0:
+        return labels
+
+    rows = np.repeat(np.arange(node_count, dtype=np.int64), np.diff(indptr))
+
+    previous_labels = labels
+    changed = node_count
+    for _ in range(max_iterations):
+        # Sum the edge weights for each (node, neighbor community) pair
+        keys = rows * node_count + labels[indices]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        votes = np.bincount(inverse, weights=weights)
+        vote_rows = unique_keys // node_count
+        vote_labels = unique_keys % node_count
+
+        # Sort by row, then vote count, then community id; the last entry of a row wins
+        order = np.lexsort((vote_labels, votes, vote_rows))
+        sorted_rows = vote_rows[order]
+        is_last = np.append(sorted_rows[1:] != sorted_rows[:-1], True)
+        winners = order[is_last]
+
+        candidates = np.full(node_count, -1, dtype=np.int64)
+        candidate_votes = np.zeros(node_count, dtype=np.float64)
+        candidates[vote_rows[winners]] = vote_labels[winners]
+        candidate_votes[vote_rows[winners]] = votes[winners]
+
+        new_labels = np.where(candidate_votes > 1, candidates, np.maximum(candidates, labels))
+
+        changed = int(np.count_nonzero(new_labels != labels))
+        if changed <= tolerance * node_count:
+            labels = new_labels
+            break
 
-        if no_change:
+        # Synchronous updates can settle into a two-round cycle, which will never converge
+        if np.array_equal(new_labels, previous_labels):
+            logger.debug(f'Label propagation oscillating on {changed} of {node_count} nodes')
+            labels = np.maximum(labels, new_labels)
             break
 
-        community_map = new_community_map
+        previous_labels = labels
+        labels = new_labels
+    else:
+        logger.warning(
+            f'Label propagation did not converge after {max_iterations} iterations '
+            f'({changed} of {node_count} nodes still changing)'
+        )
+
+    return labels
+
+
+def modularity_communities(
+    projection: dict[str, list[Neighbor]], method: CommunityDetectionMethod
+) -> list[list[str]]:
+    try:
+        import igraph
+    except ImportError:
+        raise ImportError(
+            'igraph is required for Leiden and Louvain community detection. '
+            'Install it with: pip install graphiti-core[community]'
+        ) from None
+
+    uuids, indptr, indices, weights = build_csr_adjacency(projection)
+    rows = np.repeat(np.arange(len(uuids), dtype=np.int64), np.diff(indptr))
+
+    # The projection lists each undirected edge from both endpoints, keep one copy
+    upper = rows < indices
+    graph = igraph.Graph(
+        n=len(uuids),
+        edges=np.column_stack((rows[upper], indices[upper])).tolist(),
+        directed=False,
+    )
+    edge_weights = weights[upper].tolist()
+
+    if method == CommunityDetectionMethod.leiden:
+        partition = graph.community_leiden(objective_function='modularity', weights=edge_weights)
+    else:
+        partition = graph.community_multilevel(weights=edge_weights)
 
     community_cluster_map = defaultdict(list)
-    for uuid, community in community_map.items():
+    for uuid, community in zip(uuids, partition.membership, strict=True):
         community_cluster_map[community].append(uuid)
 
-    clusters = [cluster for cluster in community_cluster_map.values()]
-    return clusters
+    return [cluster for cluster in community_cluster_map.values()]
 
 
 async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -> str:
@@ -164,33 +321,147 @@ async def generate_summary_description(llm_client: LLMClient, summary: str) -> s
     return description
 
 
-async def build_community(
-    llm_client: LLMClient, community_cluster: list[EntityNode]
-) -> tuple[CommunityNode, list[CommunityEdge]]:
-    summaries = [entity.summary for entity in community_cluster]
-    length = len(summaries)
-    while length > 1:
-        odd_one_out: str | None = None
-        if length % 2 == 1:
-            odd_one_out = summaries.pop()
-            length -= 1
-        new_summaries: list[str] = list(
-            await semaphore_gather(
-                *[
-                    summarize_pair(llm_client, (str(left_summary), str(right_summary)))
-                    for left_summary, right_summary in zip(
-                        summaries[: int(length / 2)], summaries[int(length / 2) :], strict=False
-                    )
-                ]
-            )
+def _summary_digest(summary: str) -> int:
+    return int(hashlib.md5(summary.encode()).hexdigest()[:8], 16)
+
+
+def chunk_summaries(
+    summaries: list[str],
+    max_fan_in: int = MAX_SUMMARY_FAN_IN,
+    token_budget: int = SUMMARY_TOKEN_BUDGET,
+) -> list[list[str]]:
+    """
+    Pack summaries into groups of at most max_fan_in summaries and token_budget tokens.
+
+    Group boundaries are derived from the summary contents rather than their position, so adding or
+    removing a member only changes the group it falls in and the other groups keep their cache keys.
+    Every group takes at least two summaries so that each reduction round makes progress.
+    """
+    if max_fan_in < 2:
+        raise ValueError(f'max_fan_in must be at least 2, got {max_fan_in}')
+
+    ordered = sorted(summaries, key=lambda summary: (_summary_digest(summary), summary))
+
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for summary in ordered:
+        tokens = estimate_tokens(summary)
+        if len(current) >= 2 and (
+            len(current) >= max_fan_in or current_tokens + tokens > token_budget
+        ):
+            chunks.append(current)
+            current, current_tokens = [], 0
+
+        current.append(summary)
+        current_tokens += tokens
+
+        if len(current) >= 2 and _summary_digest(summary) % max_fan_in == 0:
+            chunks.append(current)
+            current, current_tokens = [], 0
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+async def summarize_many(
+    llm_client: LLMClient, summaries: list[str], cache: SummaryCache | None = None
+) -> str:
+    if len(summaries) == 1:
+        return summaries[0]
+
+    cache_key = SummaryCache.key('summarize_nodes.summarize_many', summaries)
+    if cache is not None and (cached := cache.get(cache_key)) is not None:
+        return cached['summary']
+
+    context = {
+        'node_summaries': [{'summary': summary} for summary in summaries],
+    }
+
+    llm_response = await llm_client.generate_response(
+        prompt_library.summarize_nodes.summarize_many(context),
+        response_model=Summary,
+        prompt_name='summarize_nodes.summarize_many',
+    )
+
+    summary = llm_response.get('summary', '')
+
+    if cache is not None:
+        cache.set(cache_key, {'summary': summary})
+
+    return summary
+
+
+async def summarize_many_with_description(
+    llm_client: LLMClient, summaries: list[str], cache: SummaryCache | None = None
+) -> tuple[str, str]:
+    cache_key = SummaryCache.key('summarize_nodes.summarize_many_with_description', summaries)
+    if cache is not None and (cached := cache.get(cache_key)) is not None:
+        return cached['summary'], cached['description']
+
+    if len(summaries) == 1:
+        summary = summaries[0]
+        description = await generate_summary_description(llm_client, summary)
+    else:
+        context = {
+            'node_summaries': [{'summary': summary} for summary in summaries],
+        }
+
+        llm_response = await llm_client.generate_response(
+            prompt_library.summarize_nodes.summarize_many_with_description(context),
+            response_model=SummaryWithDescription,
+            prompt_name='summarize_nodes.summarize_many_with_description',
         )
-        if odd_one_out is not None:
-            new_summaries.append(odd_one_out)
-        summaries = new_summaries
-        length = len(summaries)
 
-    summary = summaries[0]
-    name = await generate_summary_description(llm_client, summary)
+        summary = llm_response.get('summary', '')
+        description = llm_response.get('description', '')
+
+    if cache is not None:
+        cache.set(cache_key, {'summary': summary, 'description': description})
+
+    return summary, description
+
+
+async def summarize_summaries(
+    llm_client: LLMClient,
+    summaries: list[str],
+    max_fan_in: int = MAX_SUMMARY_FAN_IN,
+    token_budget: int = SUMMARY_TOKEN_BUDGET,
+    cache: SummaryCache | None = None,
+) -> tuple[str, str]:
+    """
+    Map-reduce a list of summaries into a single summary and a one sentence description.
+
+    Each LLM call combines up to max_fan_in summaries that fit within token_budget, so an n member
+    community needs roughly n / k calls over log_k(n) sequential rounds. The description is produced
+    by the final reduction call instead of a separate request.
+    """
+    chunks = chunk_summaries([str(summary) for summary in summaries], max_fan_in, token_budget)
+    while len(chunks) > 1:
+        reduced: list[str] = list(
+            await semaphore_gather(*[summarize_many(llm_client, chunk, cache) for chunk in chunks])
+        )
+        chunks = chunk_summaries(reduced, max_fan_in, token_budget)
+
+    return await summarize_many_with_description(llm_client, chunks[0] if chunks else [''], cache)
+
+
+async def build_community(
+    llm_client: LLMClient,
+    community_cluster: list[EntityNode],
+    max_fan_in: int = MAX_SUMMARY_FAN_IN,
+    token_budget: int = SUMMARY_TOKEN_BUDGET,
+    summary_cache: SummaryCache | None = None,
+) -> tuple[CommunityNode, list[CommunityEdge]]:
+    summary, name = await summarize_summaries(
+        llm_client,
+        [entity.summary for entity in community_cluster],
+        max_fan_in,
+        token_budget,
+        summary_cache,
+    )
     now = utc_now()
     community_node = CommunityNode(
         name=name,
@@ -210,14 +481,20 @@ async def build_communities(
     driver: GraphDriver,
     llm_client: LLMClient,
     group_ids: list[str] | None,
+    method: CommunityDetectionMethod = CommunityDetectionMethod.label_propagation,
+    max_fan_in: int = MAX_SUMMARY_FAN_IN,
+    token_budget: int = SUMMARY_TOKEN_BUDGET,
+    summary_cache: SummaryCache | None = None,
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
-    community_clusters = await get_community_clusters(driver, group_ids)
+    community_clusters = await get_community_clusters(driver, group_ids, method)
 
     semaphore = asyncio.Semaphore(MAX_COMMUNITY_BUILD_CONCURRENCY)
 
     async def limited_build_community(cluster):
         async with semaphore:
-            return await build_community(llm_client, cluster)
+            return await build_community(
+                llm_client, cluster, max_fan_in, token_budget, summary_cache
+            )
 
     communities: list[tuple[CommunityNode, list[CommunityEdge]]] = list(
         await semaphore_gather(
@@ -312,8 +589,9 @@ async def update_community(
     if community is None:
         return [], []
 
-    new_summary = await summarize_pair(llm_client, (entity.summary, community.summary))
-    new_name = await generate_summary_description(llm_client, new_summary)
+    new_summary, new_name = await summarize_many_with_description(
+        llm_client, [entity.summary, community.summary]
+    )
 
     community.summary = new_summary
     community.name = new_name
@@ -17,6 +17,7 @@ limitations under the License.
 import logging
 from datetime import datetime
 from time import time
+from typing import Any
 
 from pydantic import BaseModel
 from typing_extensions import LiteralString
@@ -34,12 +35,13 @@ from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.dedupe_edges import EdgeDuplicate
+from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, EdgeResolution, EdgeResolutions
 from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
 from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.context_utils import PreviousEpisodeContext
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
 from graphiti_core.utils.maintenance.dedup_helpers import _normalize_string_exact
 
@@ -120,6 +122,9 @@ async def extract_edges(
         else []
     )
 
+    # Compressed once and shared by the extraction and reflexion prompts
+    episode_context = PreviousEpisodeContext(previous_episodes)
+
     # Prepare context for LLM
     context = {
         'episode_content': episode.content,
@@ -127,7 +132,6 @@ async def extract_edges(
             {'id': idx, 'name': node.name, 'entity_types': node.labels}
             for idx, node in enumerate(nodes)
         ],
-        'previous_episodes': [ep.content for ep in previous_episodes],
         'reference_time': episode.valid_at,
         'edge_types': edge_types_context,
         'custom_prompt': custom_prompt,
@@ -138,6 +142,7 @@ async def extract_edges(
     facts_missed = True
     reflexion_iterations = 0
     while facts_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
+        context['previous_episodes'] = episode_context.for_prompt('extract_edges.edge')
         llm_response = await llm_client.generate_response(
             prompt_library.extract_edges.edge(context),
             response_model=ExtractedEdges,
@@ -151,6 +156,7 @@ async def extract_edges(
 
         reflexion_iterations += 1
         if reflexion_iterations < MAX_REFLEXION_ITERATIONS:
+            context['previous_episodes'] = episode_context.for_prompt('extract_edges.reflexion')
             reflexion_response = await llm_client.generate_response(
                 prompt_library.extract_edges.reflexion(context),
                 response_model=MissingFacts,
@@ -248,7 +254,14 @@ async def resolve_extracted_edges(
     entities: list[EntityNode],
     edge_types: dict[str, type[BaseModel]],
     edge_type_map: dict[tuple[str, str], list[str]],
+    batch_size: int | None = None,
 ) -> tuple[list[EntityEdge], list[EntityEdge]]:
+    """
+    Resolve extracted edges against the graph, returning resolved and invalidated edges.
+
+    With batch_size set, duplicate and contradiction decisions are made for batch_size edges
+    per LLM call instead of one call per edge.
+    """
     # Fast path: deduplicate exact matches within the extracted edges before parallel processing
     seen: dict[tuple[str, str, str], EntityEdge] = {}
     deduplicated_edges: list[EntityEdge] = []
@@ -364,28 +377,41 @@ async def resolve_extracted_edges(
             extracted_edge.name = DEFAULT_EDGE_NAME
 
     # resolve edges with related edges in the graph and find invalidation candidates
-    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = list(
-        await semaphore_gather(
-            *[
-                resolve_extracted_edge(
-                    llm_client,
-                    extracted_edge,
-                    related_edges,
-                    existing_edges,
-                    episode,
-                    extracted_edge_types,
-                    custom_type_names,
-                )
-                for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
-                    extracted_edges,
-                    related_edges_lists,
-                    edge_invalidation_candidates,
-                    edge_types_lst,
-                    strict=True,
-                )
-            ]
+    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]
+    if batch_size is not None:
+        results = await resolve_extracted_edges_batch(
+            llm_client,
+            extracted_edges,
+            related_edges_lists,
+            edge_invalidation_candidates,
+            [episode] * len(extracted_edges),
+            edge_types_lst,
+            custom_type_names,
+            batch_size,
+        )
+    else:
+        results = list(
+            await semaphore_gather(
+                *[
+                    resolve_extracted_edge(
+                        llm_client,
+                        extracted_edge,
+                        related_edges,
+                        existing_edges,
+                        episode,
+                        extracted_edge_types,
+                        custom_type_names,
+                    )
+                    for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
+                        extracted_edges,
+                        related_edges_lists,
+                        edge_invalidation_candidates,
+                        edge_types_lst,
+                        strict=True,
+                    )
+                ]
+            )
         )
-    )
 
     resolved_edges: list[EntityEdge] = []
     invalidated_edges: list[EntityEdge] = []
@@ -479,6 +505,203 @@ async def resolve_extracted_edge(
     tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]
         The resolved edge, any duplicates, and edges to invalidate.
     """
+    resolution = _resolve_edge_without_llm(extracted_edge, related_edges, existing_edges, episode)
+    if resolution is not None:
+        return resolution
+
+    start = time()
+
+    # Prepare context for LLM
+    context = {
+        'existing_edges': _facts_context(related_edges),
+        'new_edge': extracted_edge.fact,
+        'edge_invalidation_candidates': _facts_context(existing_edges),
+        'edge_types': _edge_types_context(edge_type_candidates),
+    }
+
+    if related_edges or existing_edges:
+        logger.debug(
+            'Resolving edge: sent %d EXISTING FACTS%s and %d INVALIDATION CANDIDATES%s',
+            len(related_edges),
+            f' (idx 0-{len(related_edges) - 1})' if related_edges else '',
+            len(existing_edges),
+            f' (idx 0-{len(existing_edges) - 1})' if existing_edges else '',
+        )
+
+    llm_response = await llm_client.generate_response(
+        prompt_library.dedupe_edges.resolve_edge(context),
+        response_model=EdgeDuplicate,
+        model_size=ModelSize.small,
+        prompt_name='dedupe_edges.resolve_edge',
+    )
+    response_object = EdgeDuplicate(**llm_response)
+
+    resolution = await _apply_edge_resolution(
+        llm_client,
+        response_object,
+        extracted_edge,
+        related_edges,
+        existing_edges,
+        episode,
+        edge_type_candidates,
+        custom_edge_type_names,
+    )
+
+    end = time()
+    logger.debug(
+        f'Resolved Edge: {extracted_edge.name} is {resolution[0].name}, in {(end - start) * 1000} ms'
+    )
+
+    return resolution
+
+
+async def resolve_extracted_edges_batch(
+    llm_client: LLMClient,
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    existing_edges_lists: list[list[EntityEdge]],
+    episodes: list[EpisodicNode],
+    edge_type_candidates_lst: list[dict[str, type[BaseModel]]],
+    custom_edge_type_names: set[str] | None = None,
+    batch_size: int = 10,
+) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+    """Resolve many extracted edges with one LLM call per batch_size edges.
+
+    The arguments are parallel lists with one entry per extracted edge, as in
+    `resolve_extracted_edge`. Edges that need no LLM call are resolved without one. Edges
+    missing from a batched response, or whose batched call fails, are resolved one by one.
+
+    Returns
+    -------
+    list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]
+        The resolved edge, edges to invalidate and duplicates for each extracted edge, in order.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+
+    resolutions: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]] | None] = [
+        _resolve_edge_without_llm(extracted_edge, related_edges, existing_edges, episode)
+        for extracted_edge, related_edges, existing_edges, episode in zip(
+            extracted_edges, related_edges_lists, existing_edges_lists, episodes, strict=True
+        )
+    ]
+
+    pending = [i for i, resolution in enumerate(resolutions) if resolution is None]
+    batch_results: list[
+        dict[int, tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]
+    ] = await semaphore_gather(
+        *[
+            _resolve_edge_batch(
+                llm_client,
+                pending[i : i + batch_size],
+                extracted_edges,
+                related_edges_lists,
+                existing_edges_lists,
+                episodes,
+                edge_type_candidates_lst,
+                custom_edge_type_names,
+            )
+            for i in range(0, len(pending), batch_size)
+        ]
+    )
+    for batch_result in batch_results:
+        for i, resolution in batch_result.items():
+            resolutions[i] = resolution
+
+    return [resolution for resolution in resolutions if resolution is not None]
+
+
+async def _resolve_edge_batch(
+    llm_client: LLMClient,
+    indices: list[int],
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    existing_edges_lists: list[list[EntityEdge]],
+    episodes: list[EpisodicNode],
+    edge_type_candidates_lst: list[dict[str, type[BaseModel]]],
+    custom_edge_type_names: set[str] | None,
+) -> dict[int, tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+    start = time()
+
+    # Fact type descriptions are sent once per batch; each edge lists the names it may use
+    edge_types: dict[str, type[BaseModel]] = {}
+    for i in indices:
+        edge_types.update(edge_type_candidates_lst[i])
+
+    context = {
+        'edge_types': _edge_types_context(edge_types),
+        'new_edges': [
+            {
+                'id': batch_id,
+                'fact': extracted_edges[i].fact,
+                'fact_types': list(edge_type_candidates_lst[i]),
+                'existing_facts': _facts_context(related_edges_lists[i]),
+                'invalidation_candidates': _facts_context(existing_edges_lists[i]),
+            }
+            for batch_id, i in enumerate(indices)
+        ],
+    }
+
+    edge_resolutions: dict[int, EdgeResolution] = {}
+    try:
+        llm_response = await llm_client.generate_response(
+            prompt_library.dedupe_edges.resolve_edge_batch(context),
+            response_model=EdgeResolutions,
+            model_size=ModelSize.small,
+            prompt_name='dedupe_edges.resolve_edge_batch',
+        )
+        for edge_resolution in EdgeResolutions(**llm_response).edge_resolutions:
+            if 0 <= edge_resolution.id < len(indices):
+                edge_resolutions.setdefault(edge_resolution.id, edge_resolution)
+    except Exception as e:
+        logger.warning(f'Batched edge resolution failed, resolving edges one by one: {e}')
+    else:
+        if len(edge_resolutions) < len(indices):
+            logger.warning(
+                'Batched edge resolution returned %d of %d edges, resolving the rest one by one',
+                len(edge_resolutions),
+                len(indices),
+            )
+
+    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = await semaphore_gather(
+        *[
+            _apply_edge_resolution(
+                llm_client,
+                edge_resolutions[batch_id],
+                extracted_edges[i],
+                related_edges_lists[i],
+                existing_edges_lists[i],
+                episodes[i],
+                edge_type_candidates_lst[i],
+                custom_edge_type_names,
+            )
+            if batch_id in edge_resolutions
+            else resolve_extracted_edge(
+                llm_client,
+                extracted_edges[i],
+                related_edges_lists[i],
+                existing_edges_lists[i],
+                episodes[i],
+                edge_type_candidates_lst[i],
+                custom_edge_type_names,
+            )
+            for batch_id, i in enumerate(indices)
+        ]
+    )
+
+    end = time()
+    logger.debug(f'Resolved {len(indices)} edges in one batch, in {(end - start) * 1000} ms')
+
+    return dict(zip(indices, results, strict=True))
+
+
+def _resolve_edge_without_llm(
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]] | None:
+    """Resolve an edge that needs no LLM call, or return None if it does."""
     if len(related_edges) == 0 and len(existing_edges) == 0:
         return extracted_edge, [], []
 
@@ -495,16 +718,17 @@ async def resolve_extracted_edge(
                 resolved.episodes.append(episode.uuid)
             return resolved, [], []
 
-    start = time()
+    return None
 
-    # Prepare context for LLM
-    related_edges_context = [{'idx': i, 'fact': edge.fact} for i, edge in enumerate(related_edges)]
 
-    invalidation_edge_candidates_context = [
-        {'idx': i, 'fact': existing_edge.fact} for i, existing_edge in enumerate(existing_edges)
-    ]
+def _facts_context(edges: list[EntityEdge]) -> list[dict[str, Any]]:
+    return [{'idx': i, 'fact': edge.fact} for i, edge in enumerate(edges)]
 
-    edge_types_context = (
+
+def _edge_types_context(
+    edge_type_candidates: dict[str, type[BaseModel]] | None,
+) -> list[dict[str, Any]]:
+    return (
         [
             {
                 'fact_type_name': type_name,
@@ -516,29 +740,18 @@ async def resolve_extracted_edge(
         else []
     )
 
-    context = {
-        'existing_edges': related_edges_context,
-        'new_edge': extracted_edge.fact,
-        'edge_invalidation_candidates': invalidation_edge_candidates_context,
-        'edge_types': edge_types_context,
-    }
-
-    if related_edges or existing_edges:
-        logger.debug(
-            'Resolving edge: sent %d EXISTING FACTS%s and %d INVALIDATION CANDIDATES%s',
-            len(related_edges),
-            f' (idx 0-{len(related_edges) - 1})' if related_edges else '',
-            len(existing_edges),
-            f' (idx 0-{len(existing_edges) - 1})' if existing_edges else '',
-        )
 
-    llm_response = await llm_client.generate_response(
-        prompt_library.dedupe_edges.resolve_edge(context),
-        response_model=EdgeDuplicate,
-        model_size=ModelSize.small,
-        prompt_name='dedupe_edges.resolve_edge',
-    )
-    response_object = EdgeDuplicate(**llm_response)
+async def _apply_edge_resolution(
+    llm_client: LLMClient,
+    response_object: EdgeDuplicate,
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+    edge_type_candidates: dict[str, type[BaseModel]] | None = None,
+    custom_edge_type_names: set[str] | None = None,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
+    """Apply the LLM's duplicate, contradiction and fact type decisions to an extracted edge."""
     duplicate_facts = response_object.duplicate_facts
 
     # Validate duplicate_facts are in valid range for EXISTING FACTS
@@ -615,11 +828,6 @@ async def resolve_extracted_edge(
         resolved_edge.name = fact_type
         resolved_edge.attributes = {}
 
-    end = time()
-    logger.debug(
-        f'Resolved Edge: {extracted_edge.name} is {resolved_edge.name}, in {(end - start) * 1000} ms'
-    )
-
     now = utc_now()
 
     if resolved_edge.invalid_at and not resolved_edge.expired_at:
@@ -118,3 +118,104 @@ async def retrieve_episodes(
 
     episodes = [get_episodic_node_from_record(record) for record in result]
     return list(reversed(episodes))  # Return in chronological order
+
+
+async def retrieve_episodes_between(
+    driver: GraphDriver,
+    start_time: datetime,
+    end_time: datetime,
+    group_ids: list[str] | None = None,
+) -> list[EpisodicNode]:
+    """
+    Retrieve every episodic node with a valid_at between start_time and end_time (inclusive).
+
+    Returns the episodes in chronological order.
+    """
+    query_params: dict = {}
+    query_filter = ''
+    if group_ids and len(group_ids) > 0:
+        query_filter += '\nAND e.group_id IN $group_ids'
+        query_params['group_ids'] = group_ids
+
+    query: LiteralString = (
+        """
+        MATCH (e:Episodic)
+        WHERE e.valid_at >= $start_time AND e.valid_at <= $end_time
+        """
+        + query_filter
+        + """
+        RETURN
+        """
+        + (
+            EPISODIC_NODE_RETURN_NEPTUNE
+            if driver.provider == GraphProvider.NEPTUNE
+            else EPISODIC_NODE_RETURN
+        )
+        + """
+        ORDER BY e.valid_at ASC
+        """
+    )
+    result, _, _ = await driver.execute_query(
+        query,
+        start_time=start_time,
+        end_time=end_time,
+        routing_='r',
+        **query_params,
+    )
+
+    return [get_episodic_node_from_record(record) for record in result]
+
+
+async def get_episode_removal_targets(
+    driver: GraphDriver, episodes: list[EpisodicNode]
+) -> tuple[list[str], list[str]]:
+    """
+    Find the data that should be deleted along with a set of episodes in a single query.
+
+    Returns the uuids of entity nodes that are only mentioned by the given episodes, and the uuids of
+    entity edges that were created by one of the given episodes.
+    """
+    episode_uuids = [episode.uuid for episode in episodes]
+    edge_uuids = list({edge_uuid for episode in episodes for edge_uuid in episode.entity_edges})
+
+    edge_match: LiteralString = (
+        'OPTIONAL MATCH (:Entity)-[:RELATES_TO]->(r:RelatesToNode_)-[:RELATES_TO]->(:Entity)'
+        if driver.provider == GraphProvider.KUZU
+        else 'OPTIONAL MATCH (:Entity)-[r:RELATES_TO]->(:Entity)'
+    )
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (e:Episodic)-[:MENTIONS]->(n:Entity)
+        WHERE e.uuid IN $episode_uuids
+        WITH DISTINCT n
+        OPTIONAL MATCH (other:Episodic)-[:MENTIONS]->(n)
+        WHERE NOT other.uuid IN $episode_uuids
+        WITH n, count(other) AS other_mentions
+        WHERE other_mentions = 0
+        WITH collect(n.uuid) AS node_uuids
+        """
+        + edge_match
+        + """
+        WHERE r.uuid IN $edge_uuids
+        RETURN node_uuids, r.uuid AS edge_uuid, r.episodes AS edge_episodes
+        """,
+        episode_uuids=episode_uuids,
+        edge_uuids=edge_uuids,
+        routing_='r',
+    )
+
+    if not records:
+        return [], []
+
+    # We should only delete edges created by one of the removed episodes
+    episode_uuid_set = set(episode_uuids)
+    edges_to_delete = [
+        record['edge_uuid']
+        for record in records
+        if record['edge_uuid'] is not None
+        and record['edge_episodes']
+        and record['edge_episodes'][0] in episode_uuid_set
+    ]
+
+    return list(records[0]['node_uuids'] or []), edges_to_delete
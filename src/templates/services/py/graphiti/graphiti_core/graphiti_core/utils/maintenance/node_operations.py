@@ -19,7 +19,7 @@ from collections.abc import Awaitable, Callable
 from time import time
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, create_model
 
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
@@ -43,6 +43,7 @@ from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.context_utils import PreviousEpisodeContext
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupCandidateIndexes,
@@ -66,11 +67,15 @@ async def extract_nodes_reflexion(
     previous_episodes: list[EpisodicNode],
     node_names: list[str],
     group_id: str | None = None,
+    episode_context: PreviousEpisodeContext | None = None,
 ) -> list[str]:
+    if episode_context is None:
+        episode_context = PreviousEpisodeContext(previous_episodes)
+
     # Prepare context for LLM
     context = {
         'episode_content': episode.content,
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': episode_context.for_prompt('extract_nodes.reflexion'),
         'extracted_entities': node_names,
     }
 
@@ -121,10 +126,12 @@ async def extract_nodes(
         else []
     )
 
+    # Compressed once and shared by the extraction and reflexion prompts
+    episode_context = PreviousEpisodeContext(previous_episodes)
+
     context = {
         'episode_content': episode.content,
         'episode_timestamp': episode.valid_at.isoformat(),
-        'previous_episodes': [ep.content for ep in previous_episodes],
         'custom_prompt': custom_prompt + reflexion_prompt,
         'entity_types': entity_types_context,
         'source_description': episode.source_description,
@@ -132,6 +139,9 @@ async def extract_nodes(
 
     while entities_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
         if episode.source == EpisodeType.message:
+            context['previous_episodes'] = episode_context.for_prompt(
+                'extract_nodes.extract_message'
+            )
             llm_response = await llm_client.generate_response(
                 prompt_library.extract_nodes.extract_message(context),
                 response_model=ExtractedEntities,
@@ -139,6 +149,7 @@ async def extract_nodes(
                 prompt_name='extract_nodes.extract_message',
             )
         elif episode.source == EpisodeType.text:
+            context['previous_episodes'] = episode_context.for_prompt('extract_nodes.extract_text')
             llm_response = await llm_client.generate_response(
                 prompt_library.extract_nodes.extract_text(context),
                 response_model=ExtractedEntities,
@@ -146,6 +157,7 @@ async def extract_nodes(
                 prompt_name='extract_nodes.extract_text',
             )
         elif episode.source == EpisodeType.json:
+            context['previous_episodes'] = episode_context.for_prompt('extract_nodes.extract_json')
             llm_response = await llm_client.generate_response(
                 prompt_library.extract_nodes.extract_json(context),
                 response_model=ExtractedEntities,
@@ -165,6 +177,7 @@ async def extract_nodes(
                 previous_episodes,
                 [entity.name for entity in extracted_entities],
                 episode.group_id,
+                episode_context,
             )
 
             entities_missed = len(missing_entities) != 0
@@ -317,8 +330,8 @@ async def _resolve_with_llm(
         'extracted_nodes': extracted_nodes_context,
         'existing_nodes': existing_nodes_context,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': (
-            [ep.content for ep in previous_episodes] if previous_episodes is not None else []
+        'previous_episodes': PreviousEpisodeContext(previous_episodes).for_prompt(
+            'dedupe_nodes.nodes'
         ),
     }
 
@@ -460,32 +473,205 @@ async def extract_attributes_from_nodes(
     previous_episodes: list[EpisodicNode] | None = None,
     entity_types: dict[str, type[BaseModel]] | None = None,
     should_summarize_node: NodeSummaryFilter | None = None,
+    batch_size: int | None = None,
 ) -> list[EntityNode]:
+    """
+    Extract attributes and summaries for nodes.
+
+    By default each node gets its own attribute and summary prompts. With batch_size set, nodes are
+    grouped batch_size at a time into one structured call, and nodes whose part of the batch
+    response is missing or invalid fall back to the per-node prompts.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+
     llm_client = clients.llm_client
     embedder = clients.embedder
-    updated_nodes: list[EntityNode] = await semaphore_gather(
-        *[
-            extract_attributes_from_node(
-                llm_client,
-                node,
-                episode,
-                previous_episodes,
-                (
-                    entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
-                    if entity_types is not None
-                    else None
-                ),
-                should_summarize_node,
-            )
-            for node in nodes
-        ]
-    )
+    # Compressed once per episode and shared by every per-node prompt
+    episode_context = PreviousEpisodeContext(previous_episodes)
+    node_entity_types = [
+        (
+            entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
+            if entity_types is not None
+            else None
+        )
+        for node in nodes
+    ]
+
+    if batch_size is None:
+        updated_nodes: list[EntityNode] = await semaphore_gather(
+            *[
+                extract_attributes_from_node(
+                    llm_client,
+                    node,
+                    episode,
+                    previous_episodes,
+                    entity_type,
+                    should_summarize_node,
+                    episode_context,
+                )
+                for node, entity_type in zip(nodes, node_entity_types, strict=True)
+            ]
+        )
+    else:
+        batches: list[list[EntityNode]] = await semaphore_gather(
+            *[
+                _extract_attributes_batch(
+                    llm_client,
+                    nodes[i : i + batch_size],
+                    episode,
+                    episode_context,
+                    node_entity_types[i : i + batch_size],
+                    should_summarize_node,
+                )
+                for i in range(0, len(nodes), batch_size)
+            ]
+        )
+        updated_nodes = [node for batch in batches for node in batch]
 
     await create_entity_node_embeddings(embedder, updated_nodes)
 
     return updated_nodes
 
 
+def _build_attributes_batch_model(
+    node_keys: list[str],
+    entity_types: list[type[BaseModel] | None],
+    summarize: list[bool],
+) -> type[BaseModel]:
+    """Build a response model with one field per node, each shaped by that node's entity type."""
+    fields: dict[str, Any] = {}
+    for node_key, entity_type, should_summarize in zip(
+        node_keys, entity_types, summarize, strict=True
+    ):
+        node_fields: dict[str, Any] = {}
+        if should_summarize:
+            node_fields['summary'] = (str, EntitySummary.model_fields['summary'])
+        if entity_type is not None:
+            node_fields.update(
+                {
+                    name: (field.annotation, field)
+                    for name, field in entity_type.model_fields.items()
+                }
+            )
+
+        fields[node_key] = (
+            create_model(
+                f'EntityAttributes_{node_key}',
+                __doc__=entity_type.__doc__ if entity_type is not None else None,
+                **node_fields,
+            ),
+            ...,
+        )
+
+    return create_model('EntityAttributesBatch', **fields)
+
+
+async def _extract_attributes_batch(
+    llm_client: LLMClient,
+    nodes: list[EntityNode],
+    episode: EpisodicNode | None,
+    episode_context: PreviousEpisodeContext,
+    entity_types: list[type[BaseModel] | None],
+    should_summarize_node: NodeSummaryFilter | None,
+) -> list[EntityNode]:
+    summarize: list[bool] = [True] * len(nodes)
+    if should_summarize_node is not None:
+        summary_filter = should_summarize_node
+
+        async def _should_summarize(node: EntityNode) -> bool:
+            return await summary_filter(node)
+
+        summarize = await semaphore_gather(*[_should_summarize(node) for node in nodes])
+
+    # Nodes with no attributes to extract and no summary to write need no LLM call
+    batch_indices = [
+        i
+        for i, entity_type in enumerate(entity_types)
+        if summarize[i] or (entity_type is not None and len(entity_type.model_fields) != 0)
+    ]
+    if not batch_indices:
+        return nodes
+
+    node_keys = [f'node_{i}' for i in batch_indices]
+    response_model = _build_attributes_batch_model(
+        node_keys,
+        [entity_types[i] for i in batch_indices],
+        [summarize[i] for i in batch_indices],
+    )
+
+    context = {
+        'nodes': [
+            {
+                'id': node_key,
+                'name': nodes[i].name,
+                'summary': truncate_at_sentence(nodes[i].summary, MAX_SUMMARY_CHARS),
+                'entity_types': nodes[i].labels,
+                'attributes': nodes[i].attributes,
+            }
+            for node_key, i in zip(node_keys, batch_indices, strict=True)
+        ],
+        'episode_content': episode.content if episode is not None else '',
+        'previous_episodes': episode_context.for_prompt('extract_nodes.extract_attributes_batch'),
+    }
+
+    try:
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_nodes.extract_attributes_batch(context),
+            response_model=response_model,
+            model_size=ModelSize.small,
+            group_id=nodes[0].group_id,
+            prompt_name='extract_nodes.extract_attributes_batch',
+        )
+    except Exception as e:
+        logger.warning(f'Batched attribute extraction failed, falling back to per-node: {e}')
+        llm_response = {}
+
+    fallback_indices: list[int] = []
+    for node_key, i in zip(node_keys, batch_indices, strict=True):
+        node = nodes[i]
+        entity_type = entity_types[i]
+        node_response = llm_response.get(node_key)
+        try:
+            if not isinstance(node_response, dict):
+                raise ValueError(f'missing response for {node_key}')
+
+            attributes = {key: value for key, value in node_response.items() if key != 'summary'}
+            if entity_type is not None and len(entity_type.model_fields) != 0:
+                # validate response
+                entity_type(**attributes)
+
+            summary = node_response.get('summary') if summarize[i] else None
+            if summarize[i] and not isinstance(summary, str):
+                raise ValueError(f'missing summary for {node_key}')
+        except (ValidationError, ValueError, TypeError) as e:
+            logger.debug(f'Falling back to per-node attribute extraction for {node.name}: {e}')
+            fallback_indices.append(i)
+            continue
+
+        node.attributes.update(attributes)
+        if summary is not None:
+            node.summary = truncate_at_sentence(summary, MAX_SUMMARY_CHARS)
+
+    if fallback_indices:
+        await semaphore_gather(
+            *[
+                extract_attributes_from_node(
+                    llm_client,
+                    nodes[i],
+                    episode,
+                    None,
+                    entity_types[i],
+                    should_summarize_node,
+                    episode_context,
+                )
+                for i in fallback_indices
+            ]
+        )
+
+    return nodes
+
+
 async def extract_attributes_from_node(
     llm_client: LLMClient,
     node: EntityNode,
@@ -493,16 +679,18 @@ async def extract_attributes_from_node(
     previous_episodes: list[EpisodicNode] | None = None,
     entity_type: type[BaseModel] | None = None,
     should_summarize_node: NodeSummaryFilter | None = None,
+    episode_context: PreviousEpisodeContext | None = None,
 ) -> EntityNode:
+    if episode_context is None:
+        episode_context = PreviousEpisodeContext(previous_episodes)
+
     # Extract attributes if entity type is defined and has attributes
     llm_response = await _extract_entity_attributes(
-        llm_client, node, episode, previous_episodes, entity_type
+        llm_client, node, episode, episode_context, entity_type
     )
 
     # Extract summary if needed
-    await _extract_entity_summary(
-        llm_client, node, episode, previous_episodes, should_summarize_node
-    )
+    await _extract_entity_summary(llm_client, node, episode, episode_context, should_summarize_node)
 
     node.attributes.update(llm_response)
 
@@ -513,7 +701,7 @@ async def _extract_entity_attributes(
     llm_client: LLMClient,
     node: EntityNode,
     episode: EpisodicNode | None,
-    previous_episodes: list[EpisodicNode] | None,
+    episode_context: PreviousEpisodeContext,
     entity_type: type[BaseModel] | None,
 ) -> dict[str, Any]:
     if entity_type is None or len(entity_type.model_fields) == 0:
@@ -527,7 +715,7 @@ async def _extract_entity_attributes(
             'attributes': node.attributes,
         },
         episode=episode,
-        previous_episodes=previous_episodes,
+        previous_episodes=episode_context.for_prompt('extract_nodes.extract_attributes'),
     )
 
     llm_response = await llm_client.generate_response(
@@ -548,7 +736,7 @@ async def _extract_entity_summary(
     llm_client: LLMClient,
     node: EntityNode,
     episode: EpisodicNode | None,
-    previous_episodes: list[EpisodicNode] | None,
+    episode_context: PreviousEpisodeContext,
     should_summarize_node: NodeSummaryFilter | None,
 ) -> None:
     if should_summarize_node is not None and not await should_summarize_node(node):
@@ -562,7 +750,7 @@ async def _extract_entity_summary(
             'attributes': node.attributes,
         },
         episode=episode,
-        previous_episodes=previous_episodes,
+        previous_episodes=episode_context.for_prompt('extract_nodes.extract_summary'),
     )
 
     summary_response = await llm_client.generate_response(
@@ -579,12 +767,10 @@ async def _extract_entity_summary(
 def _build_episode_context(
     node_data: dict[str, Any],
     episode: EpisodicNode | None,
-    previous_episodes: list[EpisodicNode] | None,
+    previous_episodes: list[str],
 ) -> dict[str, Any]:
     return {
         'node': node_data,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': (
-            [ep.content for ep in previous_episodes] if previous_episodes is not None else []
-        ),
+        'previous_episodes': previous_episodes,
     }
@@ -19,6 +19,14 @@ import re
 # Maximum length for entity/node summaries
 MAX_SUMMARY_CHARS = 500
 
+# Rough characters-per-token ratio used for prompt budgeting
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for budgeting prompt content without a tokenizer."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
 
 def truncate_at_sentence(text: str, max_chars: int) -> str:
     """
@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
+from graphiti_core.llm_client import LLMMetricsSnapshot, llm_metrics
 
 from graph_service.config import get_settings
 from graph_service.routers import ingest, retrieve, webhooks
@@ -28,3 +29,8 @@ app.include_router(webhooks.router, prefix='/webhooks', tags=['webhooks'])
 @app.get('/healthcheck')
 async def healthcheck():
     return JSONResponse(content={'status': 'healthy'}, status_code=200)
+
+
+@app.get('/metrics/llm')
+async def get_llm_metrics() -> LLMMetricsSnapshot:
+    return llm_metrics.snapshot()
@@ -98,4 +98,4 @@ async def clear_graph(
     graphiti: ZepGraphitiDep,
 ):
     await clear_data(graphiti.driver)
-    await graphiti.build_indices_and_constraints()
+    await graphiti.driver.ensure_schema(force=True)
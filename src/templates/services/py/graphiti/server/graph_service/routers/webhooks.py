@@ -42,6 +42,6 @@ async def user_created_webhook(
     # Graphiti clones the driver when group_id is provided
     # We use user_id as the partition/graph name
     user_graph = graphiti.driver.clone(database=user_id)
-    await user_graph.build_indices_and_constraints()
+    await user_graph.ensure_schema()
     
     return {"status": "success", "user_id": user_id}
@@ -4,9 +4,9 @@ from typing import Annotated
 from fastapi import Depends, HTTPException
 from graphiti_core import Graphiti  # type: ignore
 from graphiti_core.edges import EntityEdge  # type: ignore
-from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
+from graphiti_core.errors import EdgeNotFoundError, NodeNotFoundError
 from graphiti_core.llm_client import LLMClient  # type: ignore
-from graphiti_core.nodes import EntityNode, EpisodicNode  # type: ignore
+from graphiti_core.nodes import DeleteProgress, EntityNode, EpisodicNode, Node  # type: ignore
 from urllib.parse import urlparse
 
 from graphiti_core.driver.falkordb_driver import FalkorDriver
@@ -19,6 +19,8 @@ from graphiti_core.llm_client.config import LLMConfig
 
 logger = logging.getLogger(__name__)
 
+DELETE_GROUP_BATCH_SIZE = 10_000
+
 
 class ZepGraphiti(Graphiti):
     def __init__(
@@ -39,7 +41,11 @@ class ZepGraphiti(Graphiti):
             summary=summary,
         )
         await new_node.generate_name_embedding(self.embedder)
-        await new_node.save(self.driver)
+        await self.driver.ensure_schema()
+        try:
+            await new_node.save(self.driver)
+        finally:
+            self._invalidate_search_cache([group_id])
         return new_node
     async def get_entity_edge(self, uuid: str):
         try:
@@ -49,39 +55,51 @@ class ZepGraphiti(Graphiti):
             raise HTTPException(status_code=404, detail=e.message) from e
 
     async def delete_group(self, group_id: str):
-        try:
-            edges = await EntityEdge.get_by_group_ids(self.driver, [group_id])
-        except GroupsEdgesNotFoundError:
-            logger.warning(f'No edges found for group {group_id}')
-            edges = []
-
-        nodes = await EntityNode.get_by_group_ids(self.driver, [group_id])
-
-        episodes = await EpisodicNode.get_by_group_ids(self.driver, [group_id])
+        driver = self.driver.clone(database=group_id)
 
-        for edge in edges:
-            await edge.delete(self.driver)
-
-        for node in nodes:
-            await node.delete(self.driver)
+        def log_progress(progress: DeleteProgress):
+            logger.info(
+                f'Deleting group {group_id}: {progress.deleted} {progress.label} nodes '
+                f'removed in {progress.batches} batches'
+            )
 
-        for episode in episodes:
-            await episode.delete(self.driver)
+        try:
+            # Detach deleting the nodes removes their edges as well
+            deleted = await Node.delete_by_group_id(
+                driver, group_id, batch_size=DELETE_GROUP_BATCH_SIZE, progress_callback=log_progress
+            )
+        finally:
+            self._invalidate_group_caches([group_id])
+        logger.info(f'Deleted group {group_id} ({deleted} nodes)')
 
     async def delete_entity_edge(self, uuid: str):
         try:
             edge = await EntityEdge.get_by_uuid(self.driver, uuid)
-            await edge.delete(self.driver)
         except EdgeNotFoundError as e:
             raise HTTPException(status_code=404, detail=e.message) from e
 
+        try:
+            await edge.delete(self.driver)
+        finally:
+            self._invalidate_group_caches([edge.group_id])
+
     async def delete_episodic_node(self, uuid: str):
         try:
             episode = await EpisodicNode.get_by_uuid(self.driver, uuid)
-            await episode.delete(self.driver)
         except NodeNotFoundError as e:
             raise HTTPException(status_code=404, detail=e.message) from e
 
+        try:
+            await episode.delete(self.driver)
+        finally:
+            self._invalidate_group_caches([episode.group_id])
+
+    def _invalidate_group_caches(self, group_ids: list[str]):
+        self._invalidate_search_cache(group_ids)
+        if self.graph_snapshots is not None:
+            # Deletions are not applied incrementally, the groups are reloaded on next use
+            self.graph_snapshots.invalidate(group_ids)
+
 def create_llm_client(settings: Settings) -> LLMClient:
     llm_key = settings.openrouter_api_key or settings.openai_api_key
     llm_base_url = settings.openrouter_base_url or settings.openai_base_url
@@ -172,8 +190,8 @@ async def initialize_graphiti(settings: ZepEnvDep):
         )
     
     if not settings.disable_schema_init:
-        logger.info("Building indices and constraints...")
-        await client.build_indices_and_constraints()
+        logger.info("Ensuring indices and constraints...")
+        await client.driver.ensure_schema()
     else:
         logger.info("Skipping schema initialization (DISABLE_SCHEMA_INIT=true)")
 